@@ -0,0 +1,3 @@
+"""
+Benchmark suite for parser, renderer and formatter hot paths.
+"""
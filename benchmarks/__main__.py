@@ -0,0 +1,188 @@
+"""
+Benchmark suite CLI.
+
+Usage::
+
+    python -m benchmarks run -o baseline.json
+    python -m benchmarks run -o results.json -k process_service
+    python -m benchmarks compare baseline.json results.json -t 0.1
+    python -m benchmarks scale -o 600 1200 2400 4800
+"""
+import argparse
+import fnmatch
+import logging
+import math
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.cases import get_cases, get_scale_cases
+from benchmarks.runner import (
+    Comparison,
+    compare,
+    get_summary,
+    load_results,
+    measure,
+    save_results,
+)
+
+LOGGER_NAME = "benchmark"
+# Growth exponent over which time is considered super-linear to model size
+SUPER_LINEAR_EXPONENT = 1.2
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    """
+    Get Logger instance.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    stream_handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(message)s", datefmt="%H:%M:%S")
+    stream_handler.setFormatter(formatter)
+    stream_handler.setLevel(level)
+    logger.addHandler(stream_handler)
+    logger.setLevel(level)
+    return logger
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser("benchmarks", description="Builder benchmark suite.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Run benchmarks and save JSON results")
+    run_parser.add_argument("-r", "--repeat", type=int, default=3, help="Runs per case")
+    run_parser.add_argument("-w", "--warmup", type=int, default=1, help="Untimed runs per case")
+    run_parser.add_argument(
+        "-k", "--filter", dest="patterns", nargs="+", help="Run cases that match glob patterns"
+    )
+    run_parser.add_argument("-o", "--output", type=Path, help="Results JSON path")
+    compare_parser = subparsers.add_parser("compare", help="Flag regressions against baseline")
+    compare_parser.add_argument("baseline", type=Path, help="Baseline results JSON path")
+    compare_parser.add_argument("results", type=Path, help="Current results JSON path")
+    compare_parser.add_argument(
+        "-t", "--threshold", type=float, default=0.1, help="Allowed slowdown, 0.1 is 10%%"
+    )
+    scale_parser = subparsers.add_parser(
+        "scale", help="Find super-linear growth on synthetic services"
+    )
+    scale_parser.add_argument(
+        "-o",
+        "--operations",
+        type=int,
+        nargs="+",
+        default=[300, 600, 1200, 2400],
+        help="Synthetic service sizes, ec2 has about 600 operations",
+    )
+    scale_parser.add_argument("-r", "--repeat", type=int, default=1, help="Runs per case")
+    return parser.parse_args()
+
+
+def is_selected(name: str, patterns: Optional[List[str]]) -> bool:
+    """
+    Whether case `name` matches any of glob `patterns`, or there are no patterns.
+    """
+    if not patterns:
+        return True
+    return any(fnmatch.fnmatchcase(name, f"*{i}*") for i in patterns)
+
+
+def run(
+    repeat: int, warmup: int, patterns: Optional[List[str]], output_path: Optional[Path]
+) -> None:
+    """
+    Run selected cases and save results.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    results: Dict[str, Dict[str, object]] = {}
+    for case in get_cases():
+        if not is_selected(case.name, patterns):
+            continue
+        summary = get_summary(measure(case, repeat, warmup))
+        results[case.name] = summary
+        logger.info(f"{case.name:<60}{summary['min'] * 1000:>12.1f} ms")
+
+    if output_path:
+        save_results(output_path, results, repeat)
+        logger.info(f"Saved {len(results)} results to {output_path}")
+
+
+def format_time(value: Optional[float]) -> str:
+    """
+    Format seconds as milliseconds or a dash.
+    """
+    return "-" if value is None else f"{value * 1000:.1f}"
+
+
+def report(comparisons: List[Comparison]) -> int:
+    """
+    Log comparison table.
+
+    Returns:
+        Number of regressions.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.info(f"{'Case':<60}{'Baseline, ms':>14}{'Current, ms':>14}{'Change':>10}")
+    for comparison in comparisons:
+        change = comparison.change
+        change_str = "-" if change is None else f"{change:+.1%}"
+        flag = " REGRESSION" if comparison.is_regression else ""
+        logger.info(
+            f"{comparison.name:<60}{format_time(comparison.baseline):>14}"
+            f"{format_time(comparison.current):>14}{change_str:>10}{flag}"
+        )
+    regressions = [i for i in comparisons if i.is_regression]
+    if regressions:
+        logger.info(f"{len(regressions)} regressions over {comparisons[0].threshold:.0%}")
+    return len(regressions)
+
+
+def scale(operations_list: List[int], repeat: int) -> int:
+    """
+    Time synthetic service cases for each size and log growth exponent to previous size.
+
+    Returns:
+        Number of super-linear measurements.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    timings: Dict[str, Dict[int, float]] = {}
+    for operations in sorted(operations_list):
+        for case in get_scale_cases(operations):
+            timings.setdefault(case.name, {})[operations] = min(measure(case, repeat, warmup=0))
+            logger.debug(f"{case.name} {operations}: {timings[case.name][operations]:.3f}s")
+
+    result = 0
+    logger.info(f"{'Case':<44}{'Operations':>12}{'Time, ms':>12}{'Exponent':>10}")
+    for name, size_timings in timings.items():
+        previous: Optional[Tuple[int, float]] = None
+        for operations, timing in size_timings.items():
+            exponent_str = "-"
+            flag = ""
+            if previous and previous[1] and timing:
+                exponent = math.log(timing / previous[1]) / math.log(operations / previous[0])
+                exponent_str = f"{exponent:.2f}"
+                if exponent > SUPER_LINEAR_EXPONENT:
+                    flag = " SUPER-LINEAR"
+                    result += 1
+            logger.info(
+                f"{name:<44}{operations:>12}{timing * 1000:>12.1f}{exponent_str:>10}{flag}"
+            )
+            previous = (operations, timing)
+    return result
+
+
+def main() -> None:
+    args = parse_args()
+    setup_logging()
+    if args.command == "run":
+        run(args.repeat, args.warmup, args.patterns, args.output)
+        return
+    if args.command == "scale":
+        scale(args.operations, args.repeat)
+        return
+
+    comparisons = compare(load_results(args.baseline), load_results(args.results), args.threshold)
+    if report(comparisons):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Benchmark cases with fixed inputs.
+
+Each case has a `setup` function that prepares fresh state and returns a function to time.
+"""
+import atexit
+import inspect
+import shutil
+import tempfile
+import textwrap
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+from boto3 import __version__ as boto3_version
+from boto3.session import Session
+from botocore import __version__ as botocore_version
+
+from mypy_boto3_builder.constants import DUMMY_REGION
+from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.main import get_available_service_names
+from mypy_boto3_builder.parsers.docstring_parser.argspec_parser import ArgSpecParser
+from mypy_boto3_builder.parsers.docstring_parser.docstring_parser import DocstringParser
+from mypy_boto3_builder.parsers.service_package import parse_service_package
+from mypy_boto3_builder.parsers.shape_parser import ShapeParser
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.utils import synthetic_models
+from mypy_boto3_builder.utils.strings import get_class_prefix
+from mypy_boto3_builder.writers.file_writer import FileWriter
+from mypy_boto3_builder.writers.processors import process_service
+from mypy_boto3_builder.writers.sinks import MemorySink
+from mypy_boto3_builder.writers.utils import blackify, render_jinja2_template, sort_imports
+
+OUTPUT_PATH = Path("/benchmark")
+SYNTHETIC_PREFIX = "synthetic"
+# Synthetic service with 300 generic operations, see `mypy_boto3_builder.utils.synthetic_models`
+SYNTHETIC_SERVICE_NAME = f"{SYNTHETIC_PREFIX}300"
+SHAPE_PARSER_SERVICE_NAMES = ("ec2", "s3", "sagemaker", "dynamodb", SYNTHETIC_SERVICE_NAME)
+PARSE_SERVICE_NAMES = ("dynamodb", SYNTHETIC_SERVICE_NAME)
+# Resource methods without shape data, that are the slowest to parse from docstrings
+DOCSTRING_METHODS = (
+    ("s3", "Bucket", ("bucket",), "copy"),
+    ("s3", "Object", ("bucket", "key"), "copy"),
+    ("s3", "Bucket", ("bucket",), "upload_file"),
+    ("s3", "Bucket", ("bucket",), "download_fileobj"),
+)
+PACKAGE_SERVICE_NAMES = ("ec2", SYNTHETIC_SERVICE_NAME)
+SERVICE_TEMPLATE_NAMES = (
+    "__init__.pyi",
+    "client.pyi",
+    "literals.pyi",
+    "paginator.pyi",
+    "service_resource.pyi",
+    "type_defs.pyi",
+    "waiter.pyi",
+)
+# black takes tens of seconds on ec2 modules, so formatters use a smaller service
+FORMAT_SERVICE_NAME = "dynamodb"
+FORMAT_TEMPLATE_NAMES = ("client.pyi", "type_defs.pyi")
+PROCESS_SERVICE_NAMES = ("sqs", "dynamodb")
+SCALE_TEMPLATE_NAMES = ("client.pyi", "type_defs.pyi")
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    Benchmark case.
+
+    Arguments:
+        name -- Unique case name.
+        setup -- Function that prepares state and returns a function to time.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+
+
+def set_template_globals() -> None:
+    """
+    Set template globals with fixed values.
+    """
+    JinjaManager.update_globals(
+        master_pypi_name="mypy-boto3",
+        master_module_name="mypy_boto3",
+        boto3_stubs_name="boto3-stubs",
+        common_pypi_name="mypy-boto3-common",
+        common_module_name="mypy_boto3_common",
+        boto3_version=boto3_version,
+        botocore_version=botocore_version,
+        build_version=boto3_version,
+        min_build_version=boto3_version,
+        botocore_build_version=botocore_version,
+        builder_version="0.0.0",
+        get_anchor_link=lambda x: x,
+        render_docstrings=True,
+        hasattr=hasattr,
+    )
+
+
+@lru_cache()
+def get_session() -> Session:
+    """
+    Get boto3 session with all service names registered.
+    """
+    session = Session(region_name=DUMMY_REGION)
+    get_available_service_names(session)
+    set_template_globals()
+    return session
+
+
+def get_synthetic_service_name(operations: int) -> str:
+    """
+    Get name of synthetic service with `operations` generic operations.
+    """
+    return f"{SYNTHETIC_PREFIX}{operations}"
+
+
+@lru_cache()
+def get_synthetic_session(operations: int) -> Session:
+    """
+    Get boto3 session with synthetic service models in a temporary data path.
+    """
+    data_path = Path(tempfile.mkdtemp(prefix="benchmark-synthetic-"))
+    atexit.register(shutil.rmtree, data_path, True)
+    config = synthetic_models.SyntheticConfig(
+        service_name=get_synthetic_service_name(operations), operations=operations
+    )
+    synthetic_models.write_models(data_path, config)
+    session = synthetic_models.get_session(data_path)
+    get_available_service_names(session)
+    set_template_globals()
+    return session
+
+
+def get_service_session(service_name: str) -> Session:
+    """
+    Get boto3 session that has `service_name` models.
+    """
+    if service_name.startswith(SYNTHETIC_PREFIX):
+        return get_synthetic_session(int(service_name[len(SYNTHETIC_PREFIX) :]))
+    return get_session()
+
+
+@lru_cache()
+def get_service_package(service_name: str) -> ServicePackage:
+    """
+    Get parsed service package, shared by all cases.
+    """
+    session = get_service_session(service_name)
+    return parse_service_package(session, ServiceNameCatalog.find(service_name))
+
+
+@lru_cache()
+def get_rendered_template(template_name: str) -> str:
+    """
+    Get rendered service template for formatter cases.
+    """
+    package = get_service_package(FORMAT_SERVICE_NAME)
+    return render_jinja2_template(
+        Path("service/service") / f"{template_name}.jinja2",
+        package=package,
+        service_name=package.service_name,
+    )
+
+
+def _setup_get_client_method_map(service_name: str) -> Callable[[], Any]:
+    shape_parser = ShapeParser(
+        get_service_session(service_name), ServiceNameCatalog.find(service_name)
+    )
+    return shape_parser.get_client_method_map
+
+
+def _setup_parse_service_package(service_name: str) -> Callable[[], Any]:
+    session = get_service_session(service_name)
+    return partial(parse_service_package, session, ServiceNameCatalog.find(service_name))
+
+
+def _setup_docstring_parser(
+    service_name: str, parent_name: str, identifiers: Sequence[str], name: str
+) -> Callable[[], Any]:
+    session = get_session()
+    resource = session.resource(service_name)  # type: ignore
+    method = getattr(getattr(resource, parent_name)(*identifiers), name)
+    docstring = textwrap.dedent(inspect.getdoc(method) or "")
+    service_name_item = ServiceNameCatalog.find(service_name)
+
+    def parse() -> None:
+        prefix = f"{get_class_prefix(parent_name)}{get_class_prefix(name)}"
+        arguments = ArgSpecParser(prefix, service_name_item).get_arguments(
+            parent_name, name, method
+        )
+        DocstringParser(service_name_item, parent_name, name, arguments).get_arguments(docstring)
+        DocstringParser(service_name_item, parent_name, name, []).get_return_type(docstring)
+
+    return parse
+
+
+def _setup_extract_typed_dicts(service_name: str) -> Callable[[], Any]:
+    return get_service_package(service_name).extract_typed_dicts
+
+
+def _setup_extract_literals(service_name: str) -> Callable[[], Any]:
+    return get_service_package(service_name).extract_literals
+
+
+def _setup_render_template(service_name: str, template_name: str) -> Callable[[], Any]:
+    package = get_service_package(service_name)
+    template_path = Path("service/service") / f"{template_name}.jinja2"
+    return lambda: render_jinja2_template(
+        template_path, package=package, service_name=package.service_name
+    )
+
+
+def _setup_blackify(template_name: str) -> Callable[[], Any]:
+    content = get_rendered_template(template_name)
+    return lambda: blackify(content, Path(template_name))
+
+
+def _setup_sort_imports(template_name: str) -> Callable[[], Any]:
+    content = get_rendered_template(template_name)
+    module_name = ServiceNameCatalog.find(FORMAT_SERVICE_NAME).module_name
+    return lambda: sort_imports(content, module_name, extension="pyi")
+
+
+def _setup_process_service(service_name: str) -> Callable[[], Any]:
+    session = get_service_session(service_name)
+    FileWriter.sink = MemorySink()
+    return lambda: process_service(
+        session, ServiceNameCatalog.find(service_name), OUTPUT_PATH, generate_setup=True
+    )
+
+
+def get_cases() -> List[BenchmarkCase]:
+    """
+    Get all benchmark cases in run order.
+    """
+    result: List[BenchmarkCase] = []
+    for service_name in SHAPE_PARSER_SERVICE_NAMES:
+        result.append(
+            BenchmarkCase(
+                f"shape_parser.get_client_method_map[{service_name}]",
+                partial(_setup_get_client_method_map, service_name),
+            )
+        )
+    for service_name in PARSE_SERVICE_NAMES:
+        result.append(
+            BenchmarkCase(
+                f"parse_service_package[{service_name}]",
+                partial(_setup_parse_service_package, service_name),
+            )
+        )
+    for service_name, parent_name, identifiers, name in DOCSTRING_METHODS:
+        result.append(
+            BenchmarkCase(
+                f"docstring_parser[{service_name}.{parent_name}.{name}]",
+                partial(_setup_docstring_parser, service_name, parent_name, identifiers, name),
+            )
+        )
+    for service_name in PACKAGE_SERVICE_NAMES:
+        result.append(
+            BenchmarkCase(
+                f"service_package.extract_typed_dicts[{service_name}]",
+                partial(_setup_extract_typed_dicts, service_name),
+            )
+        )
+        result.append(
+            BenchmarkCase(
+                f"service_package.extract_literals[{service_name}]",
+                partial(_setup_extract_literals, service_name),
+            )
+        )
+    for service_name in PACKAGE_SERVICE_NAMES:
+        for template_name in SERVICE_TEMPLATE_NAMES:
+            result.append(
+                BenchmarkCase(
+                    f"render_jinja2_template[{service_name}/{template_name}]",
+                    partial(_setup_render_template, service_name, template_name),
+                )
+            )
+    format_cases: Dict[str, Callable[[str], Callable[[], Any]]] = {
+        "blackify": _setup_blackify,
+        "sort_imports": _setup_sort_imports,
+    }
+    for case_name, setup in format_cases.items():
+        for template_name in FORMAT_TEMPLATE_NAMES:
+            result.append(
+                BenchmarkCase(
+                    f"{case_name}[{FORMAT_SERVICE_NAME}/{template_name}]",
+                    partial(setup, template_name),
+                )
+            )
+    for service_name in PROCESS_SERVICE_NAMES:
+        result.append(
+            BenchmarkCase(
+                f"process_service[{service_name}]", partial(_setup_process_service, service_name)
+            )
+        )
+    return result
+
+
+def get_scale_cases(operations: int) -> List[BenchmarkCase]:
+    """
+    Get cases for a synthetic service with `operations` generic operations.
+
+    Case names do not include service name, so timings for different sizes can be compared.
+    """
+    service_name = get_synthetic_service_name(operations)
+    result = [
+        BenchmarkCase(
+            "shape_parser.get_client_method_map",
+            partial(_setup_get_client_method_map, service_name),
+        ),
+        BenchmarkCase(
+            "parse_service_package", partial(_setup_parse_service_package, service_name)
+        ),
+        BenchmarkCase(
+            "service_package.extract_typed_dicts",
+            partial(_setup_extract_typed_dicts, service_name),
+        ),
+        BenchmarkCase(
+            "service_package.extract_literals", partial(_setup_extract_literals, service_name)
+        ),
+    ]
+    for template_name in SCALE_TEMPLATE_NAMES:
+        result.append(
+            BenchmarkCase(
+                f"render_jinja2_template[{template_name}]",
+                partial(_setup_render_template, service_name, template_name),
+            )
+        )
+    return result
@@ -0,0 +1,148 @@
+"""
+Benchmark runner, JSON results and regression check.
+"""
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from benchmarks.cases import BenchmarkCase
+from boto3 import __version__ as boto3_version
+from botocore import __version__ as botocore_version
+
+RESULTS_VERSION = 1
+
+
+@dataclass
+class Comparison:
+    """
+    Case timing compared to baseline.
+
+    Arguments:
+        name -- Case name.
+        baseline -- Baseline best time in seconds, None for a new case.
+        current -- Current best time in seconds, None for a removed case.
+        threshold -- Allowed slowdown ratio.
+    """
+
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    threshold: float
+
+    @property
+    def change(self) -> Optional[float]:
+        """
+        Relative time change, positive is slower.
+        """
+        if self.baseline is None or self.current is None or not self.baseline:
+            return None
+        return self.current / self.baseline - 1
+
+    @property
+    def is_regression(self) -> bool:
+        """
+        Whether case is slower than baseline over threshold.
+        """
+        change = self.change
+        return change is not None and change > self.threshold
+
+
+def measure(case: BenchmarkCase, repeat: int, warmup: int = 1) -> List[float]:
+    """
+    Time `case` `repeat` times after `warmup` runs.
+
+    Setup runs before every run and is not timed.
+
+    Returns:
+        A list of timings in seconds.
+    """
+    for _ in range(warmup):
+        case.setup()()
+
+    result: List[float] = []
+    for _ in range(repeat):
+        func = case.setup()
+        start = time.perf_counter()
+        func()
+        result.append(time.perf_counter() - start)
+    return result
+
+
+def get_summary(timings: List[float]) -> Dict[str, Any]:
+    """
+    Get timing statistics for results file.
+    """
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "runs": timings,
+    }
+
+
+def get_environment() -> Dict[str, str]:
+    """
+    Get environment description for results file.
+    """
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "boto3": boto3_version,
+        "botocore": botocore_version,
+    }
+
+
+def save_results(path: Path, results: Dict[str, Dict[str, Any]], repeat: int) -> None:
+    """
+    Save case results to JSON file.
+    """
+    data = {
+        "version": RESULTS_VERSION,
+        "environment": get_environment(),
+        "repeat": repeat,
+        "results": results,
+    }
+    path.write_text(json.dumps(data, indent=2, sort_keys=True))
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load case results from JSON file.
+    """
+    data = json.loads(path.read_text())
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported results version in {path}")
+    return data["results"]
+
+
+def compare(
+    baseline: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> List[Comparison]:
+    """
+    Compare best timings of cases present in either results.
+
+    Arguments:
+        baseline -- Baseline results.
+        current -- Current results.
+        threshold -- Allowed slowdown ratio, `0.1` is 10%.
+
+    Returns:
+        A list of comparisons in case name order.
+    """
+    names: Iterable[str] = sorted({*baseline, *current})
+    return [
+        Comparison(
+            name=name,
+            baseline=baseline[name]["min"] if name in baseline else None,
+            current=current[name]["min"] if name in current else None,
+            threshold=threshold,
+        )
+        for name in names
+    ]
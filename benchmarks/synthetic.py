@@ -0,0 +1,49 @@
+"""
+Write synthetic botocore service models for scale testing.
+
+Usage::
+
+    python -m benchmarks.synthetic /tmp/data -o 6000 -d 4
+    AWS_DATA_PATH=/tmp/data python -m mypy_boto3_builder /tmp/output -s synthetic
+"""
+import argparse
+from pathlib import Path
+
+from mypy_boto3_builder.utils.synthetic_models import SyntheticConfig, write_models
+
+
+def parse_args() -> argparse.Namespace:
+    defaults = SyntheticConfig()
+    parser = argparse.ArgumentParser(__file__, description="Write synthetic botocore models.")
+    parser.add_argument("data_path", type=Path, help="Botocore data path")
+    parser.add_argument("-s", "--service-name", default=defaults.service_name)
+    parser.add_argument("-o", "--operations", type=int, default=defaults.operations)
+    parser.add_argument("-d", "--shape-depth", type=int, default=defaults.shape_depth)
+    parser.add_argument("-f", "--fields", type=int, default=defaults.fields)
+    parser.add_argument("-c", "--cycle-density", type=float, default=defaults.cycle_density)
+    parser.add_argument("--enum-count", type=int, default=defaults.enum_count)
+    parser.add_argument("--enum-size", type=int, default=defaults.enum_size)
+    parser.add_argument("-r", "--resources", type=int, default=defaults.resources)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    config = SyntheticConfig(
+        service_name=args.service_name,
+        operations=args.operations,
+        shape_depth=args.shape_depth,
+        fields=args.fields,
+        cycle_density=args.cycle_density,
+        enum_count=args.enum_count,
+        enum_size=args.enum_size,
+        resources=args.resources,
+        seed=args.seed,
+    )
+    for model_path in write_models(args.data_path, config):
+        print(model_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""
+In-process API to generate packages from Python code.
+"""
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from boto3 import __version__ as boto3_version
+from boto3.session import Session
+from botocore.session import get_session as get_botocore_session
+
+from mypy_boto3_builder.cli_parser import get_builder_version
+from mypy_boto3_builder.constants import DUMMY_REGION, LOGGER_NAME
+from mypy_boto3_builder.main import get_service_name, set_template_globals
+from mypy_boto3_builder.parsers.service_cost import get_service_costs
+from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
+from mypy_boto3_builder.utils.memory import MemoryProfiler, MemorySample, get_durations
+from mypy_boto3_builder.utils.shards import get_largest_first
+from mypy_boto3_builder.writers.file_writer import FileWriter
+from mypy_boto3_builder.writers.processors import (
+    process_boto3_stubs,
+    process_botocore_stubs,
+    process_master,
+    process_service,
+)
+from mypy_boto3_builder.writers.sinks import (
+    ArchiveSink,
+    Content,
+    DirectorySink,
+    MemorySink,
+    Sink,
+)
+from mypy_boto3_builder.writers.utils import iterate_encoded_chunks
+
+__all__ = ["GenerateResult", "generate"]
+
+# Output root for sinks without a path, generated file paths are relative to it
+MEMORY_ROOT_PATH = Path("/")
+
+# Generated files, stage samples and summary data of one service package
+ServiceResult = Tuple[Dict[Path, Content], List[MemorySample], Dict[str, Any]]
+
+
+@dataclass
+class GenerateResult:
+    """
+    Generated files with per-stage timings.
+
+    Arguments:
+        files -- Relative file path to content, only for `MemorySink`.
+        samples -- Duration and memory usage of every parse and write stage.
+        service_summaries -- Summaries of generated service packages.
+    """
+
+    files: Dict[str, bytes] = field(default_factory=dict)
+    samples: List[MemorySample] = field(default_factory=list)
+    service_summaries: List[ServiceSummary] = field(default_factory=list)
+
+    def get_timings(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get stage durations in seconds by package or service name.
+        """
+        result: Dict[str, Dict[str, float]] = {}
+        for sample in self.samples:
+            stages = result.setdefault(sample.name, {})
+            stages[sample.stage] = stages.get(sample.stage, 0.0) + sample.duration
+        return result
+
+    def get_durations(self) -> Dict[str, float]:
+        """
+        Get total durations in seconds by package or service name.
+
+        Pass them as `durations` to the next `generate` call to schedule services by cost.
+        """
+        return get_durations(self.samples)
+
+
+@dataclass
+class WorkerConfig:
+    """
+    Picklable state to set up a service worker process.
+
+    Arguments:
+        data_path -- Botocore `data_path` config variable.
+        region_name -- Session region name.
+        build_version -- Output packages version.
+        builder_version -- Builder package version.
+        class_names -- Service name to class name.
+    """
+
+    data_path: Optional[str]
+    region_name: str
+    build_version: str
+    builder_version: str
+    class_names: Dict[str, str]
+
+
+class ServiceWorker:
+    """
+    Service packages generator in a worker process.
+
+    Every worker has its own session and template globals, files are collected
+    in memory and written to output sink by the main process.
+    """
+
+    session: Optional[Session] = None
+
+    @classmethod
+    def get_config(
+        cls,
+        session: Session,
+        service_names: Iterable[ServiceName],
+        build_version: str,
+        builder_version: str,
+    ) -> WorkerConfig:
+        """
+        Get worker config that recreates `session` with the same models.
+        """
+        return WorkerConfig(
+            data_path=session._session.get_config_variable("data_path"),  # type: ignore
+            region_name=session.region_name or DUMMY_REGION,
+            build_version=build_version,
+            builder_version=builder_version,
+            class_names={i.name: i.class_name for i in service_names},
+        )
+
+    @classmethod
+    def initialize(cls, config: WorkerConfig) -> None:
+        """
+        Set up worker process, used as an executor initializer.
+        """
+        botocore_session = get_botocore_session()
+        if config.data_path:
+            botocore_session.set_config_variable("data_path", config.data_path)
+        cls.session = Session(botocore_session=botocore_session, region_name=config.region_name)
+        for name, class_name in config.class_names.items():
+            ServiceNameCatalog.add(name, class_name)
+        set_template_globals(config.build_version, config.builder_version)
+        MemoryProfiler.start()
+
+    @classmethod
+    def process(cls, name: str, output_path: Path, generate_setup: bool) -> ServiceResult:
+        """
+        Generate service package in memory.
+
+        Returns:
+            Generated files, stage samples and package summary data.
+        """
+        if cls.session is None:
+            raise ValueError("Worker is not initialized")
+
+        sink = MemorySink()
+        FileWriter.sink = sink
+        first_sample_index = len(MemoryProfiler.samples)
+        summary = generate_service(
+            cls.session, ServiceNameCatalog.find(name), output_path, generate_setup
+        )
+        # ServiceName is compared by identity, so summary is sent as data
+        return sink.files, MemoryProfiler.samples[first_sample_index:], summary.to_dict()
+
+
+def get_output_root_path(sink: Sink) -> Path:
+    """
+    Get output root path for `sink`.
+    """
+    if isinstance(sink, DirectorySink) and sink.root_path:
+        return sink.root_path
+    if isinstance(sink, ArchiveSink):
+        return sink.archive_path
+    return MEMORY_ROOT_PATH
+
+
+def generate_service(
+    session: Session, service_name: ServiceName, output_path: Path, generate_setup: bool
+) -> ServiceSummary:
+    """
+    Parse and write service package with versioned boto3 docs links.
+    """
+    service_name.boto3_version = boto3_version
+    try:
+        return process_service(
+            session=session,
+            service_name=service_name,
+            output_path=output_path,
+            generate_setup=generate_setup,
+        )
+    finally:
+        service_name.boto3_version = ServiceName.LATEST
+
+
+def generate_services_parallel(
+    config: WorkerConfig,
+    service_names: Sequence[ServiceName],
+    output_path: Path,
+    generate_setup: bool,
+    jobs: int,
+    costs: Sequence[float],
+) -> List[ServiceSummary]:
+    """
+    Generate service packages in `jobs` worker processes.
+
+    Services are queued most expensive first, and every idle worker takes the next
+    one from the shared queue, so the largest services do not finish last.
+
+    Files of each service are written to `FileWriter.sink` in path order. Archive
+    sinks get services in the given order, so archives are the same as sequential,
+    other sinks get them as soon as they are ready.
+
+    Returns:
+        Summaries of generated packages in the given order.
+    """
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=ServiceWorker.initialize, initargs=(config,)
+    ) as executor:
+        futures: Dict[Future[ServiceResult], str] = {
+            executor.submit(ServiceWorker.process, i.name, output_path, generate_setup): i.name
+            for i in get_largest_first(service_names, costs)
+        }
+        ready_futures: Iterator[Future[ServiceResult]]
+        if isinstance(FileWriter.sink, ArchiveSink):
+            name_futures = {name: future for future, name in futures.items()}
+            ready_futures = (name_futures.pop(i.name) for i in service_names)
+        else:
+            ready_futures = as_completed(futures)
+
+        # futures are dropped once written, so results of written services are released
+        samples: Dict[str, List[MemorySample]] = {}
+        summaries: Dict[str, ServiceSummary] = {}
+        for future in ready_futures:
+            name = futures.pop(future)
+            files, samples[name], summary_data = future.result()
+            summaries[name] = ServiceSummary.from_dict(summary_data)
+            for file_path in sorted(files):
+                FileWriter.sink.write(file_path, files[file_path])
+
+    for service_name in service_names:
+        MemoryProfiler.samples.extend(samples[service_name.name])
+    return [summaries[i.name] for i in service_names]
+
+
+def generate(
+    service_names: Iterable[str],
+    *,
+    session: Optional[Session] = None,
+    sink: Optional[Sink] = None,
+    jobs: int = 1,
+    build_version: Optional[str] = None,
+    generate_setup: bool = True,
+    skip_master: bool = False,
+    durations: Optional[Mapping[str, float]] = None,
+) -> GenerateResult:
+    """
+    Generate service packages, and `mypy_boto3`, `boto3-stubs` and `botocore-stubs` for them.
+
+    Nothing is written to disk with the default `MemorySink`. Logging is not configured,
+    builder logger gets a `NullHandler` if it has no handlers.
+
+    Arguments:
+        service_names -- boto3 service names.
+        session -- boto3 session to load models from, custom botocore `data_path` is supported.
+        sink -- Output sink, `MemorySink` by default.
+        jobs -- Number of worker processes for service packages.
+        build_version -- Output packages version, boto3 version by default.
+        generate_setup -- Generate ready-to-install packages, otherwise packages to use as is.
+        skip_master -- Generate only service packages.
+        durations -- Service durations in seconds from a previous run, see
+            `GenerateResult.get_durations`, to start the slowest services first with `jobs`.
+            Model sizes are used by default.
+
+    Returns:
+        Generated files for `MemorySink` and per-stage timings.
+
+    Raises:
+        ValueError -- If service is not provided by boto3 session.
+    """
+    if jobs < 1:
+        raise ValueError(f"Invalid number of jobs: {jobs}")
+    session = session or Session(region_name=DUMMY_REGION)
+    if sink is None:
+        sink = MemorySink()
+    output_path = get_output_root_path(sink)
+    available_service_names = set(session.get_available_services())
+    selected_service_names: List[ServiceName] = []
+    for name in service_names:
+        if name not in available_service_names:
+            raise ValueError(f"Service {name} is not provided by boto3")
+        selected_service_names.append(get_service_name(session, name))
+
+    build_version = build_version or boto3_version
+    builder_version = get_builder_version()
+    set_template_globals(build_version, builder_version)
+
+    logger = logging.getLogger(LOGGER_NAME)
+    null_handler = logging.NullHandler()
+    if not logger.handlers:
+        logger.addHandler(null_handler)
+    is_profiler_started = MemoryProfiler.is_started
+    if not is_profiler_started:
+        MemoryProfiler.start()
+    first_sample_index = len(MemoryProfiler.samples)
+    old_sink = FileWriter.sink
+    try:
+        with sink:
+            FileWriter.sink = sink
+            if jobs > 1 and len(selected_service_names) > 1:
+                config = ServiceWorker.get_config(
+                    session, selected_service_names, build_version, builder_version
+                )
+                costs = get_service_costs(session, selected_service_names, durations)
+                service_summaries = generate_services_parallel(
+                    config, selected_service_names, output_path, generate_setup, jobs, costs
+                )
+            else:
+                service_summaries = [
+                    generate_service(session, service_name, output_path, generate_setup)
+                    for service_name in selected_service_names
+                ]
+
+            if not skip_master:
+                if generate_setup:
+                    process_master(
+                        session,
+                        output_path,
+                        selected_service_names,
+                        generate_setup,
+                        service_summaries=service_summaries,
+                    )
+                process_boto3_stubs(
+                    session,
+                    output_path,
+                    selected_service_names,
+                    generate_setup,
+                    service_summaries=service_summaries,
+                )
+                process_botocore_stubs(output_path, generate_setup)
+        samples = MemoryProfiler.samples[first_sample_index:]
+    finally:
+        FileWriter.sink = old_sink
+        logger.removeHandler(null_handler)
+        if not is_profiler_started:
+            MemoryProfiler.stop()
+
+    files: Dict[str, bytes] = {}
+    if isinstance(sink, MemorySink):
+        for file_path in sorted(sink.files):
+            relative_path = file_path.relative_to(output_path).as_posix()
+            files[relative_path] = b"".join(iterate_encoded_chunks(sink.files[file_path]))
+    return GenerateResult(files=files, samples=samples, service_summaries=service_summaries)
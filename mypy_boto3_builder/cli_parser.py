@@ -3,12 +3,15 @@ CLI parser.
 """
 import argparse
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Sequence
+from typing import List, Optional, Sequence, Tuple
 
 import pkg_resources
 
+from mypy_boto3_builder.utils.memory import parse_memory_size
+from mypy_boto3_builder.utils.shards import parse_shard
+
 
 def get_absolute_path(path: str) -> Path:
     """
@@ -23,6 +26,94 @@ def get_absolute_path(path: str) -> Path:
     return Path(path).absolute()
 
 
+def get_memory_size(value: str) -> int:
+    """
+    Get memory size in bytes from a string like `512M` or `2G`.
+
+    Arguments:
+        value -- Memory size, megabytes by default.
+
+    Returns:
+        Size in bytes.
+    """
+    try:
+        return parse_memory_size(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
+def get_shard(value: str) -> Tuple[int, int]:
+    """
+    Get shard index and count from a string like `1/4`.
+
+    Arguments:
+        value -- Shard as `INDEX/COUNT`.
+
+    Returns:
+        A tuple of index and count.
+    """
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
+def get_builder_version() -> str:
+    """
+    Get installed builder package version.
+
+    Returns:
+        Version string, `0.0.0` if package is not installed.
+    """
+    try:
+        return pkg_resources.get_distribution("mypy-boto3-builder").version
+    except pkg_resources.DistributionNotFound:
+        return "0.0.0"
+
+
+def validate_watch_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Check that other arguments can be used with `--watch`.
+
+    Arguments:
+        parser -- Argument parser to report errors.
+        args -- Parsed arguments.
+    """
+    if args.docs:
+        parser.error("--watch cannot be used with --docs")
+    if args.skip_services:
+        parser.error("--watch cannot be used with --skip-services")
+    if args.shared_types:
+        parser.error("--watch cannot be used with --shared-types")
+    if args.output_path.name.endswith((".zip", ".tar.zst")):
+        parser.error("--watch requires an output directory")
+
+
+def validate_shard_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Check that other arguments can be used with `--shard` and `--merge-shards`.
+
+    Arguments:
+        parser -- Argument parser to report errors.
+        args -- Parsed arguments.
+    """
+    if args.shard and args.merge_shard_paths:
+        parser.error("--shard cannot be used with --merge-shards")
+    for name, value in (("--shard", args.shard), ("--merge-shards", args.merge_shard_paths)):
+        if not value:
+            continue
+        if args.docs:
+            parser.error(f"{name} cannot be used with --docs")
+        if args.shared_types:
+            parser.error(f"{name} cannot be used with --shared-types")
+        if args.watch:
+            parser.error(f"{name} cannot be used with --watch")
+    if args.merge_shard_paths and (
+        args.skip_master or args.service_names or args.from_source_paths
+    ):
+        parser.error("--merge-shards uses services from shard manifests")
+
+
 @dataclass
 class Namespace:
     """
@@ -39,6 +130,22 @@ class Namespace:
     builder_version: str
     generate_docs: bool
     list_services: bool
+    shared_types: bool = False
+    split_type_defs: bool = False
+    light_runtime_types: bool = False
+    essential_overloads_first: bool = False
+    compact_overloads: bool = False
+    from_source_paths: List[Path] = field(default_factory=list)
+    operation_names: Optional[List[str]] = None
+    shake_operations: bool = False
+    cache_path: Optional[Path] = None
+    wheel: bool = False
+    memory_report_path: Optional[Path] = None
+    max_memory: Optional[int] = None
+    watch: bool = False
+    shard: Optional[Tuple[int, int]] = None
+    merge_shard_paths: List[Path] = field(default_factory=list)
+    cost_report_path: Optional[Path] = None
 
 
 def parse_args(args: Sequence[str]) -> Namespace:
@@ -48,11 +155,7 @@ def parse_args(args: Sequence[str]) -> Namespace:
     Returns:
         Argument parser.
     """
-    try:
-        version = pkg_resources.get_distribution("mypy-boto3-builder").version
-    except pkg_resources.DistributionNotFound:
-        version = "0.0.0"
-
+    version = get_builder_version()
     parser = argparse.ArgumentParser("mypy_boto3_builder", description="Builder for mypy-boto3.")
     parser.add_argument("-d", "--debug", action="store_true", help="Show debug messages")
     parser.add_argument(
@@ -76,7 +179,10 @@ def parse_args(args: Sequence[str]) -> Namespace:
         help="Raise exception on logger warning and above",
     )
     parser.add_argument(
-        "output_path", metavar="OUTPUT_PATH", help="Output path", type=get_absolute_path
+        "output_path",
+        metavar="OUTPUT_PATH",
+        help="Output directory, or a .zip or .tar.zst archive path",
+        type=get_absolute_path,
     )
     parser.add_argument(
         "-s",
@@ -97,7 +203,122 @@ def parse_args(args: Sequence[str]) -> Namespace:
         action="store_true",
         help="List supported boto3 service names.",
     )
+    parser.add_argument(
+        "--shared-types",
+        action="store_true",
+        help="Move TypedDicts and Literals that are the same in several services to a shared package.",
+    )
+    parser.add_argument(
+        "--split-type-defs",
+        action="store_true",
+        help="Split service type_defs module to a package with smaller part modules.",
+    )
+    parser.add_argument(
+        "--light-runtime-types",
+        action="store_true",
+        help="Build runtime TypedDicts and Literals on first access, full definitions stay in stubs.",
+    )
+    parser.add_argument(
+        "--essential-overloads-first",
+        action="store_true",
+        help=(
+            "Put boto3.client/resource overloads for essential services first, others in"
+            " a section skipped if type checker defines BOTO3_STUBS_ESSENTIAL_ONLY as true."
+            " mypy requires always_true or always_false setting for it."
+        ),
+    )
+    parser.add_argument(
+        "--compact-overloads",
+        action="store_true",
+        help=(
+            "Pass boto3.client/resource arguments except region_name as"
+            " **kwargs: Unpack[TypedDict]. Faster with pyright, slower with mypy 1.7+."
+        ),
+    )
+    parser.add_argument(
+        "--from-source",
+        dest="from_source_paths",
+        nargs="+",
+        metavar="PATH",
+        type=get_absolute_path,
+        help="Build only services used in Python files in PATH.",
+        default=[],
+    )
+    parser.add_argument(
+        "--operations",
+        dest="operation_names",
+        nargs="+",
+        metavar="OPERATION",
+        help="Keep only these client operations, paginators and waiters in service packages.",
+    )
+    parser.add_argument(
+        "--shake-operations",
+        action="store_true",
+        help="Keep only client operations, paginators and waiters used in --from-source PATH.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_path",
+        metavar="PATH",
+        type=get_absolute_path,
+        help="Directory for build caches, compiled templates are not cached by default.",
+    )
+    parser.add_argument(
+        "--wheel",
+        action="store_true",
+        help="Write reproducible wheels instead of package directories.",
+    )
+    parser.add_argument(
+        "--memory-report",
+        dest="memory_report_path",
+        metavar="PATH",
+        type=get_absolute_path,
+        help="Write per-service and per-stage memory usage to PATH as JSON, slows down the build.",
+    )
+    parser.add_argument(
+        "--max-memory",
+        metavar="SIZE",
+        type=get_memory_size,
+        help="Fail with top allocation sites when peak RSS exceeds SIZE, like 512M or 2G.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Regenerate service packages when their models change in botocore data paths.",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="INDEX/COUNT",
+        type=get_shard,
+        help=(
+            "Build only service packages of shard INDEX out of COUNT shards with close build cost,"
+            " and save their summaries for --merge-shards."
+        ),
+    )
+    parser.add_argument(
+        "--merge-shards",
+        dest="merge_shard_paths",
+        nargs="+",
+        metavar="PATH",
+        type=get_absolute_path,
+        default=[],
+        help="Build master and stubs packages from shard manifests in PATH without parsing services.",
+    )
+    parser.add_argument(
+        "--cost-report",
+        dest="cost_report_path",
+        metavar="PATH",
+        type=get_absolute_path,
+        help="Split --shard by service durations from a --memory-report of a previous run.",
+    )
     result = parser.parse_args(args)
+    if result.shake_operations and not result.from_source_paths:
+        parser.error("--shake-operations requires --from-source")
+    if result.wheel and result.installed:
+        parser.error("--wheel cannot be used with --installed")
+    if result.watch:
+        validate_watch_args(parser, result)
+    validate_shard_args(parser, result)
     result.builder_version = version
     return Namespace(
         log_level=logging.DEBUG if result.debug else logging.INFO,
@@ -110,4 +331,20 @@ def parse_args(args: Sequence[str]) -> Namespace:
         builder_version=result.builder_version,
         generate_docs=result.docs,
         list_services=result.list_services,
+        shared_types=result.shared_types,
+        split_type_defs=result.split_type_defs,
+        light_runtime_types=result.light_runtime_types,
+        essential_overloads_first=result.essential_overloads_first,
+        compact_overloads=result.compact_overloads,
+        from_source_paths=result.from_source_paths,
+        operation_names=result.operation_names,
+        shake_operations=result.shake_operations,
+        cache_path=result.cache_path,
+        wheel=result.wheel,
+        memory_report_path=result.memory_report_path,
+        max_memory=result.max_memory,
+        watch=result.watch,
+        shard=result.shard,
+        merge_shard_paths=result.merge_shard_paths,
+        cost_report_path=result.cost_report_path,
     )
@@ -1,6 +1,7 @@
 """
 Constants and paths.
 """
+import tempfile
 from pathlib import Path
 
 # Master module name
@@ -9,6 +10,12 @@ MODULE_NAME = "mypy_boto3"
 # PyPI module name
 PYPI_NAME = "mypy-boto3"
 
+# Shared types module name
+COMMON_MODULE_NAME = "mypy_boto3_common"
+
+# Shared types PyPI name
+COMMON_PYPI_NAME = "mypy-boto3-common"
+
 # Random region to initialize services
 DUMMY_REGION = "us-west-2"
 
@@ -27,10 +34,46 @@ BOTO3_STUBS_NAME = "boto3-stubs"
 # Botocore stubs module name
 BOTOCORE_STUBS_NAME = "botocore-stubs"
 
+# Type checker constant that skips `boto3.client/resource` overloads for non-essential services
+ESSENTIAL_ONLY_NAME = "BOTO3_STUBS_ESSENTIAL_ONLY"
+
 # Max line length for boto3 docs
 LINE_LENGTH = 100
 
 # type defs module name
 TYPE_DEFS_NAME = "type_defs"
 
+# Max number of TypedDicts in a single `type_defs` part module
+TYPE_DEFS_PART_SIZE = 200
+
+# Output manifest file name with hashes of written files
+MANIFEST_NAME = ".mypy_boto3_builder_manifest.json"
+
+# Size of text chunks for hashing and writing output files
+WRITE_CHUNK_SIZE = 1024 * 1024
+
+# Max number of threads for writing output files
+WRITE_THREADS = 8
+
 LOGGER_NAME = "mypy_boto3_builder"
+
+# Number of top allocation sites in memory reports
+MEMORY_TOP_COUNT = 10
+
+# Max number of cached isort configs, one is used per output module name
+ISORT_CONFIG_CACHE_SIZE = 64
+
+# Service summaries of one build shard, stored in output directory or next to output archive
+SHARD_MANIFEST_NAME = ".mypy_boto3_builder_shard_{index}_of_{count}.json"
+
+# Max number of formatted file contents cached by a long-running builder
+FORMATTER_CACHE_SIZE = 2048
+
+# Default Unix socket path of builder daemon
+DAEMON_SOCKET_PATH = Path(tempfile.gettempdir()) / "mypy_boto3_builder.sock"
+
+# Seconds between service model checks in watch mode without inotify
+WATCH_POLL_INTERVAL = 1.0
+
+# Seconds to wait for service model writes to settle before rebuild in watch mode
+WATCH_SETTLE_TIME = 0.2
@@ -0,0 +1,247 @@
+"""
+Long-running builder that serves build requests over a Unix socket.
+
+Usage::
+
+    python -m mypy_boto3_builder.daemon &
+    python -m mypy_boto3_builder.daemon_client mypy_boto3_output -s sqs --skip-master
+    python -m mypy_boto3_builder.daemon_client --stop
+"""
+import argparse
+import io
+import logging
+import os
+import socketserver
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, TextIO, Tuple, cast
+
+from boto3.session import Session
+from botocore.loaders import Loader
+
+from mypy_boto3_builder.cli_parser import parse_args as parse_builder_args
+from mypy_boto3_builder.constants import DAEMON_SOCKET_PATH, DUMMY_REGION
+from mypy_boto3_builder.daemon_client import read_message, write_message
+from mypy_boto3_builder.logger import get_log_formatter, get_logger
+from mypy_boto3_builder.main import execute, get_available_service_names
+from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.utils import FormatterCache
+
+__all__ = ["WarmLoader", "BuilderDaemon", "main"]
+
+
+class WarmLoader(Loader):
+    """
+    Botocore loader that keeps loaded service models for its lifetime.
+
+    Models stay loaded after `clear_boto3_cache`, that drops only the base loader cache.
+
+    Arguments:
+        search_paths -- Model search paths.
+    """
+
+    def __init__(self, search_paths: Sequence[str]) -> None:
+        super().__init__(extra_search_paths=list(search_paths), include_default_search_paths=False)
+        self._models: Dict[Tuple[str, str, Optional[str]], Any] = {}
+
+    def load_service_model(
+        self, service_name: str, type_name: str, api_version: Optional[str] = None
+    ) -> Any:
+        """
+        Load service model or get it from memory.
+        """
+        key = (service_name, type_name, api_version)
+        if key not in self._models:
+            self._models[key] = super().load_service_model(service_name, type_name, api_version)
+        return self._models[key]
+
+    @classmethod
+    def install(cls, session: Session) -> "WarmLoader":
+        """
+        Replace `session` loader with a WarmLoader with the same search paths.
+        """
+        botocore_session = session._session  # type: ignore
+        loader = cls(botocore_session.get_component("data_loader").search_paths)
+        botocore_session.register_component("data_loader", loader)
+        session._loader = loader  # type: ignore
+        return loader
+
+
+class ClientStream(io.TextIOBase):
+    """
+    Text stream that forwards writes to daemon client.
+
+    Arguments:
+        stream -- Client connection stream.
+        name -- Client output name, `stdout` or `stderr`.
+    """
+
+    def __init__(self, stream: TextIO, name: str) -> None:
+        super().__init__()
+        self.stream = stream
+        self.name = name
+
+    def write(self, text: str) -> int:
+        """
+        Send `text` to client.
+        """
+        if text:
+            write_message(self.stream, {"stream": self.name, "text": text})
+        return len(text)
+
+
+class BuilderRequestHandler(socketserver.BaseRequestHandler):
+    """
+    Handler for one daemon client connection.
+    """
+
+    server: "BuilderDaemon"
+
+    def handle(self) -> None:
+        """
+        Read request, stream build output and send exit code.
+        """
+        with self.request.makefile("rw", encoding="utf-8") as stream:
+            request = read_message(stream)
+            if request is None:
+                return
+            if request.get("command") == "stop":
+                self.server.is_stopped = True
+                write_message(stream, {"exit_code": 0})
+                return
+
+            try:
+                exit_code = self.server.build(
+                    request["args"],
+                    Path(request["cwd"]),
+                    cast(TextIO, ClientStream(stream, "stdout")),
+                    cast(TextIO, ClientStream(stream, "stderr")),
+                )
+                write_message(stream, {"exit_code": exit_code})
+            except (BrokenPipeError, ConnectionResetError):
+                get_logger().warning("Client disconnected before build was finished")
+
+
+class BuilderDaemon(socketserver.UnixStreamServer):
+    """
+    Builder that serves build requests one by one with warm caches.
+
+    Boto3 session with discovered service names, loaded service models, compiled
+    templates and formatter output are kept between requests.
+
+    Arguments:
+        socket_path -- Unix socket path, a stale socket file is replaced.
+            Socket is accessible only by the owner.
+        session -- Boto3 session to use, a new one is created by default.
+    """
+
+    def __init__(self, socket_path: Path, session: Optional[Session] = None) -> None:
+        self.socket_path = socket_path
+        self.is_stopped = False
+        self.session = session or Session(region_name=DUMMY_REGION)
+        self.available_service_names = get_available_service_names(self.session)
+        WarmLoader.install(self.session)
+        FormatterCache.enable()
+        if socket_path.is_socket():
+            socket_path.unlink()
+        # socket is created with owner-only access, so no other user can connect before chmod
+        umask = os.umask(0o077)
+        try:
+            super().__init__(socket_path.as_posix(), BuilderRequestHandler)
+        finally:
+            os.umask(umask)
+        socket_path.chmod(0o600)
+
+    def serve(self) -> None:
+        """
+        Handle requests until a stop request, socket file is removed on exit.
+        """
+        try:
+            while not self.is_stopped:
+                self.handle_request()
+        finally:
+            self.server_close()
+            if self.socket_path.is_socket():
+                self.socket_path.unlink()
+            FormatterCache.disable()
+
+    def build(self, args: Sequence[str], cwd: Path, stdout: TextIO, stderr: TextIO) -> int:
+        """
+        Run builder with CLI `args` from client working directory `cwd`.
+
+        Arguments:
+            args -- Builder CLI arguments.
+            cwd -- Client working directory to resolve relative paths.
+            stdout -- Client standard output.
+            stderr -- Client stream for logs and errors.
+
+        Returns:
+            Builder exit code.
+        """
+        # daemon log handler is created before output is redirected
+        get_logger()
+        daemon_cwd = Path.cwd()
+        os.chdir(cwd)
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                return self._build(args, stderr)
+        finally:
+            os.chdir(daemon_cwd)
+
+    def _build(self, args: Sequence[str], stderr: TextIO) -> int:
+        logger = get_logger()
+        try:
+            builder_args = parse_builder_args(args)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1
+
+        handler = logging.StreamHandler(stderr)
+        handler.setFormatter(get_log_formatter())
+        logger.addHandler(handler)
+        try:
+            return execute(builder_args, self.session, self.available_service_names)
+        except Exception:
+            logger.exception("Build failed")
+            return 1
+        finally:
+            logger.removeHandler(handler)
+
+
+def parse_args(args: Sequence[str]) -> argparse.Namespace:
+    """
+    Daemon CLI parser.
+    """
+    parser = argparse.ArgumentParser(
+        "mypy_boto3_builder.daemon",
+        description="Builder daemon with warm caches for fast rebuilds.",
+    )
+    parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        metavar="PATH",
+        type=Path,
+        default=DAEMON_SOCKET_PATH,
+        help=f"Unix socket path, {DAEMON_SOCKET_PATH} by default.",
+    )
+    return parser.parse_args(args)
+
+
+def main() -> None:
+    """
+    Daemon entrypoint.
+    """
+    args = parse_args(sys.argv[1:])
+    logger = get_logger(level=logging.INFO)
+    logger.info("Discovering boto3 services")
+    daemon = BuilderDaemon(args.socket_path.absolute())
+    logger.info(f"Builder daemon is listening on {NicePath(daemon.socket_path)}")
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
+    logger.info("Builder daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Thin client for builder daemon.
+
+Imports only standard library and builder constants, so a request does not pay
+for boto3, black and isort imports.
+
+Usage::
+
+    python -m mypy_boto3_builder.daemon &
+    python -m mypy_boto3_builder.daemon_client mypy_boto3_output -s sqs --skip-master
+    python -m mypy_boto3_builder.daemon_client --stop
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, TextIO
+
+from mypy_boto3_builder.constants import DAEMON_SOCKET_PATH
+
+__all__ = ["read_message", "write_message", "send_request", "main"]
+
+
+def write_message(stream: TextIO, message: Dict[str, Any]) -> None:
+    """
+    Write `message` to `stream` as a JSON line.
+    """
+    stream.write(f"{json.dumps(message)}\n")
+    stream.flush()
+
+
+def read_message(stream: TextIO) -> Optional[Dict[str, Any]]:
+    """
+    Read a JSON line message from `stream`.
+
+    Returns:
+        Message or None if stream is closed.
+    """
+    line = stream.readline()
+    if not line:
+        return None
+    result: Dict[str, Any] = json.loads(line)
+    return result
+
+
+def send_request(socket_path: Path, request: Dict[str, Any], stdout: TextIO, stderr: TextIO) -> int:
+    """
+    Send `request` to daemon and print its output until build is finished.
+
+    Arguments:
+        socket_path -- Daemon Unix socket path.
+        request -- Request message.
+        stdout -- Stream for daemon standard output.
+        stderr -- Stream for daemon logs and errors.
+
+    Returns:
+        Build exit code.
+
+    Raises:
+        ConnectionError -- If daemon closes connection before the build is finished.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path.as_posix())
+        with client.makefile("rw", encoding="utf-8") as stream:
+            write_message(stream, request)
+            while True:
+                message = read_message(stream)
+                if message is None:
+                    raise ConnectionError("Builder daemon closed connection")
+                if "exit_code" in message:
+                    exit_code: int = message["exit_code"]
+                    return exit_code
+                output = stdout if message["stream"] == "stdout" else stderr
+                output.write(message["text"])
+                output.flush()
+
+
+def parse_args(args: Sequence[str]) -> argparse.Namespace:
+    """
+    Daemon client CLI parser.
+    """
+    parser = argparse.ArgumentParser(
+        "mypy_boto3_builder.daemon_client",
+        description="Run builder in a running builder daemon.",
+    )
+    parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        metavar="PATH",
+        type=Path,
+        default=DAEMON_SOCKET_PATH,
+        help=f"Daemon Unix socket path, {DAEMON_SOCKET_PATH} by default.",
+    )
+    parser.add_argument("--stop", action="store_true", help="Stop daemon.")
+    parser.add_argument(
+        "builder_args",
+        nargs=argparse.REMAINDER,
+        metavar="OUTPUT_PATH ...",
+        help="Builder arguments, output path goes first.",
+    )
+    result = parser.parse_args(args)
+    if not result.stop and not result.builder_args:
+        parser.error("the following arguments are required: OUTPUT_PATH")
+    return result
+
+
+def main() -> None:
+    """
+    Daemon client entrypoint.
+    """
+    args = parse_args(sys.argv[1:])
+    request: Dict[str, Any] = {"command": "stop"}
+    if not args.stop:
+        request = {"command": "build", "args": args.builder_args, "cwd": os.getcwd()}
+    try:
+        exit_code = send_request(args.socket_path, request, sys.stdout, sys.stderr)
+    except OSError as e:
+        sys.stderr.write(f"Builder daemon is not available at {args.socket_path}: {e}\n")
+        sys.exit(1)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
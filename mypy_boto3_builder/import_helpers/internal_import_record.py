@@ -21,6 +21,15 @@ class InternalImportRecord(ImportRecord):
         source = ImportString.parent() + self._local_source
         super().__init__(source, name=name, alias=alias)
 
+    def get_nested(self) -> ImportRecord:
+        """
+        Get import record for a module in a service subpackage.
+
+        Returns:
+            A new ImportRecord that imports from parent package.
+        """
+        return ImportRecord(ImportString.parent() + self.source, name=self.name, alias=self.alias)
+
     def get_external(self, module_name: str) -> ImportRecord:
         """
         Get full import record with `module_name` set as master module.
@@ -1,7 +1,8 @@
 """
 Jinja2 `Environment` manager.
 """
-from typing import Any
+from pathlib import Path
+from typing import Any, Optional
 
 import jinja2
 
@@ -13,11 +14,17 @@ __all__ = ["JinjaManager"]
 class JinjaManager:
     """
     Jinja2 `Environment` manager.
+
+    Compiled templates can be stored in a bytecode cache set by `set_bytecode_cache_path`,
+    so new processes do not compile templates from source. Cache is disabled by default.
+    Templates are never reloaded after the first load.
     """
 
     _environment = jinja2.Environment(
         loader=jinja2.FileSystemLoader(TEMPLATES_PATH.as_posix()),
         undefined=jinja2.StrictUndefined,
+        bytecode_cache=None,
+        auto_reload=False,
     )
 
     @classmethod
@@ -30,6 +37,23 @@ class JinjaManager:
         """
         cls._environment.globals.update(kwargs)
 
+    @classmethod
+    def set_bytecode_cache_path(cls, path: Optional[Path]) -> None:
+        """
+        Set directory for compiled templates cache.
+
+        Arguments:
+            path -- Cache directory, `None` disables bytecode cache.
+        """
+        if cls._environment.cache is not None:
+            cls._environment.cache.clear()
+        if path is None:
+            cls._environment.bytecode_cache = None
+            return
+
+        path.mkdir(parents=True, exist_ok=True)
+        cls._environment.bytecode_cache = jinja2.FileSystemBytecodeCache(path.as_posix())
+
     @classmethod
     def get_environment(cls) -> jinja2.Environment:
         """
@@ -5,7 +5,7 @@ import logging
 
 from mypy_boto3_builder.constants import LOGGER_NAME
 
-__all__ = ("get_logger",)
+__all__ = ("get_logger", "get_log_formatter")
 
 
 def get_logger(level: int = 0) -> logging.Logger:
@@ -22,10 +22,7 @@ def get_logger(level: int = 0) -> logging.Logger:
     logger = logging.getLogger(LOGGER_NAME)
     if not logger.handlers:
         stream_handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s %(name)s: %(levelname)-8s %(message)s", datefmt="%H:%M:%S"
-        )
-        stream_handler.setFormatter(formatter)
+        stream_handler.setFormatter(get_log_formatter())
         stream_handler.setLevel(level)
         logger.addHandler(stream_handler)
 
@@ -35,3 +32,12 @@ def get_logger(level: int = 0) -> logging.Logger:
             handler.setLevel(level)
 
     return logger
+
+
+def get_log_formatter() -> logging.Formatter:
+    """
+    Get formatter for builder log handlers.
+    """
+    return logging.Formatter(
+        "%(asctime)s %(name)s: %(levelname)-8s %(message)s", datefmt="%H:%M:%S"
+    )
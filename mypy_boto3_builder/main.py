@@ -2,7 +2,10 @@
 Main entrypoint for builder.
 """
 import sys
-from typing import List
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set
 
 from boto3 import __version__ as boto3_version
 from boto3.session import Session
@@ -12,26 +15,49 @@ from mypy_boto3_builder.cli_parser import Namespace, parse_args
 from mypy_boto3_builder.constants import (
     BOTO3_STUBS_NAME,
     BOTOCORE_STUBS_NAME,
+    COMMON_MODULE_NAME,
+    COMMON_PYPI_NAME,
     DUMMY_REGION,
     MODULE_NAME,
     PYPI_NAME,
 )
 from mypy_boto3_builder.jinja_manager import JinjaManager
 from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_utils import clear_boto3_cache
+from mypy_boto3_builder.parsers.service_cost import get_service_costs
+from mypy_boto3_builder.parsers.used_services import (
+    get_used_operation_names,
+    get_used_service_names,
+)
 from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
+from mypy_boto3_builder.structures.common_package import CommonPackage
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
+from mypy_boto3_builder.utils.memory import (
+    MemoryBudgetError,
+    MemoryProfiler,
+    load_report_durations,
+)
+from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.shards import partition_by_cost
 from mypy_boto3_builder.utils.strings import (
     get_anchor_link,
     get_botocore_class_name,
     get_min_build_version,
 )
+from mypy_boto3_builder.utils.watcher import ServiceModelWatcher
+from mypy_boto3_builder.writers.file_writer import FileWriter, WheelFileWriter
+from mypy_boto3_builder.writers.manifest import Manifest
 from mypy_boto3_builder.writers.processors import (
     process_boto3_stubs,
     process_boto3_stubs_docs,
     process_botocore_stubs,
+    process_common,
     process_master,
     process_service,
     process_service_docs,
 )
+from mypy_boto3_builder.writers.shard_manifest import ShardManifest, ShardMergeError
+from mypy_boto3_builder.writers.sinks import DirectorySink, Sink, get_output_sink
 
 
 def get_available_service_names(session: Session) -> List[ServiceName]:
@@ -44,16 +70,58 @@ def get_available_service_names(session: Session) -> List[ServiceName]:
     Returns:
         A list of supported services.
     """
-    available_services = session.get_available_services()
+    return [get_service_name(session, name) for name in session.get_available_services()]
+
+
+def get_service_name(session: Session, name: str) -> ServiceName:
+    """
+    Get boto3 service name with class name from service model, and add it to catalog.
+
+    Arguments:
+        session -- Boto3 session
+        name -- Service name
+
+    Returns:
+        ServiceName from catalog.
+    """
     botocore_session = session._session  # type: ignore
-    result = []
-    for name in available_services:
-        service_data = botocore_session.get_service_data(name)
-        metadata = service_data["metadata"]
-        class_name = get_botocore_class_name(metadata)
-        service_name = ServiceNameCatalog.add(name, class_name)
-        result.append(service_name)
-    return result
+    service_data = botocore_session.get_service_data(name)
+    metadata = service_data["metadata"]
+    # keep only one model in memory, selected services are loaded again on demand
+    clear_boto3_cache(session)
+    class_name = get_botocore_class_name(metadata)
+    return ServiceNameCatalog.add(name, class_name)
+
+
+def set_template_globals(build_version: str, builder_version: str) -> None:
+    """
+    Set versions, names and helpers used by templates.
+
+    Arguments:
+        build_version -- Output packages version.
+        builder_version -- Builder package version.
+    """
+    min_build_version = get_min_build_version(build_version)
+    botocore_build_version = botocore_version
+    if ".post" in build_version:
+        post_release = build_version.split(".post")[-1]
+        botocore_build_version = f"{botocore_version}.post{post_release}"
+    JinjaManager.update_globals(
+        master_pypi_name=PYPI_NAME,
+        master_module_name=MODULE_NAME,
+        boto3_stubs_name=BOTO3_STUBS_NAME,
+        common_pypi_name=COMMON_PYPI_NAME,
+        common_module_name=COMMON_MODULE_NAME,
+        boto3_version=boto3_version,
+        botocore_version=botocore_version,
+        build_version=build_version,
+        min_build_version=min_build_version,
+        botocore_build_version=botocore_build_version,
+        builder_version=builder_version,
+        get_anchor_link=get_anchor_link,
+        render_docstrings=True,
+        hasattr=hasattr,
+    )
 
 
 def main() -> None:
@@ -61,14 +129,68 @@ def main() -> None:
     Main entrypoint for builder.
     """
     args = parse_args(sys.argv[1:])
+    exit_code = execute(args)
+    if exit_code:
+        sys.exit(exit_code)
+
+
+def execute(
+    args: Namespace,
+    session: Optional[Session] = None,
+    available_service_names: Optional[List[ServiceName]] = None,
+) -> int:
+    """
+    Generate stubs or docs with memory profiling and budget from `args`.
+
+    Arguments:
+        args -- Config namespace
+        session -- Boto3 session to reuse, a new one is created by default
+        available_service_names -- Already discovered service names
+
+    Returns:
+        Exit code.
+    """
     logger = get_logger(level=args.log_level)
-    session = Session(region_name=DUMMY_REGION)
-    args.output_path.mkdir(exist_ok=True)
-    available_service_names = get_available_service_names(session)
-    available_service_names_set = {i.name for i in available_service_names}
-    service_names: List[ServiceName] = []
+    if args.memory_report_path or args.max_memory:
+        MemoryProfiler.start(max_memory=args.max_memory, trace=bool(args.memory_report_path))
+    try:
+        run(args, session, available_service_names)
+    except (MemoryBudgetError, ShardMergeError) as e:
+        logger.error(e)
+        return 1
+    finally:
+        if args.memory_report_path:
+            MemoryProfiler.save_report(args.memory_report_path)
+            logger.info(f"Memory report saved to {NicePath(args.memory_report_path)}")
+        MemoryProfiler.stop()
+    return 0
+
 
-    logger.info(f"{len(available_service_names_set)} supported boto3 services discovered")
+def run(
+    args: Namespace,
+    session: Optional[Session] = None,
+    available_service_names: Optional[List[ServiceName]] = None,
+) -> None:
+    """
+    Generate stubs or docs.
+
+    Arguments:
+        args -- Config namespace
+        session -- Boto3 session to reuse, a new one is created by default
+        available_service_names -- Already discovered service names
+    """
+    logger = get_logger()
+    session = session or Session(region_name=DUMMY_REGION)
+    MemoryProfiler.add_flush_handler(partial(clear_boto3_cache, session))
+    if args.merge_shard_paths:
+        merge_shards(args, session)
+        return
+
+    if available_service_names is None:
+        with MemoryProfiler.measure("boto3", "discover"):
+            available_service_names = get_available_service_names(session)
+
+    logger.info(f"{len(available_service_names)} supported boto3 services discovered")
     if args.list_services:
         for service_name in available_service_names:
             print(
@@ -76,48 +198,199 @@ def main() -> None:
             )
         return
 
-    selected_service_names = args.service_names or [i.name for i in available_service_names]
+    selected_service_names = select_service_names(args, available_service_names)
+    service_names = selected_service_names
+    if args.shard:
+        service_names = get_shard_service_names(args, selected_service_names, session)
+
+    build_version = args.build_version or boto3_version
+    prepare_build(args, build_version)
+
+    service_summaries: List[ServiceSummary] = []
+    with open_output(args.output_path):
+        if args.generate_docs:
+            generate_docs(args, service_names, session)
+        else:
+            service_summaries = generate_stubs(args, service_names, session)
+
+    if args.shard:
+        index, count = args.shard
+        shard_manifest = ShardManifest(
+            index=index,
+            count=count,
+            build_version=build_version,
+            service_names=[i.name for i in selected_service_names],
+            service_summaries=service_summaries,
+        )
+        shard_manifest_path = ShardManifest.get_path(args.output_path, index, count)
+        shard_manifest.save(shard_manifest_path)
+        logger.info(f"Shard manifest saved to {NicePath(shard_manifest_path)}")
+
+    logger.info("Completed")
+
+    if args.watch:
+        watch_services(args, service_names, session, service_summaries)
+
+
+def select_service_names(
+    args: Namespace, available_service_names: List[ServiceName]
+) -> List[ServiceName]:
+    """
+    Get services selected by `--services` and `--from-source` arguments.
+
+    Arguments:
+        args -- Config namespace
+        available_service_names -- Discovered service names
 
+    Returns:
+        A list of service names in build order.
+    """
+    logger = get_logger()
+    available_service_names_set = {i.name for i in available_service_names}
+    selected_service_names = args.service_names or [i.name for i in available_service_names]
+    result: List[ServiceName] = []
     for service_name_str in selected_service_names:
         if service_name_str not in available_service_names_set:
             logger.info(f"Service {service_name_str} is not provided by boto3, skipping")
             continue
 
-        service_name = ServiceNameCatalog.find(service_name_str)
-        service_names.append(service_name)
+        result.append(ServiceNameCatalog.find(service_name_str))
 
-    build_version = args.build_version or boto3_version
-    min_build_version = get_min_build_version(build_version)
-    botocore_build_version = botocore_version
-    if args.build_version and ".post" in args.build_version:
-        post_release = args.build_version.split(".post")[-1]
-        botocore_build_version = f"{botocore_version}.post{post_release}"
-    JinjaManager.update_globals(
-        master_pypi_name=PYPI_NAME,
-        master_module_name=MODULE_NAME,
-        boto3_stubs_name=BOTO3_STUBS_NAME,
-        boto3_version=boto3_version,
-        botocore_version=botocore_version,
-        build_version=build_version,
-        min_build_version=min_build_version,
-        botocore_build_version=botocore_build_version,
-        builder_version=args.builder_version,
-        get_anchor_link=get_anchor_link,
-        render_docstrings=True,
-        hasattr=hasattr,
+    if args.from_source_paths:
+        result = get_used_service_names(args.from_source_paths, result)
+        used_names_str = ", ".join(i.name for i in result)
+        logger.info(f"{len(result)} services used in source: {used_names_str}")
+
+    return result
+
+
+def get_shard_service_names(
+    args: Namespace, service_names: List[ServiceName], session: Session
+) -> List[ServiceName]:
+    """
+    Get services of `--shard`, shards have close estimated build cost.
+
+    Arguments:
+        args -- Config namespace
+        service_names -- Services of the whole build
+        session -- Botocore session
+
+    Returns:
+        A list of shard service names in build order.
+    """
+    logger = get_logger()
+    index, count = args.shard or (1, 1)
+    durations: Dict[str, float] = {}
+    if args.cost_report_path:
+        try:
+            durations = load_report_durations(args.cost_report_path)
+        except ValueError as e:
+            logger.warning(f"{e}, service model sizes are used as costs")
+
+    with MemoryProfiler.measure("boto3", "estimate"):
+        costs = get_service_costs(session, service_names, durations)
+
+    result = partition_by_cost(service_names, costs, count)[index - 1]
+    shard_cost = sum(costs[service_names.index(i)] for i in result)
+    logger.info(
+        f"Shard {index}/{count}: {len(result)} of {len(service_names)} services,"
+        f" estimated cost {shard_cost:.1f} of {sum(costs):.1f}"
     )
+    return result
+
+
+def prepare_build(args: Namespace, build_version: str) -> None:
+    """
+    Set up caches, writers and templates for `build_version`.
+
+    Arguments:
+        args -- Config namespace
+        build_version -- Output packages version
+    """
+    if args.cache_path:
+        JinjaManager.set_bytecode_cache_path(args.cache_path / "jinja2")
+    FileWriter.build_wheels = args.wheel
+    WheelFileWriter.generator = f"mypy-boto3-builder ({args.builder_version})"
+    set_template_globals(build_version, args.builder_version)
+
+    get_logger().info(f"Bulding version {build_version}")
+
+
+def merge_shards(args: Namespace, session: Session) -> None:
+    """
+    Generate master and stubs packages from shard manifests without parsing services.
 
-    logger.info(f"Bulding version {build_version}")
+    Arguments:
+        args -- Config namespace
+        session -- Botocore session
 
-    if args.generate_docs:
-        generate_docs(args, service_names, session)
-    else:
-        generate_stubs(args, service_names, session)
+    Raises:
+        ShardMergeError -- If shard manifests are not from one complete build.
+    """
+    logger = get_logger()
+    shard_manifest_paths = ShardManifest.find_paths(args.merge_shard_paths)
+    build_version, service_summaries = ShardManifest.merge(
+        ShardManifest.load(i) for i in shard_manifest_paths
+    )
+    if args.build_version and args.build_version != build_version:
+        raise ShardMergeError(f"Shards are built for version {build_version}")
+
+    service_names = [i.service_name for i in service_summaries]
+    logger.info(f"Merging {len(shard_manifest_paths)} shards with {len(service_names)} services")
+    prepare_build(args, build_version)
+    with open_output(args.output_path):
+        generate_master_stubs(args, service_names, session, service_summaries)
+
+        logger.info(f"Generating {BOTOCORE_STUBS_NAME} module")
+        process_botocore_stubs(
+            args.output_path,
+            generate_setup=not args.installed,
+        )
 
     logger.info("Completed")
 
 
-def generate_stubs(args: Namespace, service_names: List[ServiceName], session: Session) -> None:
+@contextmanager
+def open_output(output_path: Path) -> Iterator[Sink]:
+    """
+    Open output sink as `FileWriter.sink` and save output manifest on success.
+
+    Arguments:
+        output_path -- Output directory or archive path.
+    """
+    manifest = Manifest.load(output_path)
+    try:
+        with get_output_sink(output_path) as sink:
+            FileWriter.sink = sink
+            yield sink
+        manifest.save()
+    finally:
+        FileWriter.sink = DirectorySink()
+        Manifest.unload(output_path)
+
+
+def get_allowed_operation_names(args: Namespace) -> Optional[Set[str]]:
+    """
+    Get client operations, paginators and waiters to keep in service packages.
+
+    Arguments:
+        args -- Config namespace
+
+    Returns:
+        A set of names or None to keep everything.
+    """
+    if args.operation_names is None and not args.shake_operations:
+        return None
+
+    result = set(args.operation_names or [])
+    if args.shake_operations:
+        result.update(get_used_operation_names(args.from_source_paths))
+    return result
+
+
+def generate_stubs(
+    args: Namespace, service_names: List[ServiceName], session: Session
+) -> List[ServiceSummary]:
     """
     Generate service and master stubs.
 
@@ -125,46 +398,172 @@ def generate_stubs(args: Namespace, service_names: List[ServiceName], session: S
         args -- Config namespace
         service_names -- Enabled service names
         session -- Botocore session
+
+    Returns:
+        Summaries of generated service packages.
     """
     logger = get_logger()
+    result: List[ServiceSummary] = []
+    common_package: Optional[CommonPackage] = None
+    if args.shared_types and not args.skip_services:
+        logger.info(f"Generating {COMMON_MODULE_NAME} module")
+        common_package = process_common(
+            session,
+            args.output_path,
+            service_names,
+            generate_setup=not args.installed,
+        )
+
     if not args.skip_services:
+        operation_names = get_allowed_operation_names(args)
         total_str = f"{len(service_names)}"
         for index, service_name in enumerate(service_names):
             current_str = f"{{:0{len(total_str)}}}".format(index + 1)
             logger.info(f"[{current_str}/{total_str}] Generating {service_name.module_name} module")
-            service_name.boto3_version = boto3_version
-            process_service(
-                session=session,
-                output_path=args.output_path,
-                service_name=service_name,
-                generate_setup=not args.installed,
+            result.append(
+                generate_service_stubs(args, service_name, session, common_package, operation_names)
             )
-            service_name.boto3_version = ServiceName.LATEST
 
-    if not args.skip_master:
-        if not args.installed:
-            logger.info(f"Generating {MODULE_NAME} module")
-            process_master(
-                session,
-                args.output_path,
-                service_names,
-                generate_setup=not args.installed,
-            )
+    if not args.skip_master and not args.shard:
+        # summaries of written packages match them, for example with --operations
+        generate_master_stubs(args, service_names, session, None if args.skip_services else result)
 
-        logger.info(f"Generating {BOTO3_STUBS_NAME} module")
-        process_boto3_stubs(
-            session,
+        logger.info(f"Generating {BOTOCORE_STUBS_NAME} module")
+        process_botocore_stubs(
             args.output_path,
-            service_names,
             generate_setup=not args.installed,
         )
 
-        logger.info(f"Generating {BOTOCORE_STUBS_NAME} module")
-        process_botocore_stubs(
+    return result
+
+
+def generate_service_stubs(
+    args: Namespace,
+    service_name: ServiceName,
+    session: Session,
+    common_package: Optional[CommonPackage] = None,
+    operation_names: Optional[Set[str]] = None,
+) -> ServiceSummary:
+    """
+    Generate service stubs package.
+
+    Arguments:
+        args -- Config namespace
+        service_name -- Target service name
+        session -- Botocore session
+        common_package -- Package with shared types
+        operation_names -- Client operations, paginators and waiters to keep
+
+    Returns:
+        Generated package summary.
+    """
+    service_name.boto3_version = boto3_version
+    try:
+        return process_service(
+            session=session,
+            output_path=args.output_path,
+            service_name=service_name,
+            generate_setup=not args.installed,
+            common_package=common_package,
+            split_type_defs=args.split_type_defs,
+            light_runtime_types=args.light_runtime_types,
+            operation_names=operation_names,
+        )
+    finally:
+        service_name.boto3_version = ServiceName.LATEST
+
+
+def generate_master_stubs(
+    args: Namespace,
+    service_names: List[ServiceName],
+    session: Session,
+    service_summaries: Optional[Sequence[ServiceSummary]] = None,
+) -> None:
+    """
+    Generate master and boto3-stubs packages that depend on service summaries.
+
+    Arguments:
+        args -- Config namespace
+        service_names -- Enabled service names
+        session -- Botocore session
+        service_summaries -- Already built service summaries, parsed by default
+    """
+    logger = get_logger()
+    if not args.installed:
+        logger.info(f"Generating {MODULE_NAME} module")
+        process_master(
+            session,
             args.output_path,
+            service_names,
             generate_setup=not args.installed,
+            service_summaries=service_summaries,
         )
 
+    logger.info(f"Generating {BOTO3_STUBS_NAME} module")
+    process_boto3_stubs(
+        session,
+        args.output_path,
+        service_names,
+        generate_setup=not args.installed,
+        essential_overloads_first=args.essential_overloads_first,
+        service_summaries=service_summaries,
+        compact_overloads=args.compact_overloads,
+    )
+
+
+def watch_services(
+    args: Namespace,
+    service_names: List[ServiceName],
+    session: Session,
+    service_summaries: Iterable[ServiceSummary],
+) -> None:
+    """
+    Regenerate service packages when their models change in loader search paths.
+
+    Master and boto3-stubs packages are regenerated only if a service summary changes.
+    Runs until interrupted.
+
+    Arguments:
+        args -- Config namespace
+        service_names -- Enabled service names
+        session -- Botocore session
+        service_summaries -- Summaries of already generated service packages
+    """
+    logger = get_logger()
+    summaries: Dict[str, ServiceSummary] = {i.service_name.name: i for i in service_summaries}
+    operation_names = get_allowed_operation_names(args)
+    loader = session._session.get_component("data_loader")  # type: ignore
+    watcher = ServiceModelWatcher(loader.search_paths, service_names)
+    mode = "polling" if watcher.is_polling else "inotify"
+    logger.info(f"Watching {len(service_names)} service models with {mode}, press Ctrl+C to stop")
+    try:
+        while True:
+            changed_service_names = watcher.wait()
+            clear_boto3_cache(session, clear_listings=True)
+            is_master_changed = False
+            with open_output(args.output_path):
+                for service_name in changed_service_names:
+                    logger.info(f"Model changed, generating {service_name.module_name} module")
+                    try:
+                        summary = generate_service_stubs(
+                            args, service_name, session, operation_names=operation_names
+                        )
+                    except Exception as e:
+                        logger.error(f"Cannot generate {service_name.module_name} module: {e}")
+                        continue
+                    if summaries.get(service_name.name) != summary:
+                        summaries[service_name.name] = summary
+                        is_master_changed = True
+                if is_master_changed and not args.skip_master:
+                    generate_master_stubs(
+                        args, service_names, session, [summaries[i.name] for i in service_names]
+                    )
+            logger.info("Completed")
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
+    finally:
+        watcher.close()
+
 
 def generate_docs(args: Namespace, service_names: List[ServiceName], session: Session) -> None:
     """
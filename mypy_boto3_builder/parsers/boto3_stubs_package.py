@@ -1,28 +1,60 @@
 """
 Parser that produces `structures.Boto3StubsPackage`.
 """
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 
 from boto3.session import Session
 from botocore.config import Config
 
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.import_helpers.import_string import ImportString
-from mypy_boto3_builder.parsers.fake_service_package import parse_fake_service_package
+from mypy_boto3_builder.parsers.service_summary import parse_service_summary
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.argument import Argument
 from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
 from mypy_boto3_builder.structures.function import Function
 from mypy_boto3_builder.structures.method import Method
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
 from mypy_boto3_builder.type_annotations.external_import import ExternalImport
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
+from mypy_boto3_builder.type_annotations.internal_import import InternalImport
 from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.type_annotations.type_class import TypeClass
 from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
 from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+CLIENT_KWARGS_NAME = "_ClientKwargs"
+
+
+def _get_overload_sort_key(service_summary: ServiceSummary) -> Tuple[int, int]:
+    service_name = service_summary.service_name
+    if service_name.is_essential():
+        return (0, ServiceName.ESSENTIAL.index(service_name.name))
+    return (1, 0)
+
+
+def _get_compact_arguments(
+    init_arguments: List[Argument], kwargs_annotation: FakeAnnotation
+) -> List[Argument]:
+    return [
+        init_arguments[0],
+        Argument(
+            "kwargs",
+            TypeSubscript(
+                ExternalImport(ImportString("typing_extensions"), "Unpack"), [kwargs_annotation]
+            ),
+            prefix="**",
+        ),
+    ]
 
 
 def parse_boto3_stubs_package(
-    session: Session, service_names: List[ServiceName]
+    session: Session,
+    service_names: List[ServiceName],
+    essential_overloads_first: bool = False,
+    service_summaries: Optional[Sequence[ServiceSummary]] = None,
+    compact_overloads: bool = False,
 ) -> Boto3StubsPackage:
     """
     Parse data for boto3_stubs package.
@@ -30,13 +62,27 @@ def parse_boto3_stubs_package(
     Arguments:
         session -- boto3 session.
         service_names -- All available service names.
+        essential_overloads_first -- Put `client` and `resource` overloads for essential
+            services first, type checkers stop at the first matching overload.
+            Other overloads are gated, so type checkers can skip them.
+        service_summaries -- Already built summaries for `service_names`, parsed by default.
+        compact_overloads -- Keep only `region_name` in `client` and `resource` overloads
+            and pass other arguments as `**kwargs` unpacked from a shared TypedDict,
+            so type checkers match fewer parameters per overload.
 
     Returns:
         Boto3StubsPackage structure.
     """
     result = Boto3StubsPackage(service_names=service_names)
-    for service_name in result.service_names:
-        result.service_packages.append(parse_fake_service_package(session, service_name))
+    if service_summaries is not None:
+        result.service_summaries.extend(service_summaries)
+    else:
+        for service_name in result.service_names:
+            result.service_summaries.append(parse_service_summary(session, service_name))
+
+    service_summaries = result.service_summaries
+    if essential_overloads_first:
+        service_summaries = sorted(service_summaries, key=_get_overload_sort_key)
 
     init_arguments = [
         Argument("region_name", TypeSubscript(Type.Optional, [Type.str]), Type.none),
@@ -49,16 +95,29 @@ def parse_boto3_stubs_package(
         Argument("aws_session_token", TypeSubscript(Type.Optional, [Type.str]), Type.none),
         Argument("config", TypeSubscript(Type.Optional, [TypeClass(Config)]), Type.none),
     ]
+    function_arguments = init_arguments
+    method_arguments = init_arguments
+    if compact_overloads:
+        result.client_kwargs = TypeTypedDict(CLIENT_KWARGS_NAME)
+        for argument in init_arguments[1:]:
+            assert argument.type_annotation
+            result.client_kwargs.add_attribute(argument.name, argument.type_annotation, False)
+        function_arguments = _get_compact_arguments(
+            init_arguments, ExternalImport(ImportString("boto3", "session"), CLIENT_KWARGS_NAME)
+        )
+        method_arguments = _get_compact_arguments(
+            init_arguments, InternalImport(CLIENT_KWARGS_NAME, stringify=False)
+        )
 
     client_function_decorators = []
-    if len(result.service_packages) > 1:
+    if len(service_summaries) > 1:
         client_function_decorators.append(Type.overload)
-    for service_package in result.service_packages:
+    for service_summary in service_summaries:
         service_argument = Argument(
             "service_name",
             TypeLiteral(
-                service_package.service_name.class_name + "Type",
-                [service_package.service_name.boto3_name],
+                service_summary.service_name.class_name + "Type",
+                [service_summary.service_name.boto3_name],
             ),
         )
         client_function = Function(
@@ -67,18 +126,23 @@ def parse_boto3_stubs_package(
             docstring="",
             arguments=[
                 service_argument,
-                *init_arguments,
+                *function_arguments,
             ],
             return_type=ExternalImport(
                 source=ImportString(
-                    service_package.service_name.module_name, ServiceModuleName.client.value
+                    service_summary.service_name.module_name, ServiceModuleName.client.value
                 ),
-                name=service_package.client.name,
+                name=service_summary.client_name,
             ),
             body_lines=["..."],
         )
-        result.init_functions.append(client_function)
-        result.session_class.methods.append(
+        init_functions = result.init_functions
+        session_methods = result.session_class.methods
+        if essential_overloads_first and not service_summary.service_name.is_essential():
+            init_functions = result.gated_init_functions
+            session_methods = result.gated_session_methods
+        init_functions.append(client_function)
+        session_methods.append(
             Method(
                 name="client",
                 decorators=client_function_decorators,
@@ -86,29 +150,29 @@ def parse_boto3_stubs_package(
                 arguments=[
                     Argument("self", None),
                     service_argument,
-                    *init_arguments,
+                    *method_arguments,
                 ],
                 return_type=ExternalImport(
                     source=ImportString(
-                        service_package.service_name.module_name, ServiceModuleName.client.value
+                        service_summary.service_name.module_name, ServiceModuleName.client.value
                     ),
-                    name=service_package.client.name,
+                    name=service_summary.client_name,
                 ),
                 body_lines=["..."],
             )
         )
 
-    service_resource_packages = [i for i in result.service_packages if i.service_resource]
+    service_resource_summaries = [i for i in service_summaries if i.has_service_resource]
     resource_function_decorators = []
-    if len(service_resource_packages) > 1:
+    if len(service_resource_summaries) > 1:
         resource_function_decorators.append(Type.overload)
-    for service_package in service_resource_packages:
-        assert service_package.service_resource
+    for service_summary in service_resource_summaries:
+        assert service_summary.service_resource_name
         service_argument = Argument(
             "service_name",
             TypeLiteral(
-                service_package.service_name.class_name + "Type",
-                [service_package.service_name.boto3_name],
+                service_summary.service_name.class_name + "Type",
+                [service_summary.service_name.boto3_name],
             ),
         )
         resource_function = Function(
@@ -117,19 +181,24 @@ def parse_boto3_stubs_package(
             docstring="",
             arguments=[
                 service_argument,
-                *init_arguments,
+                *function_arguments,
             ],
             return_type=ExternalImport(
                 source=ImportString(
-                    service_package.service_name.module_name,
+                    service_summary.service_name.module_name,
                     ServiceModuleName.service_resource.value,
                 ),
-                name=service_package.service_resource.name,
+                name=service_summary.service_resource_name,
             ),
             body_lines=["..."],
         )
-        result.init_functions.append(resource_function)
-        result.session_class.methods.append(
+        init_functions = result.init_functions
+        session_methods = result.session_class.methods
+        if essential_overloads_first and not service_summary.service_name.is_essential():
+            init_functions = result.gated_init_functions
+            session_methods = result.gated_session_methods
+        init_functions.append(resource_function)
+        session_methods.append(
             Method(
                 name="resource",
                 decorators=resource_function_decorators,
@@ -137,14 +206,14 @@ def parse_boto3_stubs_package(
                 arguments=[
                     Argument("self", None),
                     service_argument,
-                    *init_arguments,
+                    *method_arguments,
                 ],
                 return_type=ExternalImport(
                     source=ImportString(
-                        service_package.service_name.module_name,
+                        service_summary.service_name.module_name,
                         ServiceModuleName.service_resource.value,
                     ),
-                    name=service_package.service_resource.name,
+                    name=service_summary.service_resource_name,
                 ),
                 body_lines=["..."],
             )
@@ -10,6 +10,9 @@ from botocore.client import BaseClient
 
 from mypy_boto3_builder.service_name import ServiceName
 
+# Botocore loader methods that cache loaded model data
+LOADER_MODEL_METHOD_NAMES = {"load_data", "load_data_with_path", "load_service_model"}
+
 
 def get_boto3_client(session: Session, service_name: ServiceName) -> BaseClient:
     """
@@ -42,3 +45,25 @@ def get_boto3_resource(
         return session.resource(service_name.boto3_name)  # type: ignore
     except ResourceNotExistsError:
         return None
+
+
+def clear_boto3_cache(session: Session, clear_listings: bool = False) -> None:
+    """
+    Drop service models, client exception classes and event handler lookups cached by `session`.
+
+    Botocore keeps every loaded model and every emitted event name for the session lifetime,
+    they are loaded again on the next access. Cached data path listings are kept by default.
+
+    Arguments:
+        session -- boto3 session.
+        clear_listings -- Whether to drop cached service and API version listings too.
+    """
+    botocore_session = session._session  # type: ignore
+    loader_cache = botocore_session.get_component("data_loader")._cache
+    for key in [i for i in loader_cache if clear_listings or i[0] in LOADER_MODEL_METHOD_NAMES]:
+        del loader_cache[key]
+    exceptions_factory = botocore_session._get_internal_component("exceptions_factory")
+    exceptions_factory._client_exceptions_cache.clear()
+    events = botocore_session.get_component("event_emitter")
+    events._alias_name_cache.clear()
+    events._emitter._lookup_cache.clear()
@@ -0,0 +1,68 @@
+"""
+Parser that produces `structures.CommonPackage`.
+"""
+from typing import Dict, Iterable, List, Set, Tuple, TypeVar, Union
+
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.common_package import CommonPackage
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+_T = TypeVar("_T", bound=Union[TypeTypedDict, TypeLiteral])
+
+_Variants = Dict[str, List[Tuple[_T, Set[ServiceName]]]]
+
+
+def _add_variant(variants: _Variants[_T], item: _T, service_name: ServiceName) -> None:
+    for variant, service_names in variants.setdefault(item.name, []):
+        if variant.is_same(item):  # type: ignore
+            service_names.add(service_name)
+            return
+
+    variants[item.name].append((item, {service_name}))
+
+
+def _get_shared_variants(variants: _Variants[_T]) -> List[_T]:
+    result: List[_T] = []
+    for name_variants in variants.values():
+        variant, service_names = max(name_variants, key=lambda x: len(x[1]))
+        if len(service_names) < 2:
+            continue
+        result.append(variant)
+
+    result.sort()
+    return result
+
+
+def parse_common_package(service_packages: Iterable[ServicePackage]) -> CommonPackage:
+    """
+    Find TypedDicts and Literals that are structurally the same in two or more services.
+
+    For every name the variant used by the most services is picked. TypedDicts that
+    refer to non-shared types are left in service packages.
+
+    Arguments:
+        service_packages -- Parsed service packages, consumed one by one.
+
+    Returns:
+        CommonPackage structure.
+    """
+    typed_dict_variants: _Variants[TypeTypedDict] = {}
+    literal_variants: _Variants[TypeLiteral] = {}
+    service_names: List[ServiceName] = []
+    for service_package in service_packages:
+        service_names.append(service_package.service_name)
+        for typed_dict in service_package.typed_dicts:
+            _add_variant(typed_dict_variants, typed_dict, service_package.service_name)
+        for literal in service_package.literals:
+            _add_variant(literal_variants, literal, service_package.service_name)
+
+    result = CommonPackage(
+        service_names=service_names,
+        typed_dicts=_get_shared_variants(typed_dict_variants),
+        literals=_get_shared_variants(literal_variants),
+    )
+    shared_names = result.get_shared_names(result.typed_dicts, result.literals)
+    result.typed_dicts = [i for i in result.typed_dicts if i.name in shared_names]
+    return result
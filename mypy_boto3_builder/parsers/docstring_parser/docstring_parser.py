@@ -15,6 +15,7 @@ from mypy_boto3_builder.parsers.docstring_parser.type_value import TypeValue
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.argument import Argument
 from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
+from mypy_boto3_builder.type_annotations.internal_import import AliasInternalImport
 from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
 from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
@@ -36,6 +37,10 @@ class DocstringParser:
 
     # Regexp to parse `:param <name>` definitions
     RE_PARAM: Pattern[str] = re.compile("\n:param ")
+    # Regexp to parse resource `:rtype:` that is missing in docstring type map
+    RE_RESOURCE_RTYPE: Pattern[str] = re.compile(
+        r"^(?P<list>list\()?:py:class:`\w+\.(?P<name>\w+)`(?(list)\))$"
+    )
 
     def __init__(
         self,
@@ -244,7 +249,20 @@ class DocstringParser:
 
         match_dict: Dict[str, str] = match.asDict()  # type: ignore
         type_name = match_dict["type_name"]
-        return get_type_from_docstring(type_name)
+        try:
+            return get_type_from_docstring(type_name)
+        except ValueError:
+            return self._get_resource_rtype(type_name)
+
+    def _get_resource_rtype(self, type_name: str) -> FakeAnnotation:
+        resource_match = self.RE_RESOURCE_RTYPE.match(type_name)
+        if not resource_match:
+            raise ValueError(f"Unknown type: {type_name}")
+
+        result = AliasInternalImport(resource_match.group("name"), self.service_name)
+        if resource_match.group("list"):
+            return TypeSubscript(Type.List, [result])
+        return result
 
     def _parse_response_syntax(self, input_string: str) -> Optional[FakeAnnotation]:
         if "**Response Syntax**" not in input_string:
@@ -1,28 +1,37 @@
 """
 Parser that produces `structures.MasterPackage`.
 """
-from typing import List
+from typing import List, Optional, Sequence
 
 from boto3.session import Session
 
-from mypy_boto3_builder.parsers.fake_service_package import parse_fake_service_package
+from mypy_boto3_builder.parsers.service_summary import parse_service_summary
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.master_package import MasterPackage
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
 
 
-def parse_master_package(session: Session, service_names: List[ServiceName]) -> MasterPackage:
+def parse_master_package(
+    session: Session,
+    service_names: List[ServiceName],
+    service_summaries: Optional[Sequence[ServiceSummary]] = None,
+) -> MasterPackage:
     """
     Parse data for master package.
 
     Arguments:
         session -- boto3 session.
         service_names -- All available service names.
+        service_summaries -- Already built summaries for `service_names`, parsed by default.
 
     Returns:
         MasterPackage structure.
     """
     result = MasterPackage(service_names=service_names)
-    for service_name in result.service_names:
-        result.service_packages.append(parse_fake_service_package(session, service_name))
+    if service_summaries is not None:
+        result.service_summaries.extend(service_summaries)
+    else:
+        for service_name in result.service_names:
+            result.service_summaries.append(parse_service_summary(session, service_name))
 
     return result
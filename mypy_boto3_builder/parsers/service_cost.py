@@ -0,0 +1,65 @@
+"""
+Build cost estimate for service packages.
+"""
+from typing import List, Mapping, Optional, Sequence
+
+from boto3.session import Session
+
+from mypy_boto3_builder.parsers.boto3_utils import clear_boto3_cache
+from mypy_boto3_builder.service_name import ServiceName
+
+
+def get_service_cost(session: Session, service_name: ServiceName) -> int:
+    """
+    Estimate service package build cost from service model size.
+
+    Parse and write time grows with the number of operations and shapes,
+    so their sum is used as a unitless cost.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+
+    Returns:
+        Estimated cost.
+    """
+    service_model = session._loader.load_service_model(  # type: ignore
+        service_name.boto3_name, "service-2"
+    )
+    return len(service_model.get("operations", {})) + len(service_model.get("shapes", {}))
+
+
+def get_service_costs(
+    session: Session,
+    service_names: Sequence[ServiceName],
+    durations: Optional[Mapping[str, float]] = None,
+) -> List[float]:
+    """
+    Estimate build cost of services.
+
+    Services measured in a previous run use their `durations`. Model size costs of
+    other services are scaled to seconds with the ratio of measured services, so all
+    costs are comparable. Models are not loaded if all services are measured.
+
+    Arguments:
+        session -- boto3 session.
+        service_names -- Target service names.
+        durations -- Build durations in seconds from a previous run by service name.
+
+    Returns:
+        Estimated cost for each service.
+    """
+    durations = durations or {}
+    measured = [durations.get(i.name) for i in service_names]
+    if all(i is not None for i in measured):
+        return [i or 0.0 for i in measured]
+
+    model_costs: List[float] = []
+    for service_name in service_names:
+        model_costs.append(get_service_cost(session, service_name))
+        clear_boto3_cache(session)
+
+    measured_duration = sum(i or 0.0 for i in measured)
+    measured_model_cost = sum(c for i, c in zip(measured, model_costs) if i is not None)
+    scale = measured_duration / measured_model_cost if measured_model_cost else 1.0
+    return [c * scale if i is None else i for i, c in zip(measured, model_costs)]
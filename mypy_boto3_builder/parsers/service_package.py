@@ -2,7 +2,7 @@
 Parser that produces `structures.ServiceModule`.
 """
 
-from typing import List
+from typing import Iterable, List, Optional, Set
 
 from boto3.session import Session
 from botocore import xform_name
@@ -12,18 +12,52 @@ from mypy_boto3_builder.parsers.client import parse_client
 from mypy_boto3_builder.parsers.service_resource import parse_service_resource
 from mypy_boto3_builder.parsers.shape_parser import ShapeParser
 from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.argument import Argument
+from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.method import Method
 from mypy_boto3_builder.structures.paginator import Paginator
 from mypy_boto3_builder.structures.service_package import ServicePackage
 from mypy_boto3_builder.structures.waiter import Waiter
+from mypy_boto3_builder.type_annotations.type import Type
 
 
-def parse_service_package(session: Session, service_name: ServiceName) -> ServicePackage:
+def _shake_client_methods(client: Client, operation_names: Set[str]) -> None:
+    """
+    Remove client operation methods that are not in `operation_names`.
+
+    Removed methods are covered by a generic `__getattr__` fallback, it is not added
+    if all methods are kept, so misspelled method names are still reported.
+    """
+    service_model = client.boto3_client.meta.service_model
+    all_operation_names = {xform_name(i) for i in service_model.operation_names}
+    methods = [
+        i for i in client.methods if i.name not in all_operation_names or i.name in operation_names
+    ]
+    if len(methods) == len(client.methods):
+        return
+    client.methods = methods
+    client.methods.append(
+        Method(
+            name="__getattr__",
+            arguments=[Argument("self", None), Argument("name", Type.str)],
+            return_type=Type.Any,
+            docstring="Fallback for operations removed by tree shaking.",
+        )
+    )
+
+
+def parse_service_package(
+    session: Session,
+    service_name: ServiceName,
+    operation_names: Optional[Iterable[str]] = None,
+) -> ServicePackage:
     """
     Extract all data from boto3 service package.
 
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
+        operation_names -- Client operations, paginators and waiters to keep, all by default.
 
     Returns:
         ServiceModule structure.
@@ -33,6 +67,11 @@ def parse_service_package(session: Session, service_name: ServiceName) -> Servic
     shape_parser = ShapeParser(session, service_name)
     logger.debug("Parsing Client")
     client = parse_client(session, service_name, shape_parser)
+    allowed_names: Optional[Set[str]] = None
+    if operation_names is not None:
+        allowed_names = {xform_name(i) for i in operation_names}
+        _shake_client_methods(client, allowed_names)
+
     service_resource = parse_service_resource(session, service_name, shape_parser)
 
     result = ServicePackage(
@@ -47,6 +86,11 @@ def parse_service_package(session: Session, service_name: ServiceName) -> Servic
     for waiter_name in waiter_names:
         logger.debug(f"Parsing Waiter {waiter_name}")
         waiter = client.boto3_client.get_waiter(waiter_name)
+        if allowed_names is not None and not allowed_names & {
+            waiter_name,
+            xform_name(waiter.config.operation),
+        }:
+            continue
         waiter_record = Waiter(
             name=f"{waiter.name}Waiter",
             waiter_name=waiter_name,
@@ -66,6 +110,8 @@ def parse_service_package(session: Session, service_name: ServiceName) -> Servic
     for paginator_name in shape_parser.get_paginator_names():
         logger.debug(f"Parsing Paginator {paginator_name}")
         operation_name = xform_name(paginator_name)
+        if allowed_names is not None and operation_name not in allowed_names:
+            continue
         # boto3_paginator = client.boto3_client.get_paginator(operation_name)
         paginator_record = Paginator(
             name=f"{paginator_name}Paginator",
@@ -104,6 +150,7 @@ def parse_service_package(session: Session, service_name: ServiceName) -> Servic
                 method = package_waiter.get_client_method()
                 result.client.methods.append(method)
 
+    result.freeze_types()
     result.typed_dicts = result.extract_typed_dicts()
     result.literals = result.extract_literals()
     result.validate()
@@ -0,0 +1,48 @@
+"""
+Parser that produces `structures.ServiceSummary` for master and boto3-stubs packages.
+"""
+from typing import Any, Mapping, Optional
+
+from boto3.session import Session
+from botocore.exceptions import UnknownServiceError
+
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
+
+
+def _load_service_model(
+    session: Session, service_name: ServiceName, type_name: str
+) -> Optional[Mapping[str, Any]]:
+    try:
+        return session._loader.load_service_model(  # type: ignore
+            service_name.boto3_name, type_name
+        )
+    except UnknownServiceError:
+        return None
+
+
+def parse_service_summary(session: Session, service_name: ServiceName) -> ServiceSummary:
+    """
+    Parse service summary from waiters, paginators and resources models.
+
+    Service model is not loaded and no boto3 client or resource is created.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+
+    Returns:
+        ServiceSummary structure.
+    """
+    waiters_shape = _load_service_model(session, service_name, "waiters-2")
+    paginators_shape = _load_service_model(session, service_name, "paginators-1")
+    resources_shape = _load_service_model(session, service_name, "resources-1")
+    return ServiceSummary(
+        service_name=service_name,
+        client_name=f"{service_name.class_name}Client",
+        service_resource_name=(
+            f"{service_name.class_name}ServiceResource" if resources_shape is not None else None
+        ),
+        has_waiters=bool(waiters_shape and waiters_shape.get("waiters")),
+        has_paginators=bool(paginators_shape and paginators_shape.get("pagination")),
+    )
@@ -0,0 +1,163 @@
+"""
+Parser for service names used in user source code.
+"""
+import ast
+from pathlib import Path
+from typing import Iterable, Iterator, List, Set
+
+from mypy_boto3_builder.constants import MODULE_NAME
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.service_name import ServiceName
+
+SERVICE_FACTORY_NAMES = ("client", "resource")
+OPERATION_FACTORY_NAMES = ("get_paginator", "get_waiter", "can_paginate")
+
+
+class UsedServicesVisitor(ast.NodeVisitor):
+    """
+    AST visitor that collects boto3 service names and `mypy_boto3_*` module names.
+
+    Finds `boto3.client("name")`, `boto3.resource("name")`, `Session().client("name")`
+    and imports of service modules. Names of all called methods and string arguments
+    of `get_paginator` and `get_waiter` calls are collected as possible operation names.
+    """
+
+    def __init__(self) -> None:
+        self.service_names: Set[str] = set()
+        self.module_names: Set[str] = set()
+        self.operation_names: Set[str] = set()
+
+    @staticmethod
+    def _get_name_argument(node: ast.Call, keyword_name: str) -> ast.AST:
+        for keyword in node.keywords:
+            if keyword.arg == keyword_name:
+                return keyword.value
+        if node.args:
+            return node.args[0]
+        return ast.Pass()
+
+    @staticmethod
+    def _get_string(node: ast.AST) -> str:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        return ""
+
+    def _add_module_name(self, import_name: str) -> None:
+        module_name = import_name.split(".")[0]
+        if module_name.startswith(f"{MODULE_NAME}_"):
+            self.module_names.add(module_name)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """
+        Collect string service name from `client` and `resource` calls and operation names.
+        """
+        func_name = ""
+        if isinstance(node.func, ast.Attribute):
+            func_name = node.func.attr
+            self.operation_names.add(func_name)
+        if isinstance(node.func, ast.Name):
+            func_name = node.func.id
+        if func_name in SERVICE_FACTORY_NAMES:
+            service_name = self._get_string(self._get_name_argument(node, "service_name"))
+            if service_name:
+                self.service_names.add(service_name)
+        if func_name in OPERATION_FACTORY_NAMES:
+            operation_name = self._get_string(self._get_name_argument(node, "operation_name"))
+            operation_name = operation_name or self._get_string(
+                self._get_name_argument(node, "waiter_name")
+            )
+            if operation_name:
+                self.operation_names.add(operation_name)
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        """
+        Collect `import mypy_boto3_*` statements.
+        """
+        for alias in node.names:
+            self._add_module_name(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        """
+        Collect `from mypy_boto3_* import ...` statements.
+        """
+        if node.module and not node.level:
+            self._add_module_name(node.module)
+
+
+def iterate_source_paths(path: Path) -> Iterator[Path]:
+    """
+    Iterate over Python source files, hidden directories are skipped.
+
+    Arguments:
+        path -- Python file or directory.
+
+    Yields:
+        Python file path.
+    """
+    if path.is_file():
+        yield path
+        return
+
+    for source_path in sorted(path.glob("**/*.py")):
+        relative_parts = source_path.relative_to(path).parts
+        if any(i.startswith(".") for i in relative_parts):
+            continue
+        yield source_path
+
+
+def scan_sources(paths: Iterable[Path]) -> UsedServicesVisitor:
+    """
+    Parse Python sources and collect used names.
+
+    Arguments:
+        paths -- Python files or directories to scan.
+
+    Returns:
+        Visitor with collected names.
+    """
+    logger = get_logger()
+    visitor = UsedServicesVisitor()
+    for path in paths:
+        for source_path in iterate_source_paths(path):
+            try:
+                tree = ast.parse(source_path.read_bytes(), filename=source_path.as_posix())
+            except (SyntaxError, ValueError) as e:
+                logger.debug(f"Skipping {source_path}: {e}")
+                continue
+            visitor.visit(tree)
+    return visitor
+
+
+def get_used_operation_names(paths: Iterable[Path]) -> Set[str]:
+    """
+    Get possible client operation, paginator and waiter names used in Python sources.
+
+    Arguments:
+        paths -- Python files or directories to scan.
+
+    Returns:
+        A set of method names and `get_paginator`/`get_waiter` arguments.
+    """
+    return scan_sources(paths).operation_names
+
+
+def get_used_service_names(
+    paths: Iterable[Path], service_names: Iterable[ServiceName]
+) -> List[ServiceName]:
+    """
+    Get service names used in Python sources.
+
+    Arguments:
+        paths -- Python files or directories to scan.
+        service_names -- Available service names.
+
+    Returns:
+        A list of used service names in `service_names` order.
+    """
+    visitor = scan_sources(paths)
+    return [
+        i
+        for i in service_names
+        if i.boto3_name in visitor.service_names or i.module_name in visitor.module_names
+    ]
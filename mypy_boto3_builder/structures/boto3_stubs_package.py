@@ -2,37 +2,52 @@
 Structure for boto3-stubs module.
 """
 
-from typing import Iterable, List, Optional, Set
+from typing import Iterable, List, Optional, Sequence, Set, Tuple, TypeVar
 
-from mypy_boto3_builder.constants import BOTO3_STUBS_NAME
+from mypy_boto3_builder.constants import BOTO3_STUBS_NAME, ESSENTIAL_ONLY_NAME
 from mypy_boto3_builder.import_helpers.import_record import ImportRecord
 from mypy_boto3_builder.import_helpers.import_string import ImportString
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.class_record import ClassRecord
 from mypy_boto3_builder.structures.function import Function
+from mypy_boto3_builder.structures.method import Method
 from mypy_boto3_builder.structures.package import Package
-from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+_R = TypeVar("_R", bound=Function)
 
 
 class Boto3StubsPackage(Package):
     """
     Structure for boto3-stubs module.
+
+    Gated functions and session methods are rendered after regular ones with the same name
+    in a section that is skipped if type checker defines `essential_only_name` as true.
     """
 
+    essential_only_name = ESSENTIAL_ONLY_NAME
+
     def __init__(
         self,
         name: str = BOTO3_STUBS_NAME,
         pypi_name: str = BOTO3_STUBS_NAME,
         session_class: Optional[ClassRecord] = None,
         service_names: Iterable[ServiceName] = tuple(),
-        service_packages: Iterable[ServicePackage] = tuple(),
+        service_summaries: Iterable[ServiceSummary] = tuple(),
         init_functions: Iterable[Function] = tuple(),
+        client_kwargs: Optional[TypeTypedDict] = None,
+        gated_init_functions: Iterable[Function] = tuple(),
+        gated_session_methods: Iterable[Method] = tuple(),
     ):
         super().__init__(name=name, pypi_name=pypi_name)
         self.session_class = session_class or ClassRecord("Session")
         self.service_names = list(service_names)
-        self.service_packages = list(service_packages)
+        self.service_summaries = list(service_summaries)
         self.init_functions = list(init_functions)
+        self.client_kwargs = client_kwargs
+        self.gated_init_functions = list(gated_init_functions)
+        self.gated_session_methods = list(gated_session_methods)
 
     @property
     def essential_service_names(self) -> List[ServiceName]:
@@ -45,6 +60,34 @@ class Boto3StubsPackage(Package):
                 result.append(service_name)
         return result
 
+    @staticmethod
+    def _group_by_name(
+        functions: Sequence[_R], gated_functions: Sequence[_R]
+    ) -> List[Tuple[List[_R], List[_R]]]:
+        names: List[str] = []
+        for function in (*functions, *gated_functions):
+            if function.name not in names:
+                names.append(function.name)
+        return [
+            (
+                [i for i in functions if i.name == name],
+                [i for i in gated_functions if i.name == name],
+            )
+            for name in names
+        ]
+
+    def get_init_function_groups(self) -> List[Tuple[List[Function], List[Function]]]:
+        """
+        Get regular and gated `__init__.pyi` functions grouped by name.
+        """
+        return self._group_by_name(self.init_functions, self.gated_init_functions)
+
+    def get_session_method_groups(self) -> List[Tuple[List[Method], List[Method]]]:
+        """
+        Get regular and gated `Session` methods grouped by name.
+        """
+        return self._group_by_name(self.session_class.methods, self.gated_session_methods)
+
     def get_init_required_import_records(self) -> List[ImportRecord]:
         """
         Get import records for `__init__.py[i]`.
@@ -65,7 +108,7 @@ class Boto3StubsPackage(Package):
                 ),
             ]
         )
-        for init_function in self.init_functions:
+        for init_function in (*self.init_functions, *self.gated_init_functions):
             import_records.update(init_function.get_required_import_records())
 
         return list(sorted(import_records))
@@ -101,6 +144,21 @@ class Boto3StubsPackage(Package):
             ]
         )
         import_records.update(self.session_class.get_required_import_records())
+        for method in self.gated_session_methods:
+            import_records.update(method.get_required_import_records())
+        if self.client_kwargs:
+            import_records.add(
+                ImportRecord(
+                    ImportString("typing"),
+                    "TypedDict",
+                    min_version=(3, 8),
+                    fallback=ImportRecord(ImportString("typing_extensions"), "TypedDict"),
+                )
+            )
+            for type_annotation in self.client_kwargs.get_children_types():
+                import_record = type_annotation.get_import_record()
+                if import_record and not import_record.is_builtins():
+                    import_records.add(import_record)
         return list(sorted(import_records))
 
     def get_all_names(self) -> List[str]:
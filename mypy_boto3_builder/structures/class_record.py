@@ -1,7 +1,7 @@
 """
 Base class for all structures that can be rendered to a class.
 """
-from typing import Iterable, List, Set
+from typing import Iterable, List, Optional, Set, Tuple
 
 from botocore import xform_name
 
@@ -32,6 +32,7 @@ class ClassRecord:
         self.attributes = list(attributes)
         self.bases = list(bases)
         self.use_alias = use_alias
+        self._types_cache: Optional[Tuple[FakeAnnotation, ...]] = None
 
     @property
     def boto3_doc_link(self) -> str:
@@ -67,7 +68,24 @@ class ClassRecord:
     def get_types(self) -> Set[FakeAnnotation]:
         """
         Extract type annotations for methods, attributes and bases.
+
+        Result is cached after `freeze_types` call.
+        """
+        if self._types_cache is not None:
+            return set(self._types_cache)
+        return self._get_types()
+
+    def freeze_types(self) -> None:
         """
+        Cache type annotations of class and its methods.
+
+        Class is not expected to change after this call.
+        """
+        for method in self.methods:
+            method.freeze_types()
+        self._types_cache = tuple(self._get_types())
+
+    def _get_types(self) -> Set[FakeAnnotation]:
         types: Set[FakeAnnotation] = set()
         for method in self.methods:
             types.update(method.get_types())
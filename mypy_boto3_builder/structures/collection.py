@@ -63,10 +63,10 @@ class Collection(ClassRecord):
             f"({doc_link})"
         )
 
-    def get_types(self) -> Set[FakeAnnotation]:
+    def _get_types(self) -> Set[FakeAnnotation]:
         """
         Extract type annotations.
         """
-        types = super().get_types()
+        types = super()._get_types()
         types.update(self.type_annotation.get_types())
         return types
@@ -0,0 +1,134 @@
+"""
+Structure for mypy-boto3-common package with types shared between services.
+"""
+from typing import Iterable, List, Set
+
+from mypy_boto3_builder.constants import COMMON_MODULE_NAME, COMMON_PYPI_NAME
+from mypy_boto3_builder.import_helpers.import_record import ImportRecord
+from mypy_boto3_builder.import_helpers.import_string import ImportString
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.package import Package
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class CommonPackage(Package):
+    """
+    Structure for mypy-boto3-common package with types shared between services.
+
+    Arguments:
+        name -- Module name.
+        pypi_name -- Module PyPI name.
+        service_names -- Service names that were used to find shared types.
+        typed_dicts -- Shared TypedDicts.
+        literals -- Shared Literals.
+    """
+
+    def __init__(
+        self,
+        name: str = COMMON_MODULE_NAME,
+        pypi_name: str = COMMON_PYPI_NAME,
+        service_names: Iterable[ServiceName] = tuple(),
+        typed_dicts: Iterable[TypeTypedDict] = tuple(),
+        literals: Iterable[TypeLiteral] = tuple(),
+    ):
+        super().__init__(name=name, pypi_name=pypi_name)
+        self.service_names = list(service_names)
+        self.typed_dicts = list(typed_dicts)
+        self.literals = list(literals)
+
+    def get_shared_names(
+        self,
+        typed_dicts: Iterable[TypeTypedDict],
+        literals: Iterable[TypeLiteral],
+    ) -> Set[str]:
+        """
+        Get names of `typed_dicts` and `literals` that can be imported from this package.
+
+        A TypedDict or Literal is shared only if it is structurally the same as the one in
+        this package, and all TypedDicts and Literals it refers to are shared as well.
+
+        Arguments:
+            typed_dicts -- Service TypedDicts.
+            literals -- Service Literals.
+
+        Returns:
+            A set of shared names.
+        """
+        typed_dict_map = {i.name: i for i in self.typed_dicts}
+        literal_map = {i.name: i for i in self.literals}
+        typed_dicts = list(typed_dicts)
+        result: Set[str] = set()
+        for typed_dict in typed_dicts:
+            shared_typed_dict = typed_dict_map.get(typed_dict.name)
+            if shared_typed_dict and shared_typed_dict.is_same(typed_dict):
+                result.add(typed_dict.name)
+        for literal in literals:
+            shared_literal = literal_map.get(literal.name)
+            if shared_literal and shared_literal.is_same(literal):
+                result.add(literal.name)
+
+        changed = True
+        while changed:
+            changed = False
+            for typed_dict in typed_dicts:
+                if typed_dict.name not in result:
+                    continue
+                for child in typed_dict.get_children_types():
+                    if isinstance(child, TypeLiteral) and child.inline:
+                        continue
+                    if not isinstance(child, (TypeTypedDict, TypeLiteral)):
+                        continue
+                    if child.name not in result:
+                        result.remove(typed_dict.name)
+                        changed = True
+                        break
+
+        return result
+
+    def get_type_defs_required_import_records(self) -> List[ImportRecord]:
+        """
+        Get import records for `type_defs.py[i]`.
+        """
+        if not self.typed_dicts:
+            return []
+
+        import_records: Set[ImportRecord] = set()
+        import_records.add(ImportRecord(ImportString("sys")))
+        import_records.add(
+            ImportRecord(
+                ImportString("typing"),
+                "TypedDict",
+                min_version=(3, 8),
+                fallback=ImportRecord(ImportString("typing_extensions"), "TypedDict"),
+            )
+        )
+        for typed_dict in self.typed_dicts:
+            if typed_dict.replace_with_dict:
+                import_records.add(ImportRecord(ImportString("typing"), "Dict"))
+                import_records.add(ImportRecord(ImportString("typing"), "Any"))
+            for type_annotation in typed_dict.get_children_types():
+                import_record = type_annotation.get_import_record()
+                if not import_record or import_record.is_builtins():
+                    continue
+                if import_record.is_type_defs():
+                    continue
+                import_records.add(import_record.get_external(self.name))
+
+        return list(sorted(import_records))
+
+    def get_literals_required_import_records(self) -> List[ImportRecord]:
+        """
+        Get import records for `literals.py[i]`.
+        """
+        import_records: Set[ImportRecord] = set()
+        import_records.add(ImportRecord(ImportString("sys")))
+        import_records.add(
+            ImportRecord(
+                ImportString("typing"),
+                "Literal",
+                min_version=(3, 8),
+                fallback=ImportRecord(ImportString("typing_extensions"), "Literal"),
+            )
+        )
+        return list(sorted(import_records))
@@ -1,7 +1,7 @@
 """
 Module-level function.
 """
-from typing import Iterable, Optional, Set
+from typing import Iterable, Optional, Set, Tuple
 
 from mypy_boto3_builder.import_helpers.import_record import ImportRecord
 from mypy_boto3_builder.structures.argument import Argument
@@ -33,6 +33,7 @@ class Function:
         self.body_lines = body_lines
         self.type_ignore = type_ignore
         self.request_type_annotation: Optional[TypeTypedDict] = None
+        self._types_cache: Optional[Tuple[FakeAnnotation, ...]] = None
 
     @property
     def short_docstring(self) -> str:
@@ -78,7 +79,20 @@ class Function:
     def get_types(self) -> Set[FakeAnnotation]:
         """
         Extract required type annotations.
+
+        Result is cached after `freeze_types` call.
+        """
+        if self._types_cache is not None:
+            return set(self._types_cache)
+        return self._get_types()
+
+    def freeze_types(self) -> None:
         """
+        Cache type annotations, function is not expected to change after this call.
+        """
+        self._types_cache = tuple(self._get_types())
+
+    def _get_types(self) -> Set[FakeAnnotation]:
         types = self.return_type.get_types()
         for argument in self.arguments:
             types.update(argument.get_types())
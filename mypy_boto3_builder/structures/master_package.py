@@ -6,7 +6,7 @@ from typing import Iterable, List
 from mypy_boto3_builder.constants import MODULE_NAME, PYPI_NAME
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.package import Package
-from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
 
 
 class MasterPackage(Package):
@@ -17,7 +17,7 @@ class MasterPackage(Package):
         name -- Module name.
         pypi_name -- Module PyPI name.
         service_names -- List of included service names.
-        service_packages -- List of included service packages.
+        service_summaries -- List of included service summaries.
     """
 
     def __init__(
@@ -25,11 +25,11 @@ class MasterPackage(Package):
         name: str = MODULE_NAME,
         pypi_name: str = PYPI_NAME,
         service_names: Iterable[ServiceName] = tuple(),
-        service_packages: Iterable[ServicePackage] = tuple(),
+        service_summaries: Iterable[ServiceSummary] = tuple(),
     ):
         super().__init__(name=name, pypi_name=pypi_name)
         self.service_names = list(service_names)
-        self.service_packages = list(service_packages)
+        self.service_summaries = list(service_summaries)
 
     @property
     def essential_service_names(self) -> List[ServiceName]:
@@ -50,11 +50,19 @@ class Resource(ClassRecord):
             f"({self.service_name.get_doc_link('service_resource', self.name)})"
         )
 
-    def get_types(self) -> Set[FakeAnnotation]:
+    def freeze_types(self) -> None:
+        """
+        Cache type annotations of resource and its collections.
+        """
+        for collection in self.collections:
+            collection.freeze_types()
+        super().freeze_types()
+
+    def _get_types(self) -> Set[FakeAnnotation]:
         """
         Extract type annotations from collections.
         """
-        types = super().get_types()
+        types = super()._get_types()
         for collection in self.collections:
             types.update(collection.get_types())
         return types
@@ -1,21 +1,26 @@
 """
 Parsed Service package.
 """
-from typing import Dict, Iterable, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from mypy_boto3_builder.constants import COMMON_MODULE_NAME, TYPE_DEFS_PART_SIZE
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.import_helpers.import_record import ImportRecord
 from mypy_boto3_builder.import_helpers.import_string import ImportString
+from mypy_boto3_builder.import_helpers.internal_import_record import InternalImportRecord
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.common_package import CommonPackage
 from mypy_boto3_builder.structures.function import Function
 from mypy_boto3_builder.structures.package import Package
 from mypy_boto3_builder.structures.paginator import Paginator
 from mypy_boto3_builder.structures.service_resource import ServiceResource
+from mypy_boto3_builder.structures.type_defs_part import TypeDefsPart
 from mypy_boto3_builder.structures.waiter import Waiter
 from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
 from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
 from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+from mypy_boto3_builder.utils.graph import get_connected_components, get_dependency_order
 from mypy_boto3_builder.utils.strings import is_reserved
 
 
@@ -46,6 +51,10 @@ class ServicePackage(Package):
         self.typed_dicts = list(typed_dicts)
         self.literals = list(literals)
         self.helper_functions = list(helper_functions)
+        self.shared_typed_dicts: List[TypeTypedDict] = []
+        self.shared_literals: List[TypeLiteral] = []
+        self.type_defs_parts: List[TypeDefsPart] = []
+        self._types_cache: Optional[Tuple[FakeAnnotation, ...]] = None
 
     def extract_literals(self) -> List[TypeLiteral]:
         """
@@ -126,10 +135,92 @@ class ServicePackage(Package):
         result.sort()
         return result
 
+    def extract_shared_types(self, common_package: CommonPackage) -> None:
+        """
+        Move typed dicts and literals that are defined in `common_package` to shared lists.
+
+        Shared types are imported from common package instead of being defined in this one.
+        """
+        shared_names = common_package.get_shared_names(self.typed_dicts, self.literals)
+        self.shared_typed_dicts = [i for i in self.typed_dicts if i.name in shared_names]
+        self.typed_dicts = [i for i in self.typed_dicts if i.name not in shared_names]
+        self.shared_literals = [i for i in self.literals if i.name in shared_names]
+        self.literals = [i for i in self.literals if i.name not in shared_names]
+
+    def split_type_defs(self, part_size: int = TYPE_DEFS_PART_SIZE) -> None:
+        """
+        Split typed dicts to `type_defs` package parts.
+
+        Connected typed dicts are kept close to each other, and every typed dict is placed
+        after all typed dicts it refers to, so parts import only from previous parts.
+
+        Arguments:
+            part_size -- Max number of typed dicts in a part, unless they refer to each other.
+        """
+        typed_dict_map = {i.name: i for i in self.typed_dicts}
+
+        def get_children_names(name: str) -> List[str]:
+            return sorted(i.name for i in typed_dict_map[name].get_children_typed_dicts())
+
+        parts_names: List[List[str]] = []
+        current: List[str] = []
+        for component in get_connected_components(typed_dict_map, get_children_names):
+            for names in get_dependency_order(component, get_children_names):
+                if current and len(current) + len(names) > part_size:
+                    parts_names.append(current)
+                    current = []
+                current.extend(names)
+        if current:
+            parts_names.append(current)
+
+        width = max(2, len(str(len(parts_names))))
+        self.type_defs_parts = [
+            TypeDefsPart(
+                f"_part_{index:0{width}}",
+                sorted(typed_dict_map[name] for name in part_names),
+            )
+            for index, part_names in enumerate(parts_names, 1)
+        ]
+
+    def get_type_defs_all_names(self) -> List[str]:
+        """
+        Get `__all__` statement names for `type_defs.py[i]`.
+        """
+        return sorted(i.name for i in (*self.typed_dicts, *self.shared_typed_dicts))
+
+    def get_literals_all_names(self) -> List[str]:
+        """
+        Get `__all__` statement names for `literals.py[i]`.
+        """
+        return sorted(i.name for i in (*self.literals, *self.shared_literals))
+
     def get_types(self) -> Set[FakeAnnotation]:
         """
         Extract type annotations from Client, ServiceResource, waiters and paginators.
+
+        Result is cached after `freeze_types` call, so literals and typed dicts extraction,
+        validation and rendering share a single traversal.
+        """
+        if self._types_cache is not None:
+            return set(self._types_cache)
+        return self._get_types()
+
+    def freeze_types(self) -> None:
         """
+        Cache type annotations of all package structures.
+
+        Called once parsing is finished, structures are not expected to change after this call.
+        """
+        self.client.freeze_types()
+        if self.service_resource:
+            self.service_resource.freeze_types()
+        for waiter in self.waiters:
+            waiter.freeze_types()
+        for paginator in self.paginators:
+            paginator.freeze_types()
+        self._types_cache = tuple(self._get_types())
+
+    def _get_types(self) -> Set[FakeAnnotation]:
         types: Set[FakeAnnotation] = set()
         types.update(self.client.get_types())
         if self.service_resource:
@@ -176,6 +267,19 @@ class ServicePackage(Package):
 
         return list(sorted(import_records))
 
+    def get_init_lazy_import_records(self) -> Dict[str, ImportRecord]:
+        """
+        Get names loaded on first access in runtime `__init__.py`.
+
+        Aliases share import record with the name they refer to.
+        """
+        result = {i.name: i for i in self.get_init_import_records()}
+        result[self.client.alias_name] = result[self.client.name]
+        if self.service_resource:
+            result[self.service_resource.alias_name] = result[self.service_resource.name]
+
+        return dict(sorted(result.items()))
+
     def get_init_all_names(self) -> List[str]:
         """
         Get `__all__` statement names for `__init__.py[i]`.
@@ -255,10 +359,17 @@ class ServicePackage(Package):
         """
         Get import records for `type_defs.py[i]`.
         """
-        if not self.typed_dicts:
+        if not self.typed_dicts and not self.shared_typed_dicts:
             return []
 
         import_records: Set[ImportRecord] = set()
+        for typed_dict in self.shared_typed_dicts:
+            import_records.add(
+                ImportRecord(
+                    ImportString(COMMON_MODULE_NAME, ServiceModuleName.type_defs.value),
+                    typed_dict.name,
+                )
+            )
         import_records.add(ImportRecord(ImportString("sys")))
         import_records.add(
             ImportRecord(
@@ -292,6 +403,68 @@ class ServicePackage(Package):
 
         return list(sorted(import_records))
 
+    def get_type_defs_init_import_records(self) -> List[ImportRecord]:
+        """
+        Get import records for split `type_defs/__init__.py[i]`.
+        """
+        import_records: Set[ImportRecord] = set()
+        for typed_dict in self.shared_typed_dicts:
+            import_records.add(
+                ImportRecord(
+                    ImportString(COMMON_MODULE_NAME, ServiceModuleName.type_defs.value),
+                    typed_dict.name,
+                )
+            )
+        for part in self.type_defs_parts:
+            for typed_dict in part.typed_dicts:
+                import_records.add(
+                    ImportRecord(ImportString.parent() + ImportString(part.name), typed_dict.name)
+                )
+
+        return list(sorted(import_records))
+
+    def get_type_defs_part_required_import_records(self, part: TypeDefsPart) -> List[ImportRecord]:
+        """
+        Get import records for split `type_defs/<part>.py[i]`.
+
+        Typed dicts from other parts are imported directly from their part modules.
+        """
+        part_names = {i.name: p.name for p in self.type_defs_parts for i in p.typed_dicts}
+        import_records: Set[ImportRecord] = set()
+        import_records.add(ImportRecord(ImportString("sys")))
+        import_records.add(
+            ImportRecord(
+                ImportString("typing"),
+                "TypedDict",
+                min_version=(3, 8),
+                fallback=ImportRecord(ImportString("typing_extensions"), "TypedDict"),
+            )
+        )
+        for typed_dict in part.typed_dicts:
+            if typed_dict.replace_with_dict:
+                import_records.add(ImportRecord(ImportString("typing"), "Dict"))
+                import_records.add(ImportRecord(ImportString("typing"), "Any"))
+            for type_annotation in typed_dict.get_children_types():
+                if isinstance(type_annotation, TypeTypedDict):
+                    part_name = part_names.get(type_annotation.name)
+                    if part_name == part.name:
+                        continue
+                    if part_name:
+                        source = ImportString.parent() + ImportString(part_name)
+                    else:
+                        source = ImportString(COMMON_MODULE_NAME, ServiceModuleName.type_defs.value)
+                    import_records.add(ImportRecord(source, type_annotation.name))
+                    continue
+
+                import_record = type_annotation.get_import_record()
+                if not import_record or import_record.is_builtins():
+                    continue
+                if isinstance(import_record, InternalImportRecord):
+                    import_record = import_record.get_nested()
+                import_records.add(import_record.get_external(self.service_name.module_name))
+
+        return list(sorted(import_records))
+
     def get_literals_required_import_records(self) -> List[ImportRecord]:
         """
         Get import records for `literals.py[i]`.
@@ -306,6 +479,13 @@ class ServicePackage(Package):
                 fallback=ImportRecord(ImportString("typing_extensions"), "Literal"),
             )
         )
+        for literal in self.shared_literals:
+            import_records.add(
+                ImportRecord(
+                    ImportString(COMMON_MODULE_NAME, ServiceModuleName.literals.value),
+                    literal.name,
+                )
+            )
         return list(sorted(import_records))
 
     def validate(self) -> None:
@@ -318,7 +498,9 @@ class ServicePackage(Package):
         names = set()
         for name in (
             *(i.name for i in self.typed_dicts),
+            *(i.name for i in self.shared_typed_dicts),
             *(i.name for i in self.literals),
+            *(i.name for i in self.shared_literals),
             *(i.name for i in self.waiters),
             *(i.name for i in self.paginators),
             *(self.service_resource.get_all_names() if self.service_resource else []),
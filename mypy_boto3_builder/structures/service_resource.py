@@ -65,11 +65,21 @@ class ServiceResource(ClassRecord):
             f"({self.service_name.get_doc_link('service_resource')})"
         )
 
-    def get_types(self) -> Set[FakeAnnotation]:
+    def freeze_types(self) -> None:
+        """
+        Cache type annotations of service resource, its collections and sub-resources.
+        """
+        for collection in self.collections:
+            collection.freeze_types()
+        for sub_resource in self.sub_resources:
+            sub_resource.freeze_types()
+        super().freeze_types()
+
+    def _get_types(self) -> Set[FakeAnnotation]:
         """
         Extract type annotations for collections and sub-resources.
         """
-        types = super().get_types()
+        types = super()._get_types()
         for collection in self.collections:
             types.update(collection.get_types())
         for sub_resource in self.sub_resources:
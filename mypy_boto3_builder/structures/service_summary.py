@@ -0,0 +1,115 @@
+"""
+Compact service record for master and boto3-stubs packages.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
+from mypy_boto3_builder.structures.service_package import ServicePackage
+
+
+class ServiceSummary:
+    """
+    Compact service record for master and boto3-stubs packages.
+
+    Keeps only names and flags that aggregate packages render, so it holds
+    no boto3 objects and no parsed shapes.
+
+    Arguments:
+        service_name -- Service name.
+        client_name -- Client class name.
+        service_resource_name -- ServiceResource class name, if service has resources.
+        has_waiters -- Whether client has waiters.
+        has_paginators -- Whether client has paginators.
+    """
+
+    __slots__ = (
+        "service_name",
+        "client_name",
+        "service_resource_name",
+        "has_waiters",
+        "has_paginators",
+    )
+
+    def __init__(
+        self,
+        service_name: ServiceName,
+        client_name: str,
+        service_resource_name: Optional[str] = None,
+        has_waiters: bool = False,
+        has_paginators: bool = False,
+    ) -> None:
+        self.service_name = service_name
+        self.client_name = client_name
+        self.service_resource_name = service_resource_name
+        self.has_waiters = has_waiters
+        self.has_paginators = has_paginators
+
+    def _get_key(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash(self._get_key())
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ServiceSummary):
+            return False
+        return self._get_key() == other._get_key()
+
+    @property
+    def has_service_resource(self) -> bool:
+        """
+        Whether service has a ServiceResource.
+        """
+        return self.service_resource_name is not None
+
+    @classmethod
+    def from_service_package(cls, service_package: ServicePackage) -> "ServiceSummary":
+        """
+        Create summary from a parsed service package.
+
+        Arguments:
+            service_package -- Parsed service package.
+
+        Returns:
+            A new ServiceSummary.
+        """
+        service_resource = service_package.service_resource
+        return cls(
+            service_name=service_package.service_name,
+            client_name=service_package.client.name,
+            service_resource_name=service_resource.name if service_resource else None,
+            has_waiters=bool(service_package.waiters),
+            has_paginators=bool(service_package.paginators),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get JSON-serializable summary data.
+        """
+        return {
+            "service_name": self.service_name.name,
+            "class_name": self.service_name.class_name,
+            "client_name": self.client_name,
+            "service_resource_name": self.service_resource_name,
+            "has_waiters": self.has_waiters,
+            "has_paginators": self.has_paginators,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ServiceSummary":
+        """
+        Create summary from `to_dict` data, service name is added to catalog.
+
+        Arguments:
+            data -- Summary data.
+
+        Returns:
+            A new ServiceSummary.
+        """
+        return cls(
+            service_name=ServiceNameCatalog.add(data["service_name"], data["class_name"]),
+            client_name=data["client_name"],
+            service_resource_name=data["service_resource_name"],
+            has_waiters=data["has_waiters"],
+            has_paginators=data["has_paginators"],
+        )
@@ -0,0 +1,29 @@
+"""
+Part of split `type_defs` module.
+"""
+from typing import Iterable, List
+
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class TypeDefsPart:
+    """
+    Part of split `type_defs` module.
+
+    Arguments:
+        name -- Module name inside `type_defs` package.
+        typed_dicts -- TypedDicts defined in this part.
+    """
+
+    def __init__(self, name: str, typed_dicts: Iterable[TypeTypedDict] = tuple()):
+        self.name = name
+        self.typed_dicts = list(typed_dicts)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name} ({len(self.typed_dicts)})>"
+
+    def get_all_names(self) -> List[str]:
+        """
+        Get `__all__` statement names for part module.
+        """
+        return sorted(i.name for i in self.typed_dicts)
@@ -70,6 +70,12 @@ class TypeLiteral(FakeAnnotation):
         """
         return ", ".join([repr(child) for child in sorted(self.children)])
 
+    def render_definition(self) -> str:
+        """
+        Render Literal definition for `literals` module.
+        """
+        return f"{self.name} = Literal[{self.render_children()}]"
+
     def get_import_record(self) -> ImportRecord:
         """
         Get import record required for using type annotation.
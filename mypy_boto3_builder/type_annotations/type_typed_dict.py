@@ -203,8 +203,8 @@ class TypeTypedDict(FakeAnnotation):
         """
         Check whether typed dict attributes are the same as `other`.
         """
-        children = [i.render() for i in self.children]
-        other_children = [i.render() for i in other.children]
+        children = [(i.render(), i.required) for i in self.children]
+        other_children = [(i.render(), i.required) for i in other.children]
         return other_children == children
 
     def get_children_types(self) -> Set[FakeAnnotation]:
@@ -261,6 +261,54 @@ class TypeTypedDict(FakeAnnotation):
                     sub_child.replace_with_dict.add(child.name)
                     continue
 
+    def _render_attributes_dict(self, children: Iterable[TypedDictAttribute]) -> str:
+        items = "".join(
+            f'"{child.name}": {child.type_annotation.render(self.name)}, ' for child in children
+        )
+        return f"{{{items}}}"
+
+    def _render_attributes_body(self, children: Iterable[TypedDictAttribute]) -> str:
+        lines = [f"    {i.name}: {i.type_annotation.render(self.name)}\n" for i in children]
+        return "".join(lines) + "\n" if lines else ""
+
+    def render_definition(self) -> str:
+        """
+        Render TypedDict definition for `type_defs` module.
+
+        Functional syntax is used if `requires_safe_render` is set, class-based otherwise.
+        TypedDict with both required and optional keys is split to two base definitions.
+
+        Returns:
+            A string with TypedDict definition.
+        """
+        required = self.get_required()
+        optional = self.get_optional()
+        if self.requires_safe_render:
+            if required and optional:
+                return (
+                    f'_Required{self.name} = TypedDict("_Required{self.name}", '
+                    f"{self._render_attributes_dict(required)})\n"
+                    f'_Optional{self.name} = TypedDict("_Optional{self.name}", '
+                    f"{self._render_attributes_dict(optional)}, total=False)\n"
+                    f"class {self.name}(_Required{self.name}, _Optional{self.name}):\n    pass\n"
+                )
+            total = ", total=False" if optional else ""
+            return (
+                f'{self.name} = TypedDict("{self.name}", '
+                f"{self._render_attributes_dict(self.children)}{total})\n"
+            )
+
+        if required and optional:
+            return (
+                f"class _Required{self.name}(TypedDict):\n"
+                f"{self._render_attributes_body(required)}"
+                f"class {self.name}(_Required{self.name}, total=False):\n"
+                f"{self._render_attributes_body(optional)}"
+            )
+        total = ", total=False" if optional else ""
+        body = self._render_attributes_body(self.children)
+        return f"class {self.name}(TypedDict{total}):\n{body}"
+
     @property
     def requires_safe_render(self) -> bool:
         """
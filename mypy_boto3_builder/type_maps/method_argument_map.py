@@ -42,6 +42,9 @@ def get_method_arguments_stub(
         method_name -- Method name.
 
     Returns:
-        A list of arguments or None.
+        A copy of arguments list or None.
     """
-    return METHOD_MAP.get(service_name, {}).get(class_name, {}).get(method_name)
+    arguments = METHOD_MAP.get(service_name, {}).get(class_name, {}).get(method_name)
+    if arguments is None:
+        return None
+    return list(arguments)
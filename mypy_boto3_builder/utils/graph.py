@@ -0,0 +1,108 @@
+"""
+Dependency graph helpers.
+"""
+from typing import Callable, Dict, Iterable, List, Set, TypeVar
+
+_T = TypeVar("_T")
+
+
+def get_connected_components(
+    nodes: Iterable[_T], get_children: Callable[[_T], Iterable[_T]]
+) -> List[List[_T]]:
+    """
+    Split graph into weakly connected components.
+
+    Components are ordered by their first node, nodes keep input order.
+
+    Arguments:
+        nodes -- Graph nodes.
+        get_children -- Function that returns node children, unknown children are ignored.
+
+    Returns:
+        A list of components.
+    """
+    node_list = list(nodes)
+    parents: Dict[_T, _T] = {node: node for node in node_list}
+
+    def find(node: _T) -> _T:
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+
+    for node in node_list:
+        for child in get_children(node):
+            if child not in parents:
+                continue
+            node_root = find(node)
+            child_root = find(child)
+            if node_root != child_root:
+                parents[child_root] = node_root
+
+    components: Dict[_T, List[_T]] = {}
+    for node in node_list:
+        components.setdefault(find(node), []).append(node)
+    return list(components.values())
+
+
+def get_dependency_order(
+    nodes: Iterable[_T], get_children: Callable[[_T], Iterable[_T]]
+) -> List[List[_T]]:
+    """
+    Get strongly connected components with children before their parents.
+
+    Uses Tarjan algorithm, so nodes that depend on each other end up in the same component.
+
+    Arguments:
+        nodes -- Graph nodes.
+        get_children -- Function that returns node children, unknown children are ignored.
+
+    Returns:
+        A list of strongly connected components in dependency order.
+    """
+    node_list = list(nodes)
+    known: Set[_T] = set(node_list)
+    indexes: Dict[_T, int] = {}
+    low_links: Dict[_T, int] = {}
+    stack: List[_T] = []
+    on_stack: Set[_T] = set()
+    result: List[List[_T]] = []
+
+    for root in node_list:
+        if root in indexes:
+            continue
+
+        indexes[root] = low_links[root] = len(indexes)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter([i for i in get_children(root) if i in known]))]
+        while work:
+            node, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if child not in indexes:
+                    indexes[child] = low_links[child] = len(indexes)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter([i for i in get_children(child) if i in known])))
+                elif child in on_stack:
+                    low_links[node] = min(low_links[node], indexes[child])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low_links[parent] = min(low_links[parent], low_links[node])
+            if low_links[node] != indexes[node]:
+                continue
+
+            component: List[_T] = []
+            while True:
+                member = stack.pop()
+                on_stack.remove(member)
+                component.append(member)
+                if member == node:
+                    break
+            result.append(component)
+
+    return result
@@ -0,0 +1,332 @@
+"""
+Per-service and per-stage memory profiler with a peak RSS budget.
+"""
+import gc
+import json
+import re
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from mypy_boto3_builder.constants import MEMORY_TOP_COUNT
+
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore
+
+__all__ = [
+    "MemorySample",
+    "AllocationSite",
+    "MemoryBudgetError",
+    "MemoryProfiler",
+    "get_peak_rss",
+    "reset_traced_peak",
+    "parse_memory_size",
+    "get_durations",
+    "load_report_durations",
+]
+
+MEMORY_REPORT_VERSION = 1
+MB = 1024 * 1024
+UNITS = {"": MB, "K": 1024, "M": MB, "G": 1024 * MB}
+
+
+@dataclass
+class MemorySample:
+    """
+    Memory usage of one stage.
+
+    Arguments:
+        name -- Package or service name.
+        stage -- Stage name, like `parse` or `write`.
+        allocated -- Traced memory retained after stage.
+        peak -- Traced memory high-water mark during stage, above its start.
+        peak_rss -- Process peak RSS after stage.
+        duration -- Stage duration in seconds.
+    """
+
+    name: str
+    stage: str
+    allocated: int
+    peak: int
+    peak_rss: int
+    duration: float
+
+
+@dataclass
+class AllocationSite:
+    """
+    Source line with its traced allocated memory.
+    """
+
+    site: str
+    size: int
+    count: int
+
+    def render(self) -> str:
+        """
+        Render to a report line.
+        """
+        return f"{self.site}: {self.size / MB:.1f} MB in {self.count} blocks"
+
+
+class MemoryBudgetError(Exception):
+    """
+    Peak RSS exceeded memory budget.
+    """
+
+
+def get_peak_rss() -> int:
+    """
+    Get process peak resident set size in bytes, or 0 if it is not available.
+    """
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, other platforms report kilobytes
+    if sys.platform == "darwin":
+        return max_rss
+    return max_rss * 1024
+
+
+def reset_traced_peak() -> int:
+    """
+    Reset traced memory peak to current traced memory.
+
+    Python 3.8 has no `tracemalloc.reset_peak`, so tracing is restarted instead
+    and previously traced blocks are forgotten.
+
+    Returns:
+        Current traced memory.
+    """
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    else:
+        traceback_limit = tracemalloc.get_traceback_limit()
+        tracemalloc.stop()
+        tracemalloc.start(traceback_limit)
+    return tracemalloc.get_traced_memory()[0]
+
+
+def parse_memory_size(value: str) -> int:
+    """
+    Parse memory size like `512`, `512M` or `2G` to bytes, megabytes by default.
+
+    Raises:
+        ValueError -- If value is not a memory size.
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([KMG]?)B?", value.strip().upper())
+    if not match:
+        raise ValueError(f"Invalid memory size: {value}")
+    return int(float(match.group(1)) * UNITS[match.group(2)])
+
+
+def get_durations(samples: Iterable[MemorySample]) -> Dict[str, float]:
+    """
+    Get total duration in seconds of all stages by package or service name.
+    """
+    result: Dict[str, float] = {}
+    for sample in samples:
+        result[sample.name] = result.get(sample.name, 0.0) + sample.duration
+    return result
+
+
+def load_report_durations(path: Path) -> Dict[str, float]:
+    """
+    Load durations by package or service name from a saved memory report.
+
+    Arguments:
+        path -- Report path from a previous run.
+
+    Returns:
+        Total duration in seconds by name.
+
+    Raises:
+        ValueError -- If report cannot be read.
+    """
+    try:
+        report = json.loads(path.read_text())
+        samples = [MemorySample(**i) for i in report["samples"]]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Cannot read memory report {path}: {e}") from e
+    return get_durations(samples)
+
+
+class MemoryProfiler:
+    """
+    Per-service and per-stage memory profiler with a peak RSS budget.
+
+    Stages are measured with `measure` after `start`, traced memory is sampled only if tracing
+    is started, peak RSS is always sampled. When peak RSS exceeds `max_memory`
+    after a stage, caches are flushed and `MemoryBudgetError` lists the top allocation sites.
+    Stages are not nested, each stage resets traced memory peak.
+    """
+
+    is_started = False
+    max_memory: Optional[int] = None
+    samples: List[MemorySample] = []
+    _flush_handlers: List[Callable[[], None]] = []
+
+    @classmethod
+    def start(cls, max_memory: Optional[int] = None, trace: bool = False) -> None:
+        """
+        Start profiling.
+
+        Arguments:
+            max_memory -- Peak RSS budget in bytes.
+            trace -- Trace Python allocations with `tracemalloc`, slows down the build.
+        """
+        cls.is_started = True
+        cls.max_memory = max_memory
+        cls.samples = []
+        if trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        """
+        Stop profiling, samples and registered flush handlers are removed.
+        """
+        cls.is_started = False
+        cls.max_memory = None
+        cls.samples = []
+        cls._flush_handlers = []
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @classmethod
+    def add_flush_handler(cls, handler: Callable[[], None]) -> None:
+        """
+        Add a handler that drops caches when memory budget is exceeded.
+        """
+        cls._flush_handlers.append(handler)
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Call flush handlers and collect garbage.
+        """
+        for handler in cls._flush_handlers:
+            handler()
+        gc.collect()
+
+    @classmethod
+    @contextmanager
+    def measure(cls, name: str, stage: str) -> Iterator[None]:
+        """
+        Measure memory usage of a stage and check memory budget after it.
+
+        Arguments:
+            name -- Package or service name.
+            stage -- Stage name.
+
+        Raises:
+            MemoryBudgetError -- If peak RSS exceeds `max_memory`.
+        """
+        if not cls.is_started:
+            yield
+            return
+
+        start_traced = 0
+        if tracemalloc.is_tracing():
+            start_traced = reset_traced_peak()
+        start_time = time.perf_counter()
+        yield
+
+        traced, traced_peak = start_traced, start_traced
+        if tracemalloc.is_tracing():
+            traced, traced_peak = tracemalloc.get_traced_memory()
+        sample = MemorySample(
+            name=name,
+            stage=stage,
+            allocated=traced - start_traced,
+            peak=traced_peak - start_traced,
+            peak_rss=get_peak_rss(),
+            duration=time.perf_counter() - start_time,
+        )
+        cls.samples.append(sample)
+        cls.check(sample)
+
+    @classmethod
+    def check(cls, sample: MemorySample) -> None:
+        """
+        Check `sample` peak RSS against `max_memory`.
+
+        Raises:
+            MemoryBudgetError -- With top allocation sites, after caches are flushed.
+        """
+        if cls.max_memory is None or sample.peak_rss <= cls.max_memory:
+            return
+
+        top_sites = cls.get_top_allocation_sites()
+        cls.flush()
+        lines = [
+            f"Peak RSS {sample.peak_rss / MB:.0f} MB exceeded memory budget"
+            f" {cls.max_memory / MB:.0f} MB after {sample.name} {sample.stage}"
+        ]
+        if top_sites:
+            lines.append("Top allocation sites:")
+            lines.extend(f"  {i.render()}" for i in top_sites)
+        else:
+            lines.append("Use --memory-report to trace allocation sites")
+        raise MemoryBudgetError("\n".join(lines))
+
+    @classmethod
+    def get_top_allocation_sites(cls) -> List[AllocationSite]:
+        """
+        Get source lines with the most traced allocated memory.
+
+        Returns:
+            A list of allocation sites, empty if tracing is not started.
+        """
+        if not tracemalloc.is_tracing():
+            return []
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        result: List[AllocationSite] = []
+        for statistic in snapshot.statistics("lineno")[:MEMORY_TOP_COUNT]:
+            frame = statistic.traceback[0]
+            result.append(
+                AllocationSite(
+                    site=f"{frame.filename}:{frame.lineno}",
+                    size=statistic.size,
+                    count=statistic.count,
+                )
+            )
+        return result
+
+    @classmethod
+    def get_report(cls) -> Dict[str, Any]:
+        """
+        Get memory report with samples, per-name totals and top allocation sites.
+        """
+        names: Dict[str, Dict[str, Any]] = {}
+        for sample in cls.samples:
+            totals = names.setdefault(sample.name, {"allocated": 0, "peak": 0, "peak_rss": 0})
+            totals["allocated"] += sample.allocated
+            totals["peak"] = max(totals["peak"], sample.peak)
+            totals["peak_rss"] = max(totals["peak_rss"], sample.peak_rss)
+        return {
+            "version": MEMORY_REPORT_VERSION,
+            "traced": tracemalloc.is_tracing(),
+            "max_memory": cls.max_memory,
+            "peak_rss": get_peak_rss(),
+            "names": names,
+            "samples": [asdict(i) for i in cls.samples],
+            "top_allocation_sites": [asdict(i) for i in cls.get_top_allocation_sites()],
+        }
+
+    @classmethod
+    def save_report(cls, path: Path) -> None:
+        """
+        Save memory report to `path` as JSON.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cls.get_report(), indent=2))
@@ -0,0 +1,78 @@
+"""
+Cost-based split and order of services for build shards and workers.
+"""
+import re
+from typing import List, Sequence, Tuple, TypeVar
+
+__all__ = ["parse_shard", "partition_by_cost", "get_largest_first"]
+
+_ItemType = TypeVar("_ItemType")
+
+SHARD_RE = re.compile(r"^(\d+)/(\d+)$")
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse shard string like `2/4`.
+
+    Arguments:
+        value -- Shard as `INDEX/COUNT`, index starts from 1.
+
+    Returns:
+        A tuple of index and count.
+
+    Raises:
+        ValueError -- If shard string is invalid.
+    """
+    match = SHARD_RE.match(value.strip())
+    if not match:
+        raise ValueError(f"Invalid shard {value}, use INDEX/COUNT like 1/4")
+    index, count = int(match.group(1)), int(match.group(2))
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard {value}, INDEX should be from 1 to COUNT")
+    return index, count
+
+
+def get_largest_first(items: Sequence[_ItemType], costs: Sequence[float]) -> List[_ItemType]:
+    """
+    Order `items` by cost, most expensive first.
+
+    Started first, the most expensive items do not finish last on a busy worker,
+    so the total time gets close to the cost of the most expensive item.
+    Items with the same cost keep their order.
+
+    Arguments:
+        items -- Items to order.
+        costs -- Estimated cost for each item.
+
+    Returns:
+        A new ordered list.
+    """
+    return [items[i] for i in sorted(range(len(items)), key=lambda i: (-costs[i], i))]
+
+
+def partition_by_cost(
+    items: Sequence[_ItemType], costs: Sequence[float], count: int
+) -> List[List[_ItemType]]:
+    """
+    Split `items` to `count` parts with close total costs.
+
+    The most expensive items go first to the part with the lowest total cost,
+    ties are broken by position, so the result is the same on every node.
+    Items keep their original order inside each part.
+
+    Arguments:
+        items -- Items to split.
+        costs -- Estimated cost for each item.
+        count -- Number of parts.
+
+    Returns:
+        A list of `count` parts.
+    """
+    totals = [0.0] * count
+    part_indexes: List[List[int]] = [[] for _ in range(count)]
+    for item_index in get_largest_first(range(len(items)), costs):
+        part_index = min(range(count), key=lambda i: (totals[i], i))
+        totals[part_index] += costs[item_index]
+        part_indexes[part_index].append(item_index)
+    return [[items[i] for i in sorted(indexes)] for indexes in part_indexes]
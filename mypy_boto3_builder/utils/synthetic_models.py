@@ -0,0 +1,284 @@
+"""
+Synthetic botocore service models for scale testing.
+
+Writes `service-2`, `paginators-1`, `waiters-2` and `resources-1` JSON to a botocore
+data path, so parsers and writers can be measured on models larger than any AWS service.
+"""
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from boto3.session import Session
+from botocore.session import get_session as get_botocore_session
+
+from mypy_boto3_builder.constants import DUMMY_REGION
+
+API_VERSION = "2020-01-01"
+LIST_OPERATION_STEP = 3
+SCALAR_SHAPES: Dict[str, Dict[str, Any]] = {
+    "String": {"type": "string"},
+    "Integer": {"type": "integer"},
+    "Boolean": {"type": "boolean"},
+    "Timestamp": {"type": "timestamp"},
+    "NextToken": {"type": "string"},
+    "MaxResults": {"type": "integer", "min": 1, "max": 100},
+    "TagMap": {"type": "map", "key": {"shape": "String"}, "value": {"shape": "String"}},
+    "ResourceNotFoundException": {
+        "type": "structure",
+        "members": {"Message": {"shape": "String"}},
+        "exception": True,
+        "documentation": "<p>Resource does not exist.</p>",
+    },
+}
+
+
+@dataclass
+class SyntheticConfig:
+    """
+    Synthetic service model parameters.
+
+    Arguments:
+        service_name -- Service name and endpoint prefix.
+        operations -- Number of generic operations, every third one is paginated.
+        shape_depth -- Depth of nested structures in each request and response.
+        fields -- Number of scalar fields in each structure.
+        cycle_density -- Probability of a structure to reference one of its parents.
+        enum_count -- Number of string enum shapes.
+        enum_size -- Number of values in each enum.
+        resources -- Number of sub-resources with load, actions, collections and waiters.
+            ServiceResource `has` constructors are typed from a docstring map of real
+            services, so sub-resources are reachable only through collections.
+        seed -- Random seed, the same config always produces the same models.
+    """
+
+    service_name: str = "synthetic"
+    operations: int = 100
+    shape_depth: int = 3
+    fields: int = 4
+    cycle_density: float = 0.1
+    enum_count: int = 20
+    enum_size: int = 10
+    resources: int = 5
+    seed: int = 0
+
+
+class SyntheticModelGenerator:
+    """
+    Generator of synthetic botocore service models.
+
+    Arguments:
+        config -- Model parameters.
+    """
+
+    def __init__(self, config: SyntheticConfig) -> None:
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.shapes: Dict[str, Dict[str, Any]] = dict(SCALAR_SHAPES)
+        self.operations: Dict[str, Dict[str, Any]] = {}
+        self.paginators: Dict[str, Dict[str, Any]] = {}
+        self.waiters: Dict[str, Dict[str, Any]] = {}
+        self.resources: Dict[str, Dict[str, Any]] = {}
+        self.service_resource: Dict[str, Any] = {"hasMany": {}}
+
+    def _get_enum_shape_name(self) -> str:
+        name = f"Enum{self.random.randrange(self.config.enum_count)}"
+        if name not in self.shapes:
+            self.shapes[name] = {
+                "type": "string",
+                "enum": [f"{name.lower()}-value-{i}" for i in range(self.config.enum_size)],
+            }
+        return name
+
+    def _add_structure(self, name: str, level: int, parent_names: Sequence[str]) -> str:
+        members: Dict[str, Dict[str, Any]] = {
+            "Name": {"shape": "String", "documentation": f"<p>{name} name.</p>"},
+            "Status": {"shape": self._get_enum_shape_name()},
+            "Tags": {"shape": "TagMap"},
+        }
+        scalar_names = ("String", "Integer", "Boolean", "Timestamp")
+        for index in range(self.config.fields):
+            members[f"Field{index}"] = {"shape": scalar_names[index % len(scalar_names)]}
+        self.shapes[name] = {
+            "type": "structure",
+            "members": members,
+            "documentation": f"<p>Structure {name}.</p>",
+        }
+        if parent_names and self.random.random() < self.config.cycle_density:
+            members["Parent"] = {"shape": self.random.choice(parent_names)}
+        if level >= self.config.shape_depth:
+            return name
+
+        child_parent_names = [*parent_names, name]
+        members["Child"] = {
+            "shape": self._add_structure(f"{name}Child", level + 1, child_parent_names)
+        }
+        item_name = self._add_structure(f"{name}Item", level + 1, child_parent_names)
+        self.shapes[f"{item_name}List"] = {"type": "list", "member": {"shape": item_name}}
+        members["Items"] = {"shape": f"{item_name}List"}
+        return name
+
+    def _add_operation(
+        self,
+        name: str,
+        input_members: Dict[str, Dict[str, Any]],
+        output_members: Dict[str, Dict[str, Any]],
+        required: Sequence[str] = (),
+    ) -> None:
+        request_name = f"{name}Request"
+        self.shapes[request_name] = {"type": "structure", "members": input_members}
+        if required:
+            self.shapes[request_name]["required"] = list(required)
+        operation: Dict[str, Any] = {
+            "name": name,
+            "http": {"method": "POST", "requestUri": "/"},
+            "input": {"shape": request_name},
+            "errors": [{"shape": "ResourceNotFoundException"}],
+            "documentation": f"<p>Synthetic operation {name}.</p>",
+        }
+        if output_members:
+            response_name = f"{name}Response"
+            self.shapes[response_name] = {"type": "structure", "members": output_members}
+            operation["output"] = {"shape": response_name}
+        self.operations[name] = operation
+
+    def _add_generic_operation(self, index: int) -> None:
+        name = f"Operation{index}"
+        input_members = {
+            "Name": {"shape": "String"},
+            "Config": {"shape": self._add_structure(f"{name}Config", 1, [])},
+        }
+        output_members = {"Result": {"shape": self._add_structure(f"{name}Result", 1, [])}}
+        if index % LIST_OPERATION_STEP == 0:
+            input_members["MaxResults"] = {"shape": "MaxResults"}
+            input_members["NextToken"] = {"shape": "NextToken"}
+            output_members["NextToken"] = {"shape": "NextToken"}
+            self.paginators[name] = {
+                "input_token": "NextToken",
+                "output_token": "NextToken",
+                "limit_key": "MaxResults",
+                "result_key": "Result.Items",
+            }
+        self._add_operation(name, input_members, output_members, required=["Name"])
+
+    def _add_resource(self, index: int) -> None:
+        name = f"Widget{index}"
+        self._add_structure(name, 1, [])
+        self.shapes[f"{name}List"] = {"type": "list", "member": {"shape": name}}
+        name_member = {"Name": {"shape": "String"}}
+        self._add_operation(
+            f"Describe{name}", name_member, {"Widget": {"shape": name}}, required=["Name"]
+        )
+        self._add_operation(
+            f"List{name}s",
+            {"MaxResults": {"shape": "MaxResults"}, "NextToken": {"shape": "NextToken"}},
+            {"Widgets": {"shape": f"{name}List"}, "NextToken": {"shape": "NextToken"}},
+        )
+        self._add_operation(f"Delete{name}", name_member, {}, required=["Name"])
+        self.paginators[f"List{name}s"] = {
+            "input_token": "NextToken",
+            "output_token": "NextToken",
+            "limit_key": "MaxResults",
+            "result_key": "Widgets",
+        }
+        self.waiters[f"{name}Exists"] = {
+            "delay": 5,
+            "maxAttempts": 20,
+            "operation": f"Describe{name}",
+            "acceptors": [
+                {"expected": 200, "matcher": "status", "state": "success"},
+                {"expected": "ResourceNotFoundException", "matcher": "error", "state": "retry"},
+            ],
+        }
+
+        identifier_param = {"target": "Name", "source": "identifier", "name": "Name"}
+        self.resources[name] = {
+            "identifiers": [{"name": "Name"}],
+            "shape": name,
+            "load": {
+                "request": {"operation": f"Describe{name}", "params": [identifier_param]},
+                "path": "Widget",
+            },
+            "actions": {
+                "Delete": {"request": {"operation": f"Delete{name}", "params": [identifier_param]}}
+            },
+            "waiters": {"Exists": {"waiterName": f"{name}Exists", "params": [identifier_param]}},
+        }
+        self.service_resource["hasMany"][f"{name}s"] = {
+            "request": {"operation": f"List{name}s"},
+            "resource": {
+                "type": name,
+                "identifiers": [
+                    {"target": "Name", "source": "response", "path": "Widgets[].Name"}
+                ],
+                "path": "Widgets[]",
+            },
+        }
+
+    def generate(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate all models.
+
+        Returns:
+            A mapping of model type name, like `service-2`, to model data.
+        """
+        for index in range(self.config.operations):
+            self._add_generic_operation(index)
+        for index in range(self.config.resources):
+            self._add_resource(index)
+
+        service_name = self.config.service_name
+        service_id = service_name.capitalize()
+        return {
+            "service-2": {
+                "version": "2.0",
+                "metadata": {
+                    "apiVersion": API_VERSION,
+                    "endpointPrefix": service_name,
+                    "jsonVersion": "1.1",
+                    "protocol": "json",
+                    "serviceFullName": f"{service_id} Synthetic Service",
+                    "serviceId": service_id,
+                    "signatureVersion": "v4",
+                    "targetPrefix": service_id,
+                    "uid": f"{service_name}-{API_VERSION}",
+                },
+                "operations": self.operations,
+                "shapes": self.shapes,
+                "documentation": f"<p>{service_id} synthetic service for scale testing.</p>",
+            },
+            "paginators-1": {"pagination": self.paginators},
+            "waiters-2": {"version": 2, "waiters": self.waiters},
+            "resources-1": {"service": self.service_resource, "resources": self.resources},
+        }
+
+
+def write_models(data_path: Path, config: SyntheticConfig) -> List[Path]:
+    """
+    Write synthetic models to botocore data path.
+
+    Arguments:
+        data_path -- Data path root, models go to `<service_name>/<api_version>/`.
+        config -- Model parameters.
+
+    Returns:
+        A list of written model paths.
+    """
+    models_path = data_path / config.service_name / API_VERSION
+    models_path.mkdir(parents=True, exist_ok=True)
+    result: List[Path] = []
+    for model_name, model in SyntheticModelGenerator(config).generate().items():
+        model_path = models_path / f"{model_name}.json"
+        model_path.write_text(json.dumps(model, sort_keys=True))
+        result.append(model_path)
+    return result
+
+
+def get_session(data_path: Path) -> Session:
+    """
+    Get boto3 session that loads models from `data_path` first.
+    """
+    botocore_session = get_botocore_session()
+    botocore_session.set_config_variable("data_path", data_path.as_posix())
+    return Session(botocore_session=botocore_session, region_name=DUMMY_REGION)
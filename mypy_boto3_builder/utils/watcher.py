@@ -0,0 +1,234 @@
+"""
+Watcher for service model files in botocore loader search paths.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from mypy_boto3_builder.constants import WATCH_POLL_INTERVAL, WATCH_SETTLE_TIME
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+__all__ = ["Inotify", "ServiceModelWatcher"]
+
+# inotify(7) event masks
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+
+READ_SIZE = 64 * 1024
+
+
+class Inotify:
+    """
+    Linux inotify instance used through libc.
+
+    Events are used only as a wake up signal, so they are not parsed.
+
+    Arguments:
+        libc -- Loaded libc with inotify functions.
+    """
+
+    def __init__(self, libc: ctypes.CDLL) -> None:
+        self.libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.paths: Set[Path] = set()
+
+    @classmethod
+    def create(cls) -> Optional["Inotify"]:
+        """
+        Create inotify instance if current platform supports it.
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        except OSError:
+            return None
+        if not hasattr(libc, "inotify_init1"):
+            return None
+        try:
+            return cls(libc)
+        except OSError:
+            return None
+
+    def add_watch(self, path: Path) -> None:
+        """
+        Watch directory `path`, missing and already watched directories are skipped.
+        """
+        if path in self.paths or not path.is_dir():
+            return
+        if self.libc.inotify_add_watch(self.fd, os.fsencode(path), IN_MASK) < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path.as_posix())
+        self.paths.add(path)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """
+        Wait for events and drop them.
+
+        Arguments:
+            timeout -- Seconds to wait, None to wait forever.
+
+        Returns:
+            True if any event was received.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        while True:
+            try:
+                if not os.read(self.fd, READ_SIZE):
+                    break
+            except BlockingIOError:
+                break
+        return True
+
+    def close(self) -> None:
+        """
+        Close inotify file descriptor.
+        """
+        os.close(self.fd)
+
+
+class ServiceModelWatcher:
+    """
+    Watcher for changed JSON model files of selected services.
+
+    Files are expected at `<search_path>/<service>/<api_version>/<type>.json[.gz]`.
+    Linux inotify is used to wake up if available, otherwise modification times
+    are polled every `poll_interval` seconds. Watcher switches to polling if
+    a directory cannot be watched, for example if inotify watches limit is reached.
+
+    Arguments:
+        search_paths -- Botocore loader search paths.
+        service_names -- Services to watch.
+        poll_interval -- Seconds between checks without inotify.
+        use_inotify -- Whether to use inotify if available.
+    """
+
+    def __init__(
+        self,
+        search_paths: Iterable[str],
+        service_names: Iterable[ServiceName],
+        poll_interval: float = WATCH_POLL_INTERVAL,
+        use_inotify: bool = True,
+    ) -> None:
+        self.search_paths = [Path(i) for i in search_paths]
+        self.service_names = {i.name: i for i in service_names}
+        self.poll_interval = poll_interval
+        self.inotify = Inotify.create() if use_inotify else None
+        self._state = self._scan()
+
+    @property
+    def is_polling(self) -> bool:
+        """
+        Whether watcher polls modification times.
+        """
+        return self.inotify is None
+
+    def _iterate_watched_dirs(self) -> Iterable[Path]:
+        for search_path in self.search_paths:
+            yield search_path
+            for name in self.service_names:
+                service_path = search_path / name
+                yield service_path
+                if service_path.is_dir():
+                    yield from (i for i in service_path.iterdir() if i.is_dir())
+
+    def _add_watch(self, dir_path: Path) -> None:
+        assert self.inotify
+        try:
+            self.inotify.add_watch(dir_path)
+        except OSError as e:
+            # ENOSPC or EMFILE if inotify watches or instances limit is reached
+            get_logger().warning(
+                f"Cannot watch {NicePath(dir_path)}: {e}, polling every {self.poll_interval}s"
+            )
+            self.close()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        result: Dict[Path, Tuple[int, int]] = {}
+        for dir_path in self._iterate_watched_dirs():
+            if self.inotify:
+                self._add_watch(dir_path)
+            if dir_path.parent.parent not in self.search_paths or not dir_path.is_dir():
+                continue
+            for path in dir_path.glob("*.json*"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                result[path] = (stat.st_mtime_ns, stat.st_size)
+        return result
+
+    def get_changed_service_names(self) -> List[ServiceName]:
+        """
+        Get services with changed, added or removed model files since last check.
+        """
+        state = self._scan()
+        changed_paths = {
+            path
+            for path in state.keys() | self._state.keys()
+            if state.get(path) != self._state.get(path)
+        }
+        self._state = state
+        changed_names = {path.parent.parent.name for path in changed_paths}
+        return [
+            service_name
+            for name, service_name in self.service_names.items()
+            if name in changed_names
+        ]
+
+    def wait(self, timeout: Optional[float] = None) -> List[ServiceName]:
+        """
+        Wait for service model changes.
+
+        Arguments:
+            timeout -- Seconds to wait, None to wait forever.
+
+        Returns:
+            Changed services, empty on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            if self.inotify:
+                if self.inotify.wait(remaining):
+                    # let editors and copy tools finish writing before reading models
+                    time.sleep(WATCH_SETTLE_TIME)
+                    self.inotify.wait(0)
+            else:
+                time.sleep(
+                    self.poll_interval if remaining is None else min(self.poll_interval, remaining)
+                )
+
+            result = self.get_changed_service_names()
+            if result:
+                return result
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+
+    def close(self) -> None:
+        """
+        Stop watching.
+        """
+        if self.inotify:
+            self.inotify.close()
+            self.inotify = None
@@ -0,0 +1,187 @@
+"""
+PEP 427 wheel builder for rendered packages.
+"""
+import ast
+import base64
+import hashlib
+import io
+import os
+import re
+import time
+import zipfile
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+WHEEL_TAG = "py3-none-any"
+DEFAULT_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def get_setup_kwargs(setup_content: str) -> Dict[str, Any]:
+    """
+    Get literal keyword arguments of `setup(...)` call from `setup.py` source.
+
+    Arguments:
+        setup_content -- Rendered `setup.py` content.
+
+    Returns:
+        A dictionary of literal arguments, non-literal arguments are skipped.
+    """
+    result: Dict[str, Any] = {}
+    for node in ast.walk(ast.parse(setup_content)):
+        if not isinstance(node, ast.Call):
+            continue
+        if not isinstance(node.func, ast.Name) or node.func.id != "setup":
+            continue
+        for keyword in node.keywords:
+            if keyword.arg is None:
+                continue
+            try:
+                result[keyword.arg] = ast.literal_eval(keyword.value)
+            except ValueError:
+                continue
+    return result
+
+
+def get_distribution_name(name: str) -> str:
+    """
+    Get escaped distribution name for wheel file name.
+    """
+    return re.sub(r"[^\w\d.]+", "_", name, flags=re.UNICODE)
+
+
+def get_wheel_name(name: str, version: str) -> str:
+    """
+    Get wheel file name.
+    """
+    return f"{get_distribution_name(name)}-{version}-{WHEEL_TAG}.whl"
+
+
+def get_date_time() -> Tuple[int, int, int, int, int, int]:
+    """
+    Get zip entries timestamp from `SOURCE_DATE_EPOCH`, or a fixed one.
+    """
+    source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not source_date_epoch:
+        return DEFAULT_DATE_TIME
+    date_time = time.gmtime(max(int(source_date_epoch), 315532800))[:6]
+    return (date_time[0], date_time[1], date_time[2], date_time[3], date_time[4], date_time[5])
+
+
+def _get_requirement_lines(setup_kwargs: Mapping[str, Any]) -> List[str]:
+    result: List[str] = []
+    for requirement in setup_kwargs.get("install_requires", []):
+        result.append(f"Requires-Dist: {requirement}")
+    for extra_name, requirements in setup_kwargs.get("extras_require", {}).items():
+        result.append(f"Provides-Extra: {extra_name}")
+        for requirement in requirements:
+            marker = f'extra == "{extra_name}"'
+            if ";" in requirement:
+                requirement, requirement_marker = requirement.split(";", 1)
+                marker = f"({requirement_marker.strip()}) and {marker}"
+            result.append(f"Requires-Dist: {requirement.strip()}; {marker}")
+    return result
+
+
+def get_metadata(setup_kwargs: Mapping[str, Any], readme: str) -> str:
+    """
+    Get core metadata 2.1 `METADATA` file content.
+
+    Arguments:
+        setup_kwargs -- `setup` keyword arguments.
+        readme -- Long description in MarkDown.
+
+    Returns:
+        File content.
+    """
+    lines = [
+        "Metadata-Version: 2.1",
+        f"Name: {setup_kwargs['name']}",
+        f"Version: {setup_kwargs['version']}",
+        f"Summary: {setup_kwargs.get('description', '')}",
+        f"Home-page: {setup_kwargs.get('url', '')}",
+        f"Author: {setup_kwargs.get('author', '')}",
+        f"Author-email: {setup_kwargs.get('author_email', '')}",
+        f"License: {setup_kwargs.get('license', '')}",
+    ]
+    for name, url in setup_kwargs.get("project_urls", {}).items():
+        lines.append(f"Project-URL: {name}, {url}")
+    if setup_kwargs.get("keywords"):
+        lines.append(f"Keywords: {setup_kwargs['keywords']}")
+    for classifier in setup_kwargs.get("classifiers", []):
+        lines.append(f"Classifier: {classifier}")
+    if setup_kwargs.get("python_requires"):
+        lines.append(f"Requires-Python: {setup_kwargs['python_requires']}")
+    lines.extend(_get_requirement_lines(setup_kwargs))
+    lines.append("Description-Content-Type: text/markdown")
+    return "\n".join(lines) + "\n\n" + readme
+
+
+def get_wheel_info(generator: str) -> str:
+    """
+    Get `WHEEL` file content.
+    """
+    return (
+        "Wheel-Version: 1.0\n"
+        f"Generator: {generator}\n"
+        "Root-Is-Purelib: true\n"
+        f"Tag: {WHEEL_TAG}\n"
+    )
+
+
+def get_record_line(path: str, data: bytes) -> str:
+    """
+    Get `RECORD` line with urlsafe base64 SHA256 digest and size.
+    """
+    digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=")
+    return f"{path},sha256={digest.decode()},{len(data)}"
+
+
+def build_wheel(
+    setup_kwargs: Mapping[str, Any],
+    readme: str,
+    files: Iterable[Tuple[str, str]],
+    generator: str,
+) -> bytes:
+    """
+    Build reproducible wheel content.
+
+    Entries are sorted, have the same timestamp and permissions, so the same input
+    always produces the same bytes.
+
+    Arguments:
+        setup_kwargs -- `setup` keyword arguments.
+        readme -- Long description in MarkDown.
+        files -- Pairs of archive path and text content.
+        generator -- Generator name for `WHEEL` file.
+
+    Returns:
+        Wheel zip archive content.
+    """
+    name = get_distribution_name(setup_kwargs["name"])
+    dist_info_path = f"{name}-{setup_kwargs['version']}.dist-info"
+    entries = [(path, content.encode()) for path, content in sorted(files)]
+    top_level_names = sorted({path.split("/")[0] for path, _ in entries})
+    entries.extend(
+        (
+            (f"{dist_info_path}/METADATA", get_metadata(setup_kwargs, readme).encode()),
+            (f"{dist_info_path}/WHEEL", get_wheel_info(generator).encode()),
+            (
+                f"{dist_info_path}/top_level.txt",
+                "".join(f"{i}\n" for i in top_level_names).encode(),
+            ),
+        )
+    )
+    record_path = f"{dist_info_path}/RECORD"
+    record_lines = [get_record_line(path, data) for path, data in entries]
+    record_lines.append(f"{record_path},,")
+    entries.append((record_path, "".join(f"{i}\n" for i in record_lines).encode()))
+
+    date_time = get_date_time()
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path, data in entries:
+            zip_info = zipfile.ZipInfo(path, date_time=date_time)
+            zip_info.create_system = 3
+            zip_info.external_attr = 0o100644 << 16
+            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(zip_info, data)
+    return stream.getvalue()
@@ -8,6 +8,7 @@ from mypy_boto3_builder.constants import BOTOCORE_STUBS_NAME, BOTOCORE_STUBS_STA
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.utils.markdown import fix_pypi_headers
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.file_writer import FileWriter, get_unknown_paths
 from mypy_boto3_builder.writers.utils import (
     blackify,
     format_md,
@@ -32,8 +33,6 @@ def write_botocore_stubs_package(output_path: Path, generate_setup: bool) -> Non
     else:
         package_path = output_path / "botocore"
 
-    package_path.mkdir(exist_ok=True, parents=True)
-
     templates_path = Path("botocore-stubs")
     module_templates_path = templates_path / "botocore-stubs"
     file_paths: List[Tuple[Path, Path]] = []
@@ -53,35 +52,33 @@ def write_botocore_stubs_package(output_path: Path, generate_setup: bool) -> Non
         ]
     )
 
-    for file_path, template_path in file_paths:
-        content = render_jinja2_template(template_path)
-        if file_path.suffix in [".py", ".pyi"]:
-            content = sort_imports(
-                content,
-                "boto3_stubs",
-                extension="pyi",
-            )
-            content = blackify(content, file_path)
-        if file_path.suffix == ".md":
-            content = insert_md_toc(content)
-            content = fix_pypi_headers(content)
-            content = format_md(content)
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+    with FileWriter.create(setup_path if generate_setup else None) as file_writer:
+        for file_path, template_path in file_paths:
+            content = render_jinja2_template(template_path)
+            if file_path.suffix in [".py", ".pyi"]:
+                content = sort_imports(
+                    content,
+                    "boto3_stubs",
+                    extension="pyi",
+                )
+                content = blackify(content, file_path)
+            if file_path.suffix == ".md":
+                content = insert_md_toc(content)
+                content = fix_pypi_headers(content)
+                content = format_md(content)
+            file_writer.write(file_path, content)
 
-    static_paths = []
-    for static_path in BOTOCORE_STUBS_STATIC_PATH.glob("**/*.pyi"):
-        relative_output_path = static_path.relative_to(BOTOCORE_STUBS_STATIC_PATH)
-        file_path = package_path / relative_output_path
-        static_paths.append(file_path)
-        file_path.parent.mkdir(exist_ok=True)
-        content = static_path.read_text()
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+        static_paths = []
+        for static_path in BOTOCORE_STUBS_STATIC_PATH.glob("**/*.pyi"):
+            relative_output_path = static_path.relative_to(BOTOCORE_STUBS_STATIC_PATH)
+            file_path = package_path / relative_output_path
+            static_paths.append(file_path)
+            content = static_path.read_text()
+            file_writer.write(file_path, content)
 
     valid_paths = (*dict(file_paths).keys(), *static_paths)
-    for unknown_path in NicePath(setup_path if generate_setup else package_path).walk(valid_paths):
-        unknown_path.unlink()
-        logger.debug(f"Deleted {NicePath(unknown_path)}")
+    for unknown_path in get_unknown_paths(
+        setup_path if generate_setup else package_path, valid_paths
+    ):
+        if FileWriter.sink.delete(unknown_path):
+            logger.debug(f"Deleted {NicePath(unknown_path)}")
@@ -0,0 +1,101 @@
+"""
+Common package writer.
+"""
+from pathlib import Path
+from typing import List, Tuple
+
+from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.structures.common_package import CommonPackage
+from mypy_boto3_builder.utils.markdown import fix_pypi_headers
+from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.file_writer import FileWriter, get_unknown_paths
+from mypy_boto3_builder.writers.utils import (
+    blackify,
+    format_md,
+    insert_md_toc,
+    render_jinja2_template,
+    sort_imports,
+)
+
+
+def write_common_package(package: CommonPackage, output_path: Path, generate_setup: bool) -> None:
+    """
+    Create stubs files for types shared between services.
+
+    Arguments:
+        package -- Common package.
+        output_path -- Path to output folder.
+        generate_setup -- Generate ready-to-install or to-use package.
+    """
+    logger = get_logger()
+    setup_path = output_path / "common_package"
+    if generate_setup:
+        package_path = setup_path / package.name
+    else:
+        package_path = output_path / package.name
+
+    templates_path = Path("common_package")
+    module_templates_path = templates_path / "common_package"
+    file_paths: List[Tuple[Path, Path]] = []
+    if generate_setup:
+        file_paths.extend(
+            [
+                (setup_path / "setup.py", templates_path / "setup.py.jinja2"),
+                (setup_path / "README.md", templates_path / "README.md.jinja2"),
+            ]
+        )
+
+    file_paths.extend(
+        [
+            (package_path / "__init__.py", module_templates_path / "__init__.py.jinja2"),
+            (package_path / "py.typed", module_templates_path / "py.typed.jinja2"),
+            (package_path / "version.py", module_templates_path / "version.py.jinja2"),
+        ]
+    )
+    if package.literals:
+        file_paths.extend(
+            (
+                (
+                    package_path / ServiceModuleName.literals.stub_file_name,
+                    module_templates_path / ServiceModuleName.literals.template_name,
+                ),
+                (
+                    package_path / ServiceModuleName.literals.file_name,
+                    module_templates_path / ServiceModuleName.literals.template_name,
+                ),
+            )
+        )
+    if package.typed_dicts:
+        file_paths.extend(
+            (
+                (
+                    package_path / ServiceModuleName.type_defs.stub_file_name,
+                    module_templates_path / ServiceModuleName.type_defs.template_name,
+                ),
+                (
+                    package_path / ServiceModuleName.type_defs.file_name,
+                    module_templates_path / ServiceModuleName.type_defs.template_name,
+                ),
+            )
+        )
+
+    with FileWriter.create(setup_path if generate_setup else None) as file_writer:
+        for file_path, template_path in file_paths:
+            content = render_jinja2_template(template_path, package=package)
+            if file_path.suffix in [".py", ".pyi"]:
+                content = sort_imports(content, package.name, extension="pyi")
+                content = blackify(content, file_path)
+            if file_path.suffix == ".md":
+                content = insert_md_toc(content)
+                content = fix_pypi_headers(content)
+                content = format_md(content)
+
+            file_writer.write(file_path, content)
+
+    valid_paths = dict(file_paths).keys()
+    for unknown_path in get_unknown_paths(
+        setup_path if generate_setup else package_path, valid_paths
+    ):
+        if FileWriter.sink.delete(unknown_path):
+            logger.debug(f"Deleted {NicePath(unknown_path)}")
@@ -0,0 +1,190 @@
+"""
+Output files writer with a thread pool.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from mypy_boto3_builder.constants import WRITE_THREADS
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.wheel import (
+    WHEEL_TAG,
+    build_wheel,
+    get_distribution_name,
+    get_setup_kwargs,
+    get_wheel_name,
+)
+from mypy_boto3_builder.writers.sinks import DirectorySink, Sink
+from mypy_boto3_builder.writers.utils import FormatError
+
+__all__ = ["FileWriter", "WheelFileWriter", "get_unknown_paths"]
+
+
+class FileWriter:
+    """
+    Output files writer with a thread pool.
+
+    Files are written to `FileWriter.sink` in background threads, so rendering of the next
+    file does not wait for disk I/O. Sinks that need a stable order get all files sorted
+    by path on `wait`. Use as a context manager to wait for all writes.
+
+    Arguments:
+        max_workers -- Max number of writer threads.
+    """
+
+    build_wheels = False
+    sink: Sink = DirectorySink()
+
+    def __init__(self, max_workers: int = WRITE_THREADS) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures: List[Tuple[Path, "Future[bool]"]] = []
+        self._ordered_files: Dict[Path, str] = {}
+
+    def __enter__(self) -> "FileWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self._executor.shutdown(wait=True)
+            if isinstance(exc_value, FormatError) and isinstance(self.sink, DirectorySink):
+                # keep invalid code in output directory to check for errors
+                self.sink.write(exc_value.file_path, exc_value.content)
+            return
+        self.wait()
+
+    @classmethod
+    def create(cls, setup_path: Optional[Path] = None) -> "FileWriter":
+        """
+        Get writer for package files.
+
+        Arguments:
+            setup_path -- Path to package directory with `setup.py`, if it is generated.
+
+        Returns:
+            WheelFileWriter if `build_wheels` is set and `setup_path` is given, FileWriter otherwise.
+        """
+        if setup_path is not None and cls.build_wheels:
+            return WheelFileWriter(setup_path)
+        return cls()
+
+    def write(self, file_path: Path, content: str) -> None:
+        """
+        Schedule `content` write to `file_path`.
+
+        Arguments:
+            file_path -- Target file path.
+            content -- File content.
+        """
+        if self.sink.is_ordered:
+            self._ordered_files[file_path] = content
+            return
+        future = self._executor.submit(self.sink.write, file_path, content)
+        self._futures.append((file_path, future))
+
+    def wait(self) -> List[Path]:
+        """
+        Wait for all scheduled writes.
+
+        Returns:
+            A list of updated paths.
+
+        Raises:
+            Exception -- The first error raised by a write.
+        """
+        logger = get_logger()
+        result: List[Path] = []
+        try:
+            for file_path, future in self._futures:
+                if future.result():
+                    logger.debug(f"Updated {NicePath(file_path)}")
+                    result.append(file_path)
+            for file_path in sorted(self._ordered_files):
+                if self.sink.write(file_path, self._ordered_files[file_path]):
+                    logger.debug(f"Updated {NicePath(file_path)}")
+                    result.append(file_path)
+        finally:
+            self._futures.clear()
+            self._ordered_files.clear()
+            self._executor.shutdown(wait=True)
+        return result
+
+
+class WheelFileWriter(FileWriter):
+    """
+    Writer that collects package files in memory and writes a PEP 427 wheel.
+
+    Wheel metadata is taken from rendered `setup.py` and `README.md`, the wheel is written
+    to `FileWriter.sink` next to `setup_path`.
+
+    Arguments:
+        setup_path -- Path to package directory with `setup.py`.
+    """
+
+    generator = "mypy-boto3-builder"
+
+    def __init__(self, setup_path: Path) -> None:
+        super().__init__(max_workers=1)
+        self.setup_path = setup_path
+        self.files: Dict[str, str] = {}
+
+    def write(self, file_path: Path, content: str) -> None:
+        """
+        Collect `content` for `file_path` inside `setup_path`.
+        """
+        self.files[file_path.relative_to(self.setup_path).as_posix()] = content
+
+    def wait(self) -> List[Path]:
+        """
+        Build and write wheel from collected files.
+
+        Returns:
+            A list with wheel path if it was updated.
+        """
+        logger = get_logger()
+        super().wait()
+        files = dict(self.files)
+        self.files.clear()
+        setup_kwargs = get_setup_kwargs(files.pop("setup.py"))
+        readme = files.pop("README.md", "")
+        top_level_names = {i.split(".")[0] for i in setup_kwargs.get("packages", [])}
+        package_files = [
+            (path, content)
+            for path, content in files.items()
+            if path.split("/")[0] in top_level_names
+        ]
+        wheel_name = get_wheel_name(setup_kwargs["name"], setup_kwargs["version"])
+        wheel_path = self.setup_path.parent / wheel_name
+        old_wheel_pattern = f"{get_distribution_name(setup_kwargs['name'])}-*-{WHEEL_TAG}.whl"
+        for old_wheel_path in self.sink.find_paths(wheel_path.parent, old_wheel_pattern):
+            if old_wheel_path != wheel_path and self.sink.delete(old_wheel_path):
+                logger.debug(f"Deleted {NicePath(old_wheel_path)}")
+
+        content = build_wheel(setup_kwargs, readme, package_files, self.generator)
+        if not self.sink.write(wheel_path, content):
+            return []
+
+        logger.debug(f"Updated {NicePath(wheel_path)}")
+        return [wheel_path]
+
+
+def get_unknown_paths(root_path: Path, valid_paths: Iterable[Path]) -> List[Path]:
+    """
+    Get files in `root_path` that are not in `valid_paths`.
+
+    Only `DirectorySink` has existing files, other sinks start from scratch.
+
+    Arguments:
+        root_path -- Output directory.
+        valid_paths -- Current output file paths.
+
+    Returns:
+        A list of existing stale file paths.
+    """
+    return FileWriter.sink.get_unknown_paths(root_path, valid_paths)
@@ -0,0 +1,137 @@
+"""
+Manifest with hashes of written output files.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from mypy_boto3_builder.constants import MANIFEST_NAME
+
+__all__ = ["Manifest"]
+
+
+class Manifest:
+    """
+    Manifest with hashes of written output files.
+
+    Stores SHA256 digest, size and modification time for each file, so unchanged
+    files can be skipped without reading them back.
+
+    Arguments:
+        root_path -- Output directory, manifest file is stored there.
+    """
+
+    _loaded: Dict[Path, "Manifest"] = {}
+
+    def __init__(self, root_path: Path) -> None:
+        self.root_path = root_path
+        self.path = root_path / MANIFEST_NAME
+        self.records: Dict[str, List[Any]] = {}
+        self.changed = False
+        self.is_loaded = False
+
+    @classmethod
+    def load(cls, root_path: Path) -> "Manifest":
+        """
+        Load manifest from `root_path` and use it for files in this directory.
+
+        Arguments:
+            root_path -- Output directory.
+
+        Returns:
+            Loaded or new manifest.
+        """
+        result = cls(root_path)
+        try:
+            result.records = json.loads(result.path.read_text())
+            result.is_loaded = True
+        except (OSError, ValueError):
+            result.records = {}
+        cls._loaded[root_path] = result
+        return result
+
+    @classmethod
+    def unload(cls, root_path: Path) -> None:
+        """
+        Stop using manifest for files in `root_path`.
+        """
+        cls._loaded.pop(root_path, None)
+
+    @classmethod
+    def find(cls, file_path: Path) -> Optional["Manifest"]:
+        """
+        Find loaded manifest for `file_path`.
+        """
+        for parent in (file_path, *file_path.parents):
+            if parent in cls._loaded:
+                return cls._loaded[parent]
+        return None
+
+    def _get_key(self, file_path: Path) -> str:
+        return file_path.relative_to(self.root_path).as_posix()
+
+    def is_current(self, file_path: Path, digest: str) -> bool:
+        """
+        Whether `file_path` is recorded with `digest` and was not changed since.
+
+        Arguments:
+            file_path -- Output file path.
+            digest -- Expected SHA256 hex digest.
+        """
+        record = self.records.get(self._get_key(file_path))
+        if not record or record[0] != digest:
+            return False
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        return record[1:] == [stat.st_size, stat.st_mtime_ns]
+
+    def set(self, file_path: Path, digest: str) -> None:
+        """
+        Record `digest` and current stat for `file_path`.
+
+        Arguments:
+            file_path -- Output file path.
+            digest -- File SHA256 hex digest.
+        """
+        stat = file_path.stat()
+        self.records[self._get_key(file_path)] = [digest, stat.st_size, stat.st_mtime_ns]
+        self.changed = True
+
+    def remove(self, file_path: Path) -> None:
+        """
+        Drop record for deleted `file_path`.
+        """
+        if self.records.pop(self._get_key(file_path), None) is not None:
+            self.changed = True
+
+    def get_paths(self, parent_path: Path) -> List[Path]:
+        """
+        Get recorded paths inside `parent_path`.
+
+        Arguments:
+            parent_path -- Directory inside manifest root.
+
+        Returns:
+            A list of file paths.
+        """
+        prefix = f"{self._get_key(parent_path)}/"
+        if prefix == "./":
+            prefix = ""
+        return [self.root_path / key for key in self.records if key.startswith(prefix)]
+
+    def save(self) -> None:
+        """
+        Save manifest if it was changed, records for removed files are dropped.
+        """
+        if not self.changed:
+            return
+
+        self.records = {
+            key: record
+            for key, record in sorted(self.records.items())
+            if (self.root_path / key).exists()
+        }
+        self.path.write_text(json.dumps(self.records, indent=0))
+        self.changed = False
@@ -8,6 +8,7 @@ from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.structures.master_package import MasterPackage
 from mypy_boto3_builder.utils.markdown import fix_pypi_headers
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.file_writer import FileWriter, get_unknown_paths
 from mypy_boto3_builder.writers.utils import (
     blackify,
     format_md,
@@ -33,8 +34,6 @@ def write_master_package(package: MasterPackage, output_path: Path, generate_set
     else:
         package_path = output_path / package.name
 
-    package_path.mkdir(exist_ok=True, parents=True)
-
     templates_path = Path("master")
     module_templates_path = templates_path / "master"
     file_paths: List[Tuple[Path, Path]] = []
@@ -75,21 +74,22 @@ def write_master_package(package: MasterPackage, output_path: Path, generate_set
         ]
     )
 
-    for file_path, template_path in file_paths:
-        content = render_jinja2_template(template_path, package=package)
-        if file_path.suffix in [".py", ".pyi"]:
-            content = sort_imports(content, "mypy_boto3", extension=file_path.suffix[1:])
-            content = blackify(content, file_path)
-        if file_path.suffix == ".md":
-            content = insert_md_toc(content)
-            content = fix_pypi_headers(content)
-            content = format_md(content)
+    with FileWriter.create(setup_path if generate_setup else None) as file_writer:
+        for file_path, template_path in file_paths:
+            content = render_jinja2_template(template_path, package=package)
+            if file_path.suffix in [".py", ".pyi"]:
+                content = sort_imports(content, "mypy_boto3", extension=file_path.suffix[1:])
+                content = blackify(content, file_path)
+            if file_path.suffix == ".md":
+                content = insert_md_toc(content)
+                content = fix_pypi_headers(content)
+                content = format_md(content)
 
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+            file_writer.write(file_path, content)
 
     valid_paths = dict(file_paths).keys()
-    for unknown_path in NicePath(setup_path if generate_setup else package_path).walk(valid_paths):
-        unknown_path.unlink()
-        logger.debug(f"Deleted {NicePath(unknown_path)}")
+    for unknown_path in get_unknown_paths(
+        setup_path if generate_setup else package_path, valid_paths
+    ):
+        if FileWriter.sink.delete(unknown_path):
+            logger.debug(f"Deleted {NicePath(unknown_path)}")
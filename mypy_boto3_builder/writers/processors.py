@@ -1,34 +1,65 @@
 """
 Processors for parsing and writing modules.
 """
+import gc
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Sequence
 
 from boto3.session import Session
 
+from mypy_boto3_builder.constants import (
+    BOTO3_STUBS_NAME,
+    BOTOCORE_STUBS_NAME,
+    COMMON_MODULE_NAME,
+    MODULE_NAME,
+)
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.parsers.boto3_stubs_package import parse_boto3_stubs_package
+from mypy_boto3_builder.parsers.boto3_utils import clear_boto3_cache
+from mypy_boto3_builder.parsers.common_package import parse_common_package
 from mypy_boto3_builder.parsers.master_package import parse_master_package
 from mypy_boto3_builder.parsers.service_package import parse_service_package
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
+from mypy_boto3_builder.structures.common_package import CommonPackage
 from mypy_boto3_builder.structures.master_package import MasterPackage
 from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
+from mypy_boto3_builder.utils.memory import MemoryProfiler
 from mypy_boto3_builder.utils.nice_path import NicePath
 from mypy_boto3_builder.writers.boto3_stubs_package import (
     write_boto3_stubs_docs,
     write_boto3_stubs_package,
 )
 from mypy_boto3_builder.writers.botocore_stubs_package import write_botocore_stubs_package
+from mypy_boto3_builder.writers.common_package import write_common_package
 from mypy_boto3_builder.writers.master_package import write_master_package
 from mypy_boto3_builder.writers.service_package import write_service_docs, write_service_package
 
 
+def release_parsed_data(session: Session) -> None:
+    """
+    Free memory of released service parses.
+
+    Parsed type trees and boto3 clients have reference cycles, so they are collected
+    right away instead of piling up until the next full garbage collection.
+    Botocore model caches are dropped too.
+
+    Arguments:
+        session -- boto3 session.
+    """
+    clear_boto3_cache(session)
+    gc.collect()
+
+
 def process_boto3_stubs(
     session: Session,
     output_path: Path,
     service_names: List[ServiceName],
     generate_setup: bool,
+    essential_overloads_first: bool = False,
+    service_summaries: Optional[Sequence[ServiceSummary]] = None,
+    compact_overloads: bool = False,
 ) -> Boto3StubsPackage:
     """
     Parse and write stubs package `boto3_stubs`.
@@ -38,16 +69,27 @@ def process_boto3_stubs(
         output_path -- Package output path.
         service_names -- List of known service names.
         generate_setup -- Generate ready-to-install or to-use package.
+        essential_overloads_first -- Put overloads for essential services first.
+        service_summaries -- Already built service summaries, parsed by default.
+        compact_overloads -- Pass shared overload arguments as unpacked `**kwargs`.
 
     Return:
         Parsed Boto3StubsPackage.
     """
     logger = get_logger()
     logger.debug("Parsing boto3 stubs")
-    boto3_stubs_package = parse_boto3_stubs_package(session=session, service_names=service_names)
+    with MemoryProfiler.measure(BOTO3_STUBS_NAME, "parse"):
+        boto3_stubs_package = parse_boto3_stubs_package(
+            session=session,
+            service_names=service_names,
+            essential_overloads_first=essential_overloads_first,
+            service_summaries=service_summaries,
+            compact_overloads=compact_overloads,
+        )
     logger.debug(f"Writing boto3 stubs to {NicePath(output_path)}")
 
-    write_boto3_stubs_package(boto3_stubs_package, output_path, generate_setup=generate_setup)
+    with MemoryProfiler.measure(BOTO3_STUBS_NAME, "write"):
+        write_boto3_stubs_package(boto3_stubs_package, output_path, generate_setup=generate_setup)
     return boto3_stubs_package
 
 
@@ -65,7 +107,8 @@ def process_botocore_stubs(
     logger = get_logger()
     logger.debug(f"Writing botocore stubs to {NicePath(output_path)}")
 
-    write_botocore_stubs_package(output_path, generate_setup=generate_setup)
+    with MemoryProfiler.measure(BOTOCORE_STUBS_NAME, "write"):
+        write_botocore_stubs_package(output_path, generate_setup=generate_setup)
 
 
 def process_master(
@@ -73,6 +116,7 @@ def process_master(
     output_path: Path,
     service_names: List[ServiceName],
     generate_setup: bool,
+    service_summaries: Optional[Sequence[ServiceSummary]] = None,
 ) -> MasterPackage:
     """
     Parse and write master package `mypy_boto3`.
@@ -82,71 +126,148 @@ def process_master(
         output_path -- Package output path.
         service_names -- List of known service names.
         generate_setup -- Generate ready-to-install or to-use package.
+        service_summaries -- Already built service summaries, parsed by default.
 
     Return:
         Parsed MasterPackage.
     """
     logger = get_logger()
     logger.debug("Parsing master")
-    master_package = parse_master_package(session, service_names)
+    with MemoryProfiler.measure(MODULE_NAME, "parse"):
+        master_package = parse_master_package(session, service_names, service_summaries)
     logger.debug(f"Writing master to {NicePath(output_path)}")
 
-    write_master_package(master_package, output_path=output_path, generate_setup=generate_setup)
+    with MemoryProfiler.measure(MODULE_NAME, "write"):
+        write_master_package(master_package, output_path=output_path, generate_setup=generate_setup)
     return master_package
 
 
+def process_common(
+    session: Session,
+    output_path: Path,
+    service_names: List[ServiceName],
+    generate_setup: bool,
+) -> CommonPackage:
+    """
+    Parse and write package `mypy_boto3_common` with types shared between services.
+
+    Arguments:
+        session -- boto3 session.
+        output_path -- Package output path.
+        service_names -- List of service names to find shared types in.
+        generate_setup -- Generate ready-to-install or to-use package.
+
+    Return:
+        Parsed CommonPackage.
+    """
+    logger = get_logger()
+
+    def iterate_service_packages() -> Iterator[ServicePackage]:
+        for service_name in service_names:
+            logger.debug(f"Parsing {service_name.boto3_name} shared types")
+            service_package = parse_service_package(session, service_name)
+            for typed_dict in service_package.typed_dicts:
+                typed_dict.replace_self_references()
+            yield service_package
+            del service_package
+            release_parsed_data(session)
+
+    with MemoryProfiler.measure(COMMON_MODULE_NAME, "parse"):
+        common_package = parse_common_package(iterate_service_packages())
+    logger.debug(
+        f"Found {len(common_package.typed_dicts)} shared TypedDicts"
+        f" and {len(common_package.literals)} shared Literals"
+    )
+    logger.debug(f"Writing {common_package.name} to {NicePath(output_path)}")
+
+    with MemoryProfiler.measure(COMMON_MODULE_NAME, "write"):
+        write_common_package(common_package, output_path=output_path, generate_setup=generate_setup)
+    return common_package
+
+
 def process_service(
     session: Session,
     service_name: ServiceName,
     output_path: Path,
     generate_setup: bool,
-) -> ServicePackage:
+    common_package: Optional[CommonPackage] = None,
+    split_type_defs: bool = False,
+    light_runtime_types: bool = False,
+    operation_names: Optional[Iterable[str]] = None,
+) -> ServiceSummary:
     """
     Parse and write service package `mypy_boto3_*`.
 
+    Parsed package is released after writing, only its summary is kept.
+
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
         output_path -- Package output path.
         generate_setup -- Generate ready-to-install or to-use package.
+        common_package -- Package with shared types to import instead of defining.
+        split_type_defs -- Write `type_defs` as a package with part modules.
+        light_runtime_types -- Build runtime TypedDicts and Literals on first access.
+        operation_names -- Client operations, paginators and waiters to keep, all by default.
 
     Return:
-        Parsed ServicePackage.
+        Written package ServiceSummary.
     """
     logger = get_logger()
     logger.debug(f"Parsing {service_name.boto3_name}")
-    service_module = parse_service_package(session, service_name)
-    for typed_dict in service_module.typed_dicts:
-        typed_dict.replace_self_references()
+    with MemoryProfiler.measure(service_name.name, "parse"):
+        service_module = parse_service_package(session, service_name, operation_names)
+        for typed_dict in service_module.typed_dicts:
+            typed_dict.replace_self_references()
+        if common_package:
+            service_module.extract_shared_types(common_package)
+        if split_type_defs:
+            service_module.split_type_defs()
     logger.debug(f"Writing {service_name.boto3_name} to {NicePath(output_path)}")
 
-    write_service_package(service_module, output_path=output_path, generate_setup=generate_setup)
-    return service_module
+    with MemoryProfiler.measure(service_name.name, "write"):
+        write_service_package(
+            service_module,
+            output_path=output_path,
+            generate_setup=generate_setup,
+            light_runtime_types=light_runtime_types,
+        )
+    result = ServiceSummary.from_service_package(service_module)
+    del service_module
+    release_parsed_data(session)
+    return result
 
 
 def process_service_docs(
     session: Session,
     service_name: ServiceName,
     output_path: Path,
-) -> ServicePackage:
+) -> ServiceSummary:
     """
     Parse and write service package docs.
 
+    Parsed package is released after writing, only its summary is kept.
+
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
         output_path -- Package output path.
 
     Return:
-        Parsed ServicePackage.
+        Documented package ServiceSummary.
     """
     logger = get_logger()
     logger.debug(f"Parsing {service_name.boto3_name}")
-    service_module = parse_service_package(session, service_name)
+    with MemoryProfiler.measure(service_name.name, "parse"):
+        service_module = parse_service_package(session, service_name)
     logger.debug(f"Writing {service_name.boto3_name} to {NicePath(output_path)}")
 
-    write_service_docs(service_module, output_path=output_path)
-    return service_module
+    with MemoryProfiler.measure(service_name.name, "docs"):
+        write_service_docs(service_module, output_path=output_path)
+    result = ServiceSummary.from_service_package(service_module)
+    del service_module
+    release_parsed_data(session)
+    return result
 
 
 def process_boto3_stubs_docs(
@@ -167,8 +288,10 @@ def process_boto3_stubs_docs(
     """
     logger = get_logger()
     logger.debug("Parsing boto3 stubs")
-    boto3_stubs_package = parse_boto3_stubs_package(session, service_names)
+    with MemoryProfiler.measure(BOTO3_STUBS_NAME, "parse"):
+        boto3_stubs_package = parse_boto3_stubs_package(session, service_names)
     logger.debug(f"Writing boto3 stubs to {NicePath(output_path)}")
 
-    write_boto3_stubs_docs(boto3_stubs_package, output_path=output_path)
+    with MemoryProfiler.measure(BOTO3_STUBS_NAME, "docs"):
+        write_boto3_stubs_docs(boto3_stubs_package, output_path=output_path)
     return boto3_stubs_package
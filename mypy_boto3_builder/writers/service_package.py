@@ -2,13 +2,15 @@
 Service package writer.
 """
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.type_defs_part import TypeDefsPart
 from mypy_boto3_builder.utils.markdown import fix_pypi_headers
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.file_writer import FileWriter, get_unknown_paths
 from mypy_boto3_builder.writers.utils import (
     blackify,
     format_md,
@@ -18,7 +20,104 @@ from mypy_boto3_builder.writers.utils import (
 )
 
 
-def write_service_package(package: ServicePackage, output_path: Path, generate_setup: bool) -> None:
+def _get_type_defs_parts_paths(
+    package: ServicePackage, type_defs_path: Path
+) -> Dict[Path, TypeDefsPart]:
+    result: Dict[Path, TypeDefsPart] = {}
+    for part in package.type_defs_parts:
+        result[type_defs_path / f"{part.name}.pyi"] = part
+        result[type_defs_path / f"{part.name}.py"] = part
+    return result
+
+
+def _get_type_defs_package_file_paths(
+    type_defs_path: Path, templates_path: Path, type_defs_parts: Dict[Path, TypeDefsPart]
+) -> List[Tuple[Path, Path]]:
+    result = [
+        (type_defs_path / "__init__.pyi", templates_path / "__init__.pyi.jinja2"),
+        (type_defs_path / "__init__.py", templates_path / "__init__.pyi.jinja2"),
+    ]
+    for part_path in type_defs_parts:
+        result.append((part_path, templates_path / "part.pyi.jinja2"))
+    return result
+
+
+def _get_type_defs_file_paths(
+    package: ServicePackage,
+    package_path: Path,
+    module_templates_path: Path,
+    type_defs_parts: Dict[Path, TypeDefsPart],
+) -> List[Tuple[Path, Path]]:
+    type_defs_path = package_path / ServiceModuleName.type_defs.value
+    if type_defs_parts:
+        return _get_type_defs_package_file_paths(
+            type_defs_path,
+            module_templates_path / ServiceModuleName.type_defs.value,
+            type_defs_parts,
+        )
+    if package.typed_dicts or package.shared_typed_dicts:
+        return [
+            (
+                package_path / ServiceModuleName.type_defs.stub_file_name,
+                module_templates_path / ServiceModuleName.type_defs.template_name,
+            ),
+            (
+                package_path / ServiceModuleName.type_defs.file_name,
+                module_templates_path / ServiceModuleName.type_defs.template_name,
+            ),
+        ]
+    return []
+
+
+def _get_part_context(
+    type_defs_parts: Dict[Path, TypeDefsPart], file_path: Path
+) -> Dict[str, TypeDefsPart]:
+    if file_path not in type_defs_parts:
+        return {}
+    return {"part": type_defs_parts[file_path]}
+
+
+def _remove_unused_type_defs_package(
+    type_defs_path: Path, type_defs_parts: Dict[Path, TypeDefsPart]
+) -> None:
+    if type_defs_parts:
+        return
+    logger = get_logger()
+    for file_path in get_unknown_paths(type_defs_path, []):
+        if FileWriter.sink.delete(file_path):
+            logger.debug(f"Deleted {NicePath(file_path)}")
+    if FileWriter.sink.delete(type_defs_path):
+        logger.debug(f"Deleted {NicePath(type_defs_path)}")
+
+
+def _get_light_runtime_file_paths(
+    file_paths: Iterable[Tuple[Path, Path]], package_path: Path, module_templates_path: Path
+) -> List[Tuple[Path, Path]]:
+    type_defs_path = package_path / ServiceModuleName.type_defs.value
+    literals_template_path = module_templates_path / "literals.py.jinja2"
+    type_defs_template_path = module_templates_path / "type_defs.py.jinja2"
+    light_templates = {
+        package_path / ServiceModuleName.literals.file_name: literals_template_path,
+        package_path / ServiceModuleName.type_defs.file_name: type_defs_template_path,
+        type_defs_path / "__init__.py": type_defs_template_path,
+    }
+    result: List[Tuple[Path, Path]] = []
+    for file_path, template_path in file_paths:
+        if file_path in light_templates:
+            result.append((file_path, light_templates[file_path]))
+            continue
+        if file_path.parent == type_defs_path and file_path.suffix == ".py":
+            continue
+        result.append((file_path, template_path))
+    return result
+
+
+def write_service_package(
+    package: ServicePackage,
+    output_path: Path,
+    generate_setup: bool,
+    light_runtime_types: bool = False,
+) -> None:
     """
     Create stubs files for service.
 
@@ -26,6 +125,8 @@ def write_service_package(package: ServicePackage, output_path: Path, generate_s
         package -- Service package.
         output_path -- Path to output folder.
         generate_setup -- Generate ready-to-install or to-use package.
+        light_runtime_types -- Write runtime `type_defs.py` and `literals.py` that build
+            types on first access.
     """
     logger = get_logger()
     setup_path = output_path / f"{package.service_name.module_name}_package"
@@ -34,8 +135,6 @@ def write_service_package(package: ServicePackage, output_path: Path, generate_s
     else:
         package_path = output_path / package.name
 
-    package_path.mkdir(exist_ok=True, parents=True)
-
     templates_path = Path("service")
     module_templates_path = templates_path / "service"
     file_paths: List[Tuple[Path, Path]] = []
@@ -50,7 +149,7 @@ def write_service_package(package: ServicePackage, output_path: Path, generate_s
         [
             (package_path / "version.py", module_templates_path / "version.py.jinja2"),
             (package_path / "__init__.pyi", module_templates_path / "__init__.pyi.jinja2"),
-            (package_path / "__init__.py", module_templates_path / "__init__.pyi.jinja2"),
+            (package_path / "__init__.py", module_templates_path / "__init__.py.jinja2"),
             (package_path / "__main__.py", module_templates_path / "__main__.py.jinja2"),
             (package_path / "py.typed", module_templates_path / "py.typed.jinja2"),
             (
@@ -102,7 +201,7 @@ def write_service_package(package: ServicePackage, output_path: Path, generate_s
                 ),
             )
         )
-    if package.literals:
+    if package.literals or package.shared_literals:
         file_paths.extend(
             (
                 (
@@ -115,42 +214,41 @@ def write_service_package(package: ServicePackage, output_path: Path, generate_s
                 ),
             )
         )
-    if package.typed_dicts:
-        file_paths.extend(
-            (
-                (
-                    package_path / ServiceModuleName.type_defs.stub_file_name,
-                    module_templates_path / ServiceModuleName.type_defs.template_name,
-                ),
-                (
-                    package_path / ServiceModuleName.type_defs.file_name,
-                    module_templates_path / ServiceModuleName.type_defs.template_name,
-                ),
-            )
-        )
+    type_defs_path = package_path / ServiceModuleName.type_defs.value
+    type_defs_parts = _get_type_defs_parts_paths(package, type_defs_path)
+    file_paths.extend(
+        _get_type_defs_file_paths(package, package_path, module_templates_path, type_defs_parts)
+    )
 
-    for file_path, template_path in file_paths:
-        content = render_jinja2_template(
-            template_path,
-            package=package,
-            service_name=package.service_name,
-        )
-        if file_path.suffix in [".py", ".pyi"]:
-            content = sort_imports(content, package.service_name.module_name, extension="pyi")
-            content = blackify(content, file_path)
-        if file_path.suffix == ".md":
-            content = insert_md_toc(content)
-            content = fix_pypi_headers(content)
-            content = format_md(content)
+    if light_runtime_types:
+        file_paths = _get_light_runtime_file_paths(file_paths, package_path, module_templates_path)
 
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+    with FileWriter.create(setup_path if generate_setup else None) as file_writer:
+        for file_path, template_path in file_paths:
+            content = render_jinja2_template(
+                template_path,
+                package=package,
+                service_name=package.service_name,
+                **_get_part_context(type_defs_parts, file_path),
+            )
+            if file_path.suffix in [".py", ".pyi"]:
+                content = sort_imports(content, package.service_name.module_name, extension="pyi")
+                content = blackify(content, file_path)
+            if file_path.suffix == ".md":
+                content = insert_md_toc(content)
+                content = fix_pypi_headers(content)
+                content = format_md(content)
+
+            file_writer.write(file_path, content)
 
     valid_paths = dict(file_paths).keys()
-    for unknown_path in NicePath(setup_path if generate_setup else package_path).walk(valid_paths):
-        unknown_path.unlink()
-        logger.debug(f"Deleted {NicePath(unknown_path)}")
+    for unknown_path in get_unknown_paths(
+        setup_path if generate_setup else package_path, valid_paths
+    ):
+        if FileWriter.sink.delete(unknown_path):
+            logger.debug(f"Deleted {NicePath(unknown_path)}")
+
+    _remove_unused_type_defs_package(type_defs_path, type_defs_parts)
 
 
 def write_service_docs(package: ServicePackage, output_path: Path) -> None:
@@ -163,7 +261,6 @@ def write_service_docs(package: ServicePackage, output_path: Path) -> None:
     """
     logger = get_logger()
     docs_path = output_path / f"{package.service_name.module_name}"
-    docs_path.mkdir(exist_ok=True)
     templates_path = Path("service_docs")
     file_paths = [
         (docs_path / "README.md", templates_path / "README.md.jinja2"),
@@ -187,19 +284,18 @@ def write_service_docs(package: ServicePackage, output_path: Path) -> None:
             (docs_path / "service_resource.md", templates_path / "service_resource.md.jinja2")
         )
 
-    for file_path, template_path in file_paths:
-        content = render_jinja2_template(
-            template_path,
-            package=package,
-            service_name=package.service_name,
-        )
-        content = insert_md_toc(content)
-        content = format_md(content)
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+    with FileWriter() as file_writer:
+        for file_path, template_path in file_paths:
+            content = render_jinja2_template(
+                template_path,
+                package=package,
+                service_name=package.service_name,
+            )
+            content = insert_md_toc(content)
+            content = format_md(content)
+            file_writer.write(file_path, content)
 
     valid_paths = dict(file_paths).keys()
-    for unknown_path in NicePath(docs_path).walk(valid_paths):
-        unknown_path.unlink()
-        logger.debug(f"Deleted {NicePath(unknown_path)}")
+    for unknown_path in get_unknown_paths(docs_path, valid_paths):
+        if FileWriter.sink.delete(unknown_path):
+            logger.debug(f"Deleted {NicePath(unknown_path)}")
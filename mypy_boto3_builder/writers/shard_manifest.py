@@ -0,0 +1,173 @@
+"""
+Manifest with service summaries built by one build shard.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from mypy_boto3_builder.constants import SHARD_MANIFEST_NAME
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
+
+__all__ = ["ShardManifest", "ShardMergeError"]
+
+SHARD_MANIFEST_VERSION = 1
+
+
+class ShardMergeError(Exception):
+    """
+    Shard manifests do not form one complete build.
+    """
+
+
+class ShardManifest:
+    """
+    Manifest with service summaries built by one build shard.
+
+    Master and boto3-stubs packages are built from merged manifests of all shards,
+    so service models are not parsed again.
+
+    Arguments:
+        index -- Shard index, starts from 1.
+        count -- Total number of shards.
+        build_version -- Output packages version.
+        service_names -- Names of all services selected for the whole build.
+        service_summaries -- Summaries of services built by this shard.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        count: int,
+        build_version: str,
+        service_names: Iterable[str],
+        service_summaries: Iterable[ServiceSummary] = tuple(),
+    ) -> None:
+        self.index = index
+        self.count = count
+        self.build_version = build_version
+        self.service_names = list(service_names)
+        self.service_summaries = list(service_summaries)
+
+    @staticmethod
+    def get_path(output_path: Path, index: int, count: int) -> Path:
+        """
+        Get manifest path for output directory or next to output archive.
+
+        Arguments:
+            output_path -- Output directory or archive path.
+            index -- Shard index.
+            count -- Total number of shards.
+        """
+        name = SHARD_MANIFEST_NAME.format(index=index, count=count)
+        if output_path.name.endswith((".zip", ".tar.zst")):
+            return output_path.parent / name
+        return output_path / name
+
+    @staticmethod
+    def find_paths(paths: Iterable[Path]) -> List[Path]:
+        """
+        Find manifest files in `paths`.
+
+        Arguments:
+            paths -- Manifest files or directories that contain them.
+
+        Returns:
+            A sorted list of manifest paths.
+        """
+        pattern = SHARD_MANIFEST_NAME.format(index="*", count="*")
+        result: Set[Path] = set()
+        for path in paths:
+            if path.is_dir():
+                result.update(path.glob(pattern))
+            else:
+                result.add(path)
+        return sorted(result)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get JSON-serializable manifest data.
+        """
+        return {
+            "version": SHARD_MANIFEST_VERSION,
+            "index": self.index,
+            "count": self.count,
+            "build_version": self.build_version,
+            "service_names": self.service_names,
+            "service_summaries": [i.to_dict() for i in self.service_summaries],
+        }
+
+    def save(self, path: Path) -> None:
+        """
+        Save manifest to `path`.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+
+    @classmethod
+    def load(cls, path: Path) -> "ShardManifest":
+        """
+        Load manifest from `path`.
+
+        Raises:
+            ShardMergeError -- If manifest cannot be read.
+        """
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            raise ShardMergeError(f"Cannot read shard manifest {path}: {e}") from e
+        if data.get("version") != SHARD_MANIFEST_VERSION:
+            raise ShardMergeError(f"Unsupported shard manifest version in {path}")
+        return cls(
+            index=data["index"],
+            count=data["count"],
+            build_version=data["build_version"],
+            service_names=data["service_names"],
+            service_summaries=[ServiceSummary.from_dict(i) for i in data["service_summaries"]],
+        )
+
+    @staticmethod
+    def merge(manifests: Iterable["ShardManifest"]) -> Tuple[str, List[ServiceSummary]]:
+        """
+        Merge manifests of all shards of one build.
+
+        Arguments:
+            manifests -- Manifests of all shards.
+
+        Returns:
+            A tuple of build version and service summaries in build order.
+
+        Raises:
+            ShardMergeError -- If a shard is missing or shards are from different builds.
+        """
+        manifests = sorted(manifests, key=lambda x: x.index)
+        if not manifests:
+            raise ShardMergeError("No shard manifests found")
+        first = manifests[0]
+        for manifest in manifests:
+            if (manifest.count, manifest.build_version, manifest.service_names) != (
+                first.count,
+                first.build_version,
+                first.service_names,
+            ):
+                raise ShardMergeError(
+                    f"Shard {manifest.index}/{manifest.count} is from a different build"
+                    f" than shard {first.index}/{first.count}"
+                )
+
+        indexes = [i.index for i in manifests]
+        missing_indexes = sorted(set(range(1, first.count + 1)) - set(indexes))
+        if missing_indexes:
+            missing_str = ", ".join(f"{i}/{first.count}" for i in missing_indexes)
+            raise ShardMergeError(f"Missing shards: {missing_str}")
+        if len(indexes) != len(set(indexes)):
+            raise ShardMergeError("Duplicate shard manifests found")
+
+        summaries = {
+            summary.service_name.name: summary
+            for manifest in manifests
+            for summary in manifest.service_summaries
+        }
+        missing_names = [i for i in first.service_names if i not in summaries]
+        if missing_names:
+            raise ShardMergeError(f"Services are missing in shards: {', '.join(missing_names)}")
+        return first.build_version, [summaries[i] for i in first.service_names]
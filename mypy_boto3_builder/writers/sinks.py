@@ -0,0 +1,384 @@
+"""
+Output sinks for generated files.
+"""
+import calendar
+import io
+import os
+import tarfile
+import tempfile
+import zipfile
+from abc import ABC, abstractmethod
+from fnmatch import fnmatch
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Dict, Iterable, List, Optional, Set, Type, Union
+
+from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.wheel import get_date_time
+from mypy_boto3_builder.writers.manifest import Manifest
+from mypy_boto3_builder.writers.utils import iterate_encoded_chunks, write_file
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+__all__ = [
+    "Sink",
+    "DirectorySink",
+    "MemorySink",
+    "ZipSink",
+    "TarZstSink",
+    "get_output_sink",
+]
+
+Content = Union[str, bytes]
+
+
+class Sink:
+    """
+    Base output sink, discards all files.
+
+    Use as a context manager, output is finalized on successful exit.
+    """
+
+    # Sink requires writes in a stable order from one thread
+    is_ordered = False
+
+    def __enter__(self) -> "Sink":
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self.abort()
+            return
+        self.close()
+
+    def open(self) -> None:
+        """
+        Prepare sink for writing.
+        """
+
+    def write(self, file_path: Path, content: Content) -> bool:
+        """
+        Write `content` to `file_path`.
+
+        Arguments:
+            file_path -- Target file path.
+            content -- File text or binary content.
+
+        Returns:
+            True if file was written.
+        """
+        return False
+
+    def get_unknown_paths(self, root_path: Path, valid_paths: Iterable[Path]) -> List[Path]:
+        """
+        Get existing files in `root_path` that are not in `valid_paths`.
+        """
+        return []
+
+    def find_paths(self, parent_path: Path, pattern: str) -> List[Path]:
+        """
+        Get existing files directly in `parent_path` with names matching `pattern`.
+        """
+        return []
+
+    def delete(self, path: Path) -> bool:
+        """
+        Delete existing file or empty directory `path`.
+
+        Returns:
+            True if `path` was deleted.
+        """
+        return False
+
+    def close(self) -> None:
+        """
+        Finalize output.
+        """
+
+    def abort(self) -> None:
+        """
+        Discard unfinished output.
+        """
+
+
+class DirectorySink(Sink):
+    """
+    Sink that writes files atomically to disk, parent directories are created.
+
+    Arguments:
+        root_path -- Output directory to create on open.
+    """
+
+    def __init__(self, root_path: Optional[Path] = None) -> None:
+        self.root_path = root_path
+        self._dir_paths: Set[Path] = set()
+
+    def open(self) -> None:
+        """
+        Create output directory.
+        """
+        if self.root_path:
+            self.root_path.mkdir(exist_ok=True, parents=True)
+
+    def write(self, file_path: Path, content: Content) -> bool:
+        """
+        Write `content` to `file_path` if it is changed.
+        """
+        if file_path.parent not in self._dir_paths:
+            file_path.parent.mkdir(exist_ok=True, parents=True)
+            self._dir_paths.add(file_path.parent)
+        return write_file(file_path, content)
+
+    def get_unknown_paths(self, root_path: Path, valid_paths: Iterable[Path]) -> List[Path]:
+        """
+        Get files in `root_path` that are not in `valid_paths`.
+
+        If a previous output manifest is loaded, recorded files are checked instead
+        of walking the directory.
+        """
+        manifest = Manifest.find(root_path)
+        if manifest is None or not manifest.is_loaded:
+            return list(NicePath(root_path).walk(valid_paths))
+
+        valid_path_set = set(valid_paths)
+        return [i for i in manifest.get_paths(root_path) if i not in valid_path_set and i.is_file()]
+
+    def find_paths(self, parent_path: Path, pattern: str) -> List[Path]:
+        """
+        Get files directly in `parent_path` with names matching `pattern`.
+        """
+        return sorted(i for i in parent_path.glob(pattern) if i.is_file())
+
+    def delete(self, path: Path) -> bool:
+        """
+        Delete file or empty directory `path`, manifest record is dropped for a file.
+
+        Returns:
+            True if `path` was deleted, False if it does not exist or is a non-empty directory.
+        """
+        if path.is_dir():
+            try:
+                path.rmdir()
+            except OSError:
+                return False
+            self._dir_paths.discard(path)
+            return True
+
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        manifest = Manifest.find(path)
+        if manifest is not None:
+            manifest.remove(path)
+        return True
+
+
+class MemorySink(Sink):
+    """
+    Sink that keeps files in memory.
+    """
+
+    def __init__(self) -> None:
+        self.files: Dict[Path, Content] = {}
+
+    def write(self, file_path: Path, content: Content) -> bool:
+        """
+        Store `content` for `file_path`.
+        """
+        if self.files.get(file_path) == content:
+            return False
+        self.files[file_path] = content
+        return True
+
+    def find_paths(self, parent_path: Path, pattern: str) -> List[Path]:
+        """
+        Get stored files directly in `parent_path` with names matching `pattern`.
+        """
+        return sorted(i for i in self.files if i.parent == parent_path and fnmatch(i.name, pattern))
+
+    def delete(self, path: Path) -> bool:
+        """
+        Drop stored file `path`.
+        """
+        return self.files.pop(path, None) is not None
+
+
+class ArchiveSink(Sink, ABC):
+    """
+    Base sink that streams files to a temporary archive that replaces `archive_path` on close.
+
+    Entry paths are relative to `archive_path`, every entry has the same timestamp
+    and permissions, so the same writes always produce the same archive.
+
+    Arguments:
+        archive_path -- Output archive path.
+    """
+
+    is_ordered = True
+
+    def __init__(self, archive_path: Path) -> None:
+        self.archive_path = archive_path
+        self._stream: Optional[IO[bytes]] = None
+        self._names: Set[str] = set()
+
+    def open(self) -> None:
+        """
+        Open temporary archive next to `archive_path`.
+        """
+        self.archive_path.parent.mkdir(exist_ok=True, parents=True)
+        self._stream = tempfile.NamedTemporaryFile(
+            dir=self.archive_path.parent, prefix=f".{self.archive_path.name}.", delete=False
+        )
+        self._names.clear()
+        self._open_archive(self._stream)
+
+    @abstractmethod
+    def _open_archive(self, stream: IO[bytes]) -> None:
+        """
+        Start archive in temporary `stream`.
+        """
+
+    def _get_name(self, file_path: Path) -> str:
+        name = file_path.relative_to(self.archive_path).as_posix()
+        if name in self._names:
+            raise ValueError(f"Duplicate archive entry {name}")
+        self._names.add(name)
+        return name
+
+    @abstractmethod
+    def _close_archive(self) -> None:
+        """
+        Write archive end records to temporary stream.
+        """
+
+    def close(self) -> None:
+        """
+        Finish archive and move it to `archive_path`.
+        """
+        if self._stream is None:
+            return
+        self._close_archive()
+        self._stream.close()
+        os.chmod(self._stream.name, 0o644)
+        os.replace(self._stream.name, self.archive_path)
+        self._stream = None
+
+    def abort(self) -> None:
+        """
+        Remove temporary archive.
+        """
+        if self._stream is None:
+            return
+        try:
+            self._close_archive()
+        finally:
+            self._stream.close()
+            os.remove(self._stream.name)
+            self._stream = None
+
+
+class ZipSink(ArchiveSink):
+    """
+    Sink that streams files to a `.zip` archive.
+    """
+
+    def __init__(self, archive_path: Path) -> None:
+        super().__init__(archive_path)
+        self._archive: Optional[zipfile.ZipFile] = None
+
+    def _open_archive(self, stream: IO[bytes]) -> None:
+        self._archive = zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def write(self, file_path: Path, content: Content) -> bool:
+        """
+        Add `content` as `file_path` entry.
+        """
+        if self._archive is None:
+            raise ValueError(f"{self.archive_path} is not open")
+        zip_info = zipfile.ZipInfo(self._get_name(file_path), date_time=get_date_time())
+        zip_info.create_system = 3
+        zip_info.external_attr = 0o100644 << 16
+        zip_info.compress_type = zipfile.ZIP_DEFLATED
+        with self._archive.open(zip_info, "w") as stream:
+            for chunk in iterate_encoded_chunks(content):
+                stream.write(chunk)
+        return True
+
+    def _close_archive(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+
+class TarZstSink(ArchiveSink):
+    """
+    Sink that streams files to a `.tar.zst` archive.
+
+    Requires `zstandard` package.
+    """
+
+    def __init__(self, archive_path: Path) -> None:
+        super().__init__(archive_path)
+        self._compressor: Any = None
+        self._archive: Optional[tarfile.TarFile] = None
+
+    def open(self) -> None:
+        """
+        Open temporary tar archive with zstd compression.
+        """
+        if zstandard is None:
+            raise ValueError(f"Install zstandard to write {self.archive_path.name}")
+        super().open()
+
+    def _open_archive(self, stream: IO[bytes]) -> None:
+        self._compressor = zstandard.ZstdCompressor().stream_writer(stream, closefd=False)
+        self._archive = tarfile.open(fileobj=self._compressor, mode="w|", format=tarfile.PAX_FORMAT)
+
+    def write(self, file_path: Path, content: Content) -> bool:
+        """
+        Add `content` as `file_path` entry.
+        """
+        if self._archive is None:
+            raise ValueError(f"{self.archive_path} is not open")
+        data = b"".join(iterate_encoded_chunks(content))
+        tar_info = tarfile.TarInfo(self._get_name(file_path))
+        tar_info.size = len(data)
+        tar_info.mtime = calendar.timegm(get_date_time())
+        tar_info.mode = 0o644
+        self._archive.addfile(tar_info, io.BytesIO(data))
+        return True
+
+    def _close_archive(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+        if self._compressor is not None:
+            self._compressor.close()
+            self._compressor = None
+
+
+def get_output_sink(output_path: Path) -> Sink:
+    """
+    Get sink for `output_path`.
+
+    Arguments:
+        output_path -- Output directory, `.zip` or `.tar.zst` archive path.
+
+    Returns:
+        Archive sink for archive paths, DirectorySink otherwise.
+    """
+    if output_path.name.endswith(".zip"):
+        return ZipSink(output_path)
+    if output_path.name.endswith(".tar.zst"):
+        return TarZstSink(output_path)
+    return DirectorySink(output_path)
@@ -1,26 +1,112 @@
 """
 Jinja2 renderer and black formatter.
 """
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Union
 
 import black
 import mdformat
 from black import InvalidInput, NothingChanged
 from isort.api import Config, sort_code_string
 
-from mypy_boto3_builder.constants import LINE_LENGTH, TEMPLATES_PATH
+from mypy_boto3_builder.constants import (
+    FORMATTER_CACHE_SIZE,
+    ISORT_CONFIG_CACHE_SIZE,
+    LINE_LENGTH,
+    TEMPLATES_PATH,
+    WRITE_CHUNK_SIZE,
+)
 from mypy_boto3_builder.jinja_manager import JinjaManager
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.package import Package
 from mypy_boto3_builder.utils.markdown import TableOfContents
+from mypy_boto3_builder.writers.manifest import Manifest
+
+
+class FormatterCache:
+    """
+    LRU cache of formatter output by formatter options and input content digest.
+
+    Disabled by default, a long-running builder enables it, so files that are
+    rendered the same as before are not formatted again.
+    """
+
+    max_size = 0
+    _items: "OrderedDict[str, str]" = OrderedDict()
+
+    @classmethod
+    def enable(cls, max_size: int = FORMATTER_CACHE_SIZE) -> None:
+        """
+        Enable cache.
+
+        Arguments:
+            max_size -- Max number of cached outputs.
+        """
+        cls.max_size = max_size
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Disable and clear cache.
+        """
+        cls.max_size = 0
+        cls._items.clear()
+
+    @classmethod
+    def format(cls, formatter: Callable[[str], str], key: str, content: str) -> str:
+        """
+        Format `content` with `formatter` or get cached output.
+
+        Arguments:
+            formatter -- Function that formats content.
+            key -- Formatter name and options.
+            content -- Content to format.
+
+        Returns:
+            Formatted content.
+        """
+        if not cls.max_size:
+            return formatter(content)
+
+        digest = hashlib.sha256(f"{key}\n{content}".encode()).hexdigest()
+        if digest in cls._items:
+            cls._items.move_to_end(digest)
+            return cls._items[digest]
+
+        result = formatter(content)
+        cls._items[digest] = result
+        while len(cls._items) > cls.max_size:
+            cls._items.popitem(last=False)
+        return result
+
+
+class FormatError(ValueError):
+    """
+    Rendered Python code cannot be formatted.
+
+    Arguments:
+        message -- Error message.
+        file_path -- Target file path.
+        content -- Invalid content.
+    """
+
+    def __init__(self, message: str, file_path: Path, content: str) -> None:
+        super().__init__(message)
+        self.file_path = file_path
+        self.content = content
 
 
 def blackify(content: str, file_path: Path) -> str:
     """
     Format `content` with `black` if `file_path` is `*.py` or `*.pyi`.
 
-    On error writes invalid `content` to `file_path` to check for errors.
+    On error `FileWriter` writes invalid `content` to `file_path` to check for errors,
+    if output is a directory.
 
     Arguments:
         content -- Python code to format.
@@ -30,23 +116,48 @@ def blackify(content: str, file_path: Path) -> str:
         Formatted python code.
 
     Raises:
-        ValueError -- If `content` is not a valid Python code.
+        FormatError -- If `content` is not a valid Python code.
     """
     if file_path.suffix not in (".py", ".pyi"):
         return content
 
+    return FormatterCache.format(
+        lambda x: _blackify(x, file_path), f"black{file_path.suffix}", content
+    )
+
+
+def _blackify(content: str, file_path: Path) -> str:
     file_mode = black.FileMode(is_pyi=file_path.suffix == ".pyi", line_length=LINE_LENGTH)
     try:
         content = black.format_file_contents(content, fast=True, mode=file_mode)
     except NothingChanged:
         pass
     except (IndentationError, InvalidInput) as e:
-        file_path.write_text(content)
-        raise ValueError(f"Cannot parse {file_path}: {e}") from e
+        raise FormatError(f"Cannot parse {file_path}: {e}", file_path, content) from e
 
     return content
 
 
+@lru_cache(maxsize=ISORT_CONFIG_CACHE_SIZE)
+def _get_isort_config(module_name: str, third_party: Tuple[str, ...]) -> Config:
+    # isort caches module placement per Config instance, so configs are reused
+    known_third_party = list(third_party) or [
+        "boto3",
+        "botocore",
+        "typing_extensions",
+        "mypy_boto3",
+    ]
+    if module_name in known_third_party:
+        known_third_party.remove(module_name)
+
+    return Config(
+        profile="black",
+        known_first_party=[module_name],
+        known_third_party=known_third_party,
+        line_length=LINE_LENGTH,
+    )
+
+
 def sort_imports(
     content: str, module_name: str, extension: str = "py", third_party: Iterable[str] = ()
 ) -> str:
@@ -62,32 +173,20 @@ def sort_imports(
     Returns:
         New file content.
     """
-    known_third_party = list(third_party) or [
-        "boto3",
-        "botocore",
-        "typing_extensions",
-        "mypy_boto3",
-    ]
-    if module_name in known_third_party:
-        known_third_party.remove(module_name)
-
-    result = sort_code_string(
-        code=content,
-        extension=extension,
-        config=Config(
-            profile="black",
-            known_first_party=[module_name],
-            known_third_party=known_third_party,
-            line_length=LINE_LENGTH,
-        ),
+    third_party_names = tuple(third_party)
+    config = _get_isort_config(module_name, third_party_names)
+    return FormatterCache.format(
+        lambda x: sort_code_string(code=x, extension=extension, config=config) or "",
+        f"isort {module_name} {extension} {' '.join(third_party_names)}",
+        content,
     )
-    return result or ""
 
 
 def render_jinja2_template(
     template_path: Path,
     package: Optional[Package] = None,
     service_name: Optional[ServiceName] = None,
+    **kwargs: Any,
 ) -> str:
     """
     Render Jinja2 template to a string.
@@ -96,6 +195,7 @@ def render_jinja2_template(
         template_path -- Relative path to template in `TEMPLATES_PATH`
         module -- Module record.
         service_name -- ServiceName instance.
+        kwargs -- Extra template context.
 
     Returns:
         A rendered template.
@@ -105,7 +205,7 @@ def render_jinja2_template(
         raise ValueError(f"Template {template_path} not found")
 
     template = JinjaManager.get_environment().get_template(template_path.as_posix())
-    return template.render(package=package, service_name=service_name)
+    return template.render(package=package, service_name=service_name, **kwargs)
 
 
 def insert_md_toc(text: str) -> str:
@@ -136,9 +236,80 @@ def format_md(text: str) -> str:
     """
     Format MarkDown with mdformat.
     """
-    return mdformat.text(
+    return FormatterCache.format(
+        lambda x: mdformat.text(x, options={"wrap": 79}),
+        "mdformat",
         text,
-        options={
-            "wrap": 79,
-        },
     )
+
+
+def iterate_encoded_chunks(
+    content: Union[str, bytes], chunk_size: int = WRITE_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Encode `content` to UTF-8 by chunks without a full copy.
+    """
+    for index in range(0, len(content), chunk_size):
+        chunk = content[index : index + chunk_size]
+        yield chunk if isinstance(chunk, bytes) else chunk.encode()
+
+
+def get_file_digest(file_path: Path, chunk_size: int = WRITE_CHUNK_SIZE) -> str:
+    """
+    Get SHA256 hex digest of file content, file is read by chunks.
+    """
+    result = hashlib.sha256()
+    with file_path.open("rb") as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            result.update(chunk)
+    return result.hexdigest()
+
+
+def write_file(file_path: Path, content: Union[str, bytes]) -> bool:
+    """
+    Write `content` to `file_path` if it is changed.
+
+    Content is hashed by chunks and compared to the output manifest record, or
+    to the existing file digest. Changed content is written by chunks to a temporary file
+    in the same directory, that atomically replaces `file_path`. Temporary file is
+    removed on error.
+
+    Arguments:
+        file_path -- Target file path.
+        content -- File text or binary content.
+
+    Returns:
+        True if file was written.
+    """
+    digest = hashlib.sha256()
+    for chunk in iterate_encoded_chunks(content):
+        digest.update(chunk)
+    hexdigest = digest.hexdigest()
+
+    manifest = Manifest.find(file_path)
+    if manifest and manifest.is_current(file_path, hexdigest):
+        return False
+
+    mode = 0o644
+    if file_path.exists():
+        if get_file_digest(file_path) == hexdigest:
+            if manifest:
+                manifest.set(file_path, hexdigest)
+            return False
+        mode = file_path.stat().st_mode & 0o777
+
+    stream = tempfile.NamedTemporaryFile(
+        dir=file_path.parent, prefix=f".{file_path.name}.", delete=False
+    )
+    try:
+        with stream:
+            for chunk in iterate_encoded_chunks(content):
+                stream.write(chunk)
+        os.chmod(stream.name, mode)
+        os.replace(stream.name, file_path)
+    except BaseException:
+        os.remove(stream.name)
+        raise
+    if manifest:
+        manifest.set(file_path, hexdigest)
+    return True
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""
+Measure import time of generated service packages.
+
+Usage::
+
+    python scripts/benchmark_import_time.py -s ec2 s3 sqs -r 5
+    python scripts/benchmark_import_time.py -s ec2 -p ./before ./after
+"""
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT_PATH = Path(__file__).parent.parent.resolve()
+LOGGER_NAME = "benchmark"
+SCENARIOS: Dict[str, str] = {
+    "import": "import {module_name}",
+    "all names": (
+        "import {module_name}\n"
+        "for name in {module_name}.__all__:\n"
+        "    getattr({module_name}, name)"
+    ),
+}
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    """
+    Get Logger instance.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    stream_handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(message)s", datefmt="%H:%M:%S")
+    stream_handler.setFormatter(formatter)
+    stream_handler.setLevel(level)
+    logger.addHandler(stream_handler)
+    logger.setLevel(level)
+    return logger
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(__file__)
+    parser.add_argument(
+        "-s", "--services", nargs="+", default=["ec2", "s3", "sqs"], help="Services to check"
+    )
+    parser.add_argument(
+        "-p",
+        "--paths",
+        nargs="*",
+        type=Path,
+        default=[],
+        help="Existing `--installed` builds to compare, current builder output by default",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Runs per measurement")
+    return parser.parse_args()
+
+
+def build(output_path: Path, service_names: List[str]) -> None:
+    """
+    Build installed service packages without boto3 stubs, so runtime boto3 is not shadowed.
+    """
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "mypy_boto3_builder",
+            output_path.as_posix(),
+            "-s",
+            *service_names,
+            "--installed",
+            "--skip-master",
+        ],
+        cwd=ROOT_PATH,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def run_python(code: str, path: Path, repeat: int) -> float:
+    """
+    Get the best wall time of running `code` in a fresh interpreter with `path` in PYTHONPATH.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = path.as_posix()
+    result: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, "-c", code], env=env, cwd=path)
+        result.append(time.perf_counter() - start)
+    return min(result)
+
+
+def measure(path: Path, service_names: List[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Get import time in milliseconds for every service and scenario, interpreter startup excluded.
+    """
+    startup = run_python("pass", path, repeat)
+    result: Dict[str, Dict[str, float]] = {}
+    for service_name in service_names:
+        module_name = f"mypy_boto3_{service_name.replace('-', '_')}"
+        result[module_name] = {}
+        for scenario, code in SCENARIOS.items():
+            seconds = run_python(code.format(module_name=module_name), path, repeat) - startup
+            result[module_name][scenario] = seconds * 1000
+    return result
+
+
+def main() -> None:
+    args = parse_args()
+    logger = setup_logging()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths: List[Path] = [i.resolve() for i in args.paths]
+        if not paths:
+            paths.append(Path(temp_dir))
+            logger.info(f"Building {', '.join(args.services)}")
+            build(paths[0], args.services)
+
+        for path in paths:
+            logger.info(f"Import time for {path}, best of {args.repeat}, ms")
+            logger.info(f"{'module':<32}" + "".join(f"{i:>12}" for i in SCENARIOS))
+            for module_name, times in measure(path, args.services, args.repeat).items():
+                logger.info(f"{module_name:<32}" + "".join(f"{i:>12.1f}" for i in times.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+"""
+Compare type checker time on `boto3.client`/`boto3.resource` calls for overload strategies.
+
+Builds `boto3-stubs` for all services in default, `--essential-overloads-first` and
+`--compact-overloads` modes and checks a generated corpus of client and resource calls
+with mypy and pyright. `--essential-overloads-first` output is checked with gated
+overloads for non-essential services kept and skipped. Service packages are replaced
+with empty client and resource classes, so overload resolution is measured without
+service stubs checking time. Corpus uses only essential services, so it is valid in all modes.
+
+Usage::
+
+    python scripts/benchmark_overloads.py -c 200 -r 3
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+ROOT_PATH = Path(__file__).parent.parent.resolve()
+LOGGER_NAME = "benchmark"
+MODES: Dict[str, List[str]] = {
+    "default": [],
+    "essential-first": ["--essential-overloads-first"],
+    "essential-only": ["--essential-overloads-first"],
+    "compact": ["--compact-overloads"],
+}
+ESSENTIAL_ONLY_NAME = "BOTO3_STUBS_ESSENTIAL_ONLY"
+# value of ESSENTIAL_ONLY_NAME for type checkers, gated overloads are emitted only in these modes
+ESSENTIAL_ONLY_VALUES: Dict[str, bool] = {
+    "essential-first": False,
+    "essential-only": True,
+}
+SERVICE_IMPORT_RE = re.compile(r"^from (mypy_boto3_\w+)\.(\w+) import \(?\s*(\w+)", re.MULTILINE)
+CORPUS_SERVICES = (
+    ("s3", True),
+    ("ec2", True),
+    ("sqs", True),
+    ("dynamodb", True),
+    ("lambda", False),
+    ("rds", False),
+    ("cloudformation", True),
+)
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    """
+    Get Logger instance.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    stream_handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(message)s", datefmt="%H:%M:%S")
+    stream_handler.setFormatter(formatter)
+    stream_handler.setLevel(level)
+    logger.addHandler(stream_handler)
+    logger.setLevel(level)
+    return logger
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(__file__)
+    parser.add_argument("-c", "--calls", type=int, default=200, help="Calls in corpus")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument(
+        "-s",
+        "--services",
+        nargs="*",
+        default=[],
+        help="Services to build overloads for, all services by default",
+    )
+    return parser.parse_args()
+
+
+def build(output_path: Path, service_names: List[str], extra_args: List[str]) -> None:
+    """
+    Build installed `boto3-stubs` without service packages.
+    """
+    services_args = ["-s", *service_names] if service_names else []
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "mypy_boto3_builder",
+            output_path.as_posix(),
+            *services_args,
+            "--skip-services",
+            "--installed",
+            *extra_args,
+        ],
+        cwd=ROOT_PATH,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def write_service_placeholders(stubs_path: Path) -> None:
+    """
+    Write empty client and service resource classes imported by `boto3-stubs`.
+    """
+    boto3_path = stubs_path / "boto3"
+    source = (boto3_path / "__init__.pyi").read_text() + (boto3_path / "session.pyi").read_text()
+    modules: Dict[Path, Set[str]] = {}
+    for package_name, module_name, name in SERVICE_IMPORT_RE.findall(source):
+        package_path = stubs_path / package_name
+        package_path.mkdir(exist_ok=True)
+        (package_path / "__init__.pyi").write_text("")
+        modules.setdefault(package_path / f"{module_name}.pyi", set()).add(name)
+    for module_path, names in modules.items():
+        module_path.write_text("".join(f"class {name}: ...\n" for name in sorted(names)))
+
+
+def write_corpus(path: Path, calls: int) -> None:
+    """
+    Write a module with `calls` client and resource calls for common services.
+    """
+    lines = ["import boto3", "", "session = boto3.Session()", ""]
+    for index in range(calls):
+        service_name, has_resource = CORPUS_SERVICES[index % len(CORPUS_SERVICES)]
+        factory = "session" if index % 2 else "boto3"
+        lines.append(f'client_{index} = {factory}.client("{service_name}")')
+        if has_resource:
+            lines.append(f'resource_{index} = {factory}.resource("{service_name}")')
+    path.write_text("\n".join(lines) + "\n")
+
+
+def write_pyright_config(path: Path, essential_only: Optional[bool]) -> None:
+    """
+    Write `pyrightconfig.json` that uses stubs from its directory.
+    """
+    config: Dict[str, Any] = {"stubPath": "."}
+    if essential_only is not None:
+        config["defineConstant"] = {ESSENTIAL_ONLY_NAME: essential_only}
+    path.write_text(json.dumps(config))
+
+
+def get_commands(
+    corpus_path: Path, cache_path: Path, essential_only: Optional[bool]
+) -> Dict[str, List[str]]:
+    """
+    Get commands for available type checkers.
+    """
+    mypy_command = [
+        sys.executable,
+        "-m",
+        "mypy",
+        "--cache-dir",
+        cache_path.as_posix(),
+        "--ignore-missing-imports",
+    ]
+    if essential_only is not None:
+        mypy_command.extend(
+            ["--always-true" if essential_only else "--always-false", ESSENTIAL_ONLY_NAME]
+        )
+    result = {"mypy": [*mypy_command, corpus_path.as_posix()]}
+    pyright_path = shutil.which("pyright")
+    if pyright_path:
+        result["pyright"] = [pyright_path, corpus_path.as_posix()]
+    return result
+
+
+def run(command: List[str], stubs_path: Path) -> float:
+    """
+    Run type checker and get elapsed seconds, exit code is ignored.
+    """
+    env = dict(os.environ)
+    env["MYPYPATH"] = stubs_path.as_posix()
+    start = time.perf_counter()
+    subprocess.run(
+        command,
+        env=env,
+        cwd=stubs_path,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    args = parse_args()
+    logger = setup_logging()
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for mode, extra_args in MODES.items():
+            stubs_path = Path(temp_dir) / mode
+            logger.info(f"Building boto3-stubs with {mode} overloads")
+            build(stubs_path, args.services, extra_args)
+            write_service_placeholders(stubs_path)
+            corpus_path = stubs_path / "corpus.py"
+            write_corpus(corpus_path, args.calls)
+            essential_only = ESSENTIAL_ONLY_VALUES.get(mode)
+            write_pyright_config(stubs_path / "pyrightconfig.json", essential_only)
+            cache_path = Path(temp_dir) / f"{mode}_mypy_cache"
+            results[mode] = {}
+            for checker, command in get_commands(corpus_path, cache_path, essential_only).items():
+                timings: List[float] = []
+                for _ in range(args.repeat):
+                    shutil.rmtree(cache_path, ignore_errors=True)
+                    timings.append(run(command, stubs_path))
+                results[mode][checker] = statistics.median(timings)
+
+    checkers = sorted({i for result in results.values() for i in result})
+    logger.info(f"{'mode':<20}" + "".join(f"{i:>12}" for i in checkers))
+    for mode, result in results.items():
+        logger.info(f"{mode:<20}" + "".join(f"{result.get(i, 0.0):>12.2f}" for i in checkers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+Compare mypy cold and warm run time for monolithic and split `type_defs` modules.
+
+Usage::
+
+    python scripts/benchmark_split_type_defs.py -s ec2 -e examples/ec2_example.py -r 3
+"""
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT_PATH = Path(__file__).parent.parent.resolve()
+EXAMPLES_PATH = ROOT_PATH / "examples"
+LOGGER_NAME = "benchmark"
+MODES: Dict[str, List[str]] = {
+    "monolithic": [],
+    "split": ["--split-type-defs"],
+}
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    """
+    Get Logger instance.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    stream_handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(message)s", datefmt="%H:%M:%S")
+    stream_handler.setFormatter(formatter)
+    stream_handler.setLevel(level)
+    logger.addHandler(stream_handler)
+    logger.setLevel(level)
+    return logger
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(__file__)
+    parser.add_argument("-s", "--service", default="ec2", help="Service to build")
+    parser.add_argument(
+        "-e",
+        "--example",
+        type=Path,
+        default=EXAMPLES_PATH / "ec2_example.py",
+        help="File to check with mypy",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Runs per measurement")
+    return parser.parse_args()
+
+
+def build(output_path: Path, service_name: str, extra_args: List[str]) -> None:
+    """
+    Build installed stubs for `service_name` to `output_path`.
+    """
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "mypy_boto3_builder",
+            output_path.as_posix(),
+            "-s",
+            service_name,
+            "--installed",
+            *extra_args,
+        ],
+        cwd=ROOT_PATH,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def run_mypy(stubs_path: Path, cache_path: Path, example_path: Path) -> float:
+    """
+    Run mypy on `example_path` and return elapsed seconds.
+
+    Example files contain intentional errors, so exit code is ignored.
+    """
+    env = dict(os.environ)
+    env["MYPYPATH"] = stubs_path.as_posix()
+    start = time.perf_counter()
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "mypy",
+            "--cache-dir",
+            cache_path.as_posix(),
+            "--no-error-summary",
+            example_path.as_posix(),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def measure(stubs_path: Path, example_path: Path, repeat: int) -> Dict[str, float]:
+    """
+    Get median cold and warm mypy run time.
+    """
+    cold: List[float] = []
+    warm: List[float] = []
+    cache_path = stubs_path.parent / f"{stubs_path.name}_mypy_cache"
+    for _ in range(repeat):
+        shutil.rmtree(cache_path, ignore_errors=True)
+        cold.append(run_mypy(stubs_path, cache_path, example_path))
+        warm.append(run_mypy(stubs_path, cache_path, example_path))
+
+    return {"cold": statistics.median(cold), "warm": statistics.median(warm)}
+
+
+def main() -> None:
+    args = parse_args()
+    logger = setup_logging()
+    example_path = args.example.resolve()
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for mode, extra_args in MODES.items():
+            stubs_path = Path(temp_dir) / mode
+            logger.info(f"Building {args.service} stubs with {mode} type_defs")
+            build(stubs_path, args.service, extra_args)
+            logger.info(f"Running mypy {args.repeat} times on {example_path.name}")
+            results[mode] = measure(stubs_path, example_path, args.repeat)
+
+    logger.info(f"{'mode':<12}{'cold, s':>10}{'warm, s':>10}")
+    for mode, result in results.items():
+        logger.info(f"{mode:<12}{result['cold']:>10.2f}{result['warm']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Measure template loading cost of a fresh builder process.
+
+Every scenario runs in a new interpreter, the same way as a new worker process
+starts, and loads all `*.jinja2` templates.
+
+Usage::
+
+    python scripts/benchmark_templates.py -r 5
+"""
+import argparse
+import logging
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT_PATH = Path(__file__).parent.parent.resolve()
+LOGGER_NAME = "benchmark"
+LOAD_CODE = """
+import sys
+import time
+from pathlib import Path
+
+from mypy_boto3_builder.constants import TEMPLATES_PATH
+from mypy_boto3_builder.jinja_manager import JinjaManager
+
+cache_path = sys.argv[1]
+JinjaManager.set_bytecode_cache_path(Path(cache_path) if cache_path else None)
+environment = JinjaManager.get_environment()
+start = time.perf_counter()
+for path in sorted(TEMPLATES_PATH.glob("**/*.jinja2")):
+    environment.get_template(path.relative_to(TEMPLATES_PATH).as_posix())
+print(time.perf_counter() - start)
+"""
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    """
+    Get Logger instance.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    stream_handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(message)s", datefmt="%H:%M:%S")
+    stream_handler.setFormatter(formatter)
+    stream_handler.setLevel(level)
+    logger.addHandler(stream_handler)
+    logger.setLevel(level)
+    return logger
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(__file__)
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Runs per measurement")
+    return parser.parse_args()
+
+
+def load_templates(cache_path: Optional[Path]) -> float:
+    """
+    Load all templates in a new process and get elapsed seconds.
+    """
+    output = subprocess.check_output(
+        [sys.executable, "-c", LOAD_CODE, cache_path.as_posix() if cache_path else ""],
+        cwd=ROOT_PATH,
+        encoding="utf-8",
+    )
+    return float(output.strip())
+
+
+def main() -> None:
+    args = parse_args()
+    logger = setup_logging()
+    results: Dict[str, List[float]] = {"no cache": [], "cold cache": [], "warm cache": []}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_path = Path(temp_dir) / "jinja2"
+        for _ in range(args.repeat):
+            results["no cache"].append(load_templates(None))
+            shutil.rmtree(cache_path, ignore_errors=True)
+            results["cold cache"].append(load_templates(cache_path))
+            results["warm cache"].append(load_templates(cache_path))
+
+    logger.info(f"Template loading per process, best of {args.repeat}, ms")
+    for scenario, timings in results.items():
+        logger.info(f"{scenario:<12}{min(timings) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,3 +20,9 @@ class TestImportRecord:
         service_name_mock.name = "service_name"
         result = InternalImportRecord(service_name_mock, "name", "alias")
         assert result.get_external("module_name") is result
+
+    def test_get_nested(self) -> None:
+        service_name_mock = MagicMock()
+        service_name_mock.name = "service_name"
+        result = InternalImportRecord(service_name_mock, "name", "alias").get_nested()
+        assert result.render() == "from ..service_name import name as alias"
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock
 
+import pytest
+
 from mypy_boto3_builder.parsers.docstring_parser.docstring_parser import DocstringParser
 from mypy_boto3_builder.type_annotations.type import Type
 
@@ -81,6 +83,18 @@ class TestDocstringParser:
         result = docstring_parser.get_return_type(input_string)
         assert result == Type.none
 
+        input_string = ":rtype: :py:class:`NewService.Widget`"
+        result = docstring_parser.get_return_type(input_string)
+        assert result.render() == "_Widget"
+
+        input_string = ":rtype: list(:py:class:`newservice.Widget`)"
+        result = docstring_parser.get_return_type(input_string)
+        assert result.render() == "List[_Widget]"
+
+        input_string = ":rtype: UnknownType"
+        with pytest.raises(ValueError):
+            docstring_parser.get_return_type(input_string)
+
     def test_get_arguments(self) -> None:
         input_string = """
         :type name: string
@@ -4,6 +4,7 @@ from botocore.exceptions import UnknownServiceError
 
 from mypy_boto3_builder.parsers.boto3_stubs_package import parse_boto3_stubs_package
 from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
 
 
 class TestBoto3StubsPackage:
@@ -21,3 +22,109 @@ class TestBoto3StubsPackage:
         parse_boto3_stubs_package(
             session_mock, service_names=[service_name_mock, service_name2_mock]
         )
+
+    @patch("mypy_boto3_builder.parsers.boto3_stubs_package.parse_service_summary")
+    def test_parse_boto3_stubs_package_essential_first(
+        self, parse_service_summary_mock: MagicMock
+    ) -> None:
+        session_mock = MagicMock()
+        service_names = [
+            ServiceName("acm", "ACM"),
+            ServiceName("sqs", "SQS"),
+            ServiceName("ec2", "EC2"),
+        ]
+        parse_service_summary_mock.side_effect = lambda _, i: ServiceSummary(
+            i, f"{i.class_name}Client", f"{i.class_name}ServiceResource"
+        )
+
+        result = parse_boto3_stubs_package(session_mock, service_names)
+        names = [
+            i.arguments[0].type_annotation.children
+            for i in result.init_functions
+            if i.name == "client"
+        ]
+        assert names == [{"acm"}, {"sqs"}, {"ec2"}]
+        assert len(result.init_functions) == 6
+        assert len(result.session_class.methods) == 6
+        assert not result.gated_init_functions
+        assert not result.gated_session_methods
+
+        result = parse_boto3_stubs_package(
+            session_mock, service_names, essential_overloads_first=True
+        )
+        names = [
+            i.arguments[0].type_annotation.children
+            for i in result.init_functions
+            if i.name == "client"
+        ]
+        assert names == [{"ec2"}, {"sqs"}]
+        assert len(result.init_functions) == 4
+        assert len(result.session_class.methods) == 4
+        assert [
+            (i.name, i.arguments[0].type_annotation.children) for i in result.gated_init_functions
+        ] == [("client", {"acm"}), ("resource", {"acm"})]
+        assert len(result.gated_session_methods) == 2
+        assert [
+            ([i.name for i in functions], [i.name for i in gated_functions])
+            for functions, gated_functions in result.get_init_function_groups()
+        ] == [(["client", "client"], ["client"]), (["resource", "resource"], ["resource"])]
+        method_groups = result.get_session_method_groups()
+        assert [len(i) for group in method_groups for i in group] == [2, 1, 2, 1]
+        import_records = [i.render() for i in result.get_init_required_import_records()]
+        assert "from mypy_boto3_acm.client import ACMClient" in import_records
+        session_import_records = [i.render() for i in result.get_session_required_import_records()]
+        assert "from mypy_boto3_acm.client import ACMClient" in session_import_records
+        assert [i.service_name for i in result.service_summaries] == service_names
+
+    @patch("mypy_boto3_builder.parsers.boto3_stubs_package.parse_service_summary")
+    def test_parse_boto3_stubs_package_summaries(
+        self, parse_service_summary_mock: MagicMock
+    ) -> None:
+        service_name = ServiceName("sqs", "SQS")
+        service_summary = ServiceSummary(service_name, "SQSClient")
+        result = parse_boto3_stubs_package(
+            MagicMock(), [service_name], service_summaries=[service_summary]
+        )
+        assert result.service_summaries == [service_summary]
+        parse_service_summary_mock.assert_not_called()
+
+    @patch("mypy_boto3_builder.parsers.boto3_stubs_package.parse_service_summary")
+    def test_parse_boto3_stubs_package_compact(self, parse_service_summary_mock: MagicMock) -> None:
+        service_names = [ServiceName("sqs", "SQS"), ServiceName("s3", "S3")]
+        parse_service_summary_mock.side_effect = lambda _, i: ServiceSummary(
+            i, f"{i.class_name}Client"
+        )
+
+        result = parse_boto3_stubs_package(MagicMock(), service_names, compact_overloads=True)
+        assert result.client_kwargs is not None
+        assert [i.name for i in result.client_kwargs.children] == [
+            "api_version",
+            "use_ssl",
+            "verify",
+            "endpoint_url",
+            "aws_access_key_id",
+            "aws_secret_access_key",
+            "aws_session_token",
+            "config",
+        ]
+        assert not result.client_kwargs.get_required()
+        function = result.init_functions[0]
+        assert [i.name for i in function.arguments] == ["service_name", "region_name", "kwargs"]
+        assert function.arguments[-1].prefix == "**"
+        assert function.arguments[-1].type_annotation.render() == "Unpack[_ClientKwargs]"
+        method = result.session_class.methods[0]
+        assert [i.name for i in method.arguments] == [
+            "self",
+            "service_name",
+            "region_name",
+            "kwargs",
+        ]
+        import_records = [i.render() for i in result.get_init_required_import_records()]
+        assert "from boto3.session import _ClientKwargs" in import_records
+        assert "from typing_extensions import Unpack" in import_records
+        session_import_records = [i.render() for i in result.get_session_required_import_records()]
+        assert "from boto3.session import _ClientKwargs" not in session_import_records
+
+        result = parse_boto3_stubs_package(MagicMock(), service_names)
+        assert result.client_kwargs is None
+        assert len(result.init_functions[0].arguments) == 10
@@ -0,0 +1,28 @@
+from unittest.mock import MagicMock
+
+from mypy_boto3_builder.parsers.boto3_utils import clear_boto3_cache
+
+
+class TestBoto3Utils:
+    def test_clear_boto3_cache(self) -> None:
+        loader_mock = MagicMock()
+        loader_mock._cache = {
+            ("list_available_services", "service-2"): ["s3"],
+            ("load_service_model", "s3", "service-2"): {},
+            ("load_data_with_path", "s3/2006-03-01/service-2"): ({}, ""),
+        }
+        exceptions_factory_mock = MagicMock()
+        session_mock = MagicMock()
+        event_emitter_mock = MagicMock()
+        session_mock._session.get_component.side_effect = {
+            "data_loader": loader_mock,
+            "event_emitter": event_emitter_mock,
+        }.get
+        session_mock._session._get_internal_component.return_value = exceptions_factory_mock
+        clear_boto3_cache(session_mock)
+        assert list(loader_mock._cache) == [("list_available_services", "service-2")]
+        exceptions_factory_mock._client_exceptions_cache.clear.assert_called_once_with()
+        event_emitter_mock._alias_name_cache.clear.assert_called_once_with()
+        event_emitter_mock._emitter._lookup_cache.clear.assert_called_once_with()
+        clear_boto3_cache(session_mock, clear_listings=True)
+        assert not loader_mock._cache
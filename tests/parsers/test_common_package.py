@@ -0,0 +1,38 @@
+from unittest.mock import MagicMock
+
+from mypy_boto3_builder.parsers.common_package import parse_common_package
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypedDictAttribute, TypeTypedDict
+
+
+class TestCommonPackage:
+    @staticmethod
+    def _get_service_package(name: str, key_type: str) -> MagicMock:
+        result = MagicMock()
+        result.service_name = ServiceName(name, name.upper())
+        result.typed_dicts = [
+            TypeTypedDict("TagTypeDef", [TypedDictAttribute("Key", getattr(Type, key_type), True)]),
+            TypeTypedDict(f"{name}TypeDef", [TypedDictAttribute("Key", Type.str, True)]),
+        ]
+        result.literals = [TypeLiteral("StateType", ["on", "off"])]
+        return result
+
+    def test_parse_common_package(self) -> None:
+        result = parse_common_package(
+            [
+                self._get_service_package("s3", "str"),
+                self._get_service_package("ec2", "int"),
+                self._get_service_package("sqs", "str"),
+            ]
+        )
+        assert [i.boto3_name for i in result.service_names] == ["s3", "ec2", "sqs"]
+        assert [i.name for i in result.typed_dicts] == ["TagTypeDef"]
+        assert result.typed_dicts[0].children[0].type_annotation == Type.str
+        assert [i.name for i in result.literals] == ["StateType"]
+
+    def test_parse_common_package_single(self) -> None:
+        result = parse_common_package([self._get_service_package("s3", "str")])
+        assert result.typed_dicts == []
+        assert result.literals == []
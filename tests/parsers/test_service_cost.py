@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock, patch
+
+from mypy_boto3_builder.parsers.service_cost import get_service_cost, get_service_costs
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class TestServiceCost:
+    def test_get_service_cost(self) -> None:
+        session_mock = MagicMock()
+        session_mock._loader.load_service_model.return_value = {
+            "operations": {"ListQueues": {}, "SendMessage": {}},
+            "shapes": {"String": {}},
+        }
+        assert get_service_cost(session_mock, ServiceName("sqs", "SQS")) == 3
+        session_mock._loader.load_service_model.assert_called_with("sqs", "service-2")
+        session_mock._loader.load_service_model.return_value = {}
+        assert get_service_cost(session_mock, ServiceName("sqs", "SQS")) == 0
+
+    @patch("mypy_boto3_builder.parsers.service_cost.clear_boto3_cache")
+    @patch("mypy_boto3_builder.parsers.service_cost.get_service_cost")
+    def test_get_service_costs(
+        self, get_service_cost_mock: MagicMock, _clear_boto3_cache_mock: MagicMock
+    ) -> None:
+        session_mock = MagicMock()
+        service_names = [ServiceName("sqs", "SQS"), ServiceName("ec2", "EC2")]
+        get_service_cost_mock.side_effect = lambda _, i: {"sqs": 10, "ec2": 100}[i.name]
+        assert get_service_costs(session_mock, service_names) == [10, 100]
+        assert get_service_costs(session_mock, service_names, {"sqs": 2.0}) == [2.0, 20.0]
+
+        get_service_cost_mock.reset_mock()
+        assert get_service_costs(session_mock, service_names, {"sqs": 2.0, "ec2": 5.0}) == [
+            2.0,
+            5.0,
+        ]
+        get_service_cost_mock.assert_not_called()
@@ -2,6 +2,9 @@ from unittest.mock import MagicMock, patch
 
 from mypy_boto3_builder.parsers.service_package import parse_service_package
 from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.method import Method
+from mypy_boto3_builder.type_annotations.type import Type
 
 
 class TestBoto3StubsPackage:
@@ -16,3 +19,65 @@ class TestBoto3StubsPackage:
 
         result = parse_service_package(session_mock, service_name=service_name_mock)
         assert result.service_name == service_name_mock
+
+    @patch("mypy_boto3_builder.parsers.service_package.parse_service_resource")
+    @patch("mypy_boto3_builder.parsers.service_package.parse_client")
+    @patch("mypy_boto3_builder.parsers.service_package.ShapeParser")
+    def test_parse_service_package_operation_names(
+        self,
+        ShapeParserMock: MagicMock,
+        parse_client_mock: MagicMock,
+        parse_service_resource_mock: MagicMock,
+    ) -> None:
+        session_mock = MagicMock()
+        service_name = ServiceName("ec2", "EC2")
+        client = Client("EC2Client", service_name, MagicMock())
+        client.boto3_client.meta.service_model.operation_names = [
+            "DescribeInstances",
+            "RunInstances",
+        ]
+        client.boto3_client.waiter_names = ["instance_running", "image_available"]
+        waiter_mocks = {
+            "instance_running": MagicMock(config=MagicMock(operation="DescribeInstances")),
+            "image_available": MagicMock(config=MagicMock(operation="DescribeImages")),
+        }
+        waiter_mocks["instance_running"].name = "InstanceRunning"
+        waiter_mocks["image_available"].name = "ImageAvailable"
+        client.boto3_client.get_waiter.side_effect = waiter_mocks.get
+        client.methods = [
+            Method("describe_instances", [], Type.none),
+            Method("run_instances", [], Type.none),
+            Method("generate_presigned_url", [], Type.none),
+        ]
+        parse_client_mock.return_value = client
+        parse_service_resource_mock.return_value = None
+        ShapeParserMock().get_paginator_names.return_value = ["DescribeInstances", "DescribeImages"]
+        ShapeParserMock().get_wait_method.return_value = Method("wait", [], Type.none)
+        ShapeParserMock().get_paginate_method.return_value = Method("paginate", [], Type.none)
+
+        result = parse_service_package(
+            session_mock, service_name, operation_names=["DescribeInstances"]
+        )
+        assert [i.name for i in result.client.methods] == [
+            "describe_instances",
+            "generate_presigned_url",
+            "__getattr__",
+            "get_paginator",
+            "get_waiter",
+        ]
+        assert [i.operation_name for i in result.paginators] == ["describe_instances"]
+        assert [i.waiter_name for i in result.waiters] == ["instance_running"]
+
+        client.methods = [
+            Method("describe_instances", [], Type.none),
+            Method("run_instances", [], Type.none),
+        ]
+        result = parse_service_package(
+            session_mock, service_name, operation_names=["DescribeInstances", "RunInstances"]
+        )
+        assert [i.name for i in result.client.methods] == [
+            "describe_instances",
+            "run_instances",
+            "get_paginator",
+            "get_waiter",
+        ]
@@ -0,0 +1,30 @@
+from unittest.mock import MagicMock
+
+from botocore.exceptions import UnknownServiceError
+
+from mypy_boto3_builder.parsers.service_summary import parse_service_summary
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class TestServiceSummary:
+    def test_parse_service_summary(self) -> None:
+        session_mock = MagicMock()
+        models = {
+            "waiters-2": {"waiters": {"BucketExists": {}}},
+            "paginators-1": {"pagination": {}},
+            "resources-1": {"service": {}},
+        }
+        session_mock._loader.load_service_model.side_effect = lambda _, i: models[i]
+        result = parse_service_summary(session_mock, ServiceName("s3", "S3"))
+        assert result.client_name == "S3Client"
+        assert result.service_resource_name == "S3ServiceResource"
+        assert result.has_waiters
+        assert not result.has_paginators
+
+        session_mock._loader.load_service_model.side_effect = UnknownServiceError(
+            service_name="s3", known_service_names=[]
+        )
+        result = parse_service_summary(session_mock, ServiceName("s3", "S3"))
+        assert result.service_resource_name is None
+        assert not result.has_waiters
+        assert not result.has_paginators
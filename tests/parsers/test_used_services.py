@@ -0,0 +1,65 @@
+import tempfile
+from pathlib import Path
+
+from mypy_boto3_builder.parsers.used_services import (
+    get_used_operation_names,
+    get_used_service_names,
+    iterate_source_paths,
+)
+from mypy_boto3_builder.service_name import ServiceName
+
+SOURCE = """
+import boto3
+import mypy_boto3_sqs
+from boto3.session import Session
+from mypy_boto3_ec2.client import EC2Client
+from . import mypy_boto3_rds
+
+s3_client = boto3.client("s3")
+dynamodb = Session().resource(service_name="dynamodb")
+logs_client = session.client("logs", region_name="us-east-1")
+dynamic_client = boto3.client(name)
+instances = client.describe_instances()
+waiter = client.get_waiter(waiter_name="instance_running")
+paginator = client.get_paginator("describe_images")
+"""
+
+
+class TestUsedServices:
+    def test_get_used_service_names(self) -> None:
+        service_names = [
+            ServiceName(name, name.upper())
+            for name in ("ec2", "s3", "rds", "sqs", "dynamodb", "logs", "acm")
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir)
+            (path / "package").mkdir()
+            (path / "package" / "main.py").write_text(SOURCE)
+            (path / "broken.py").write_text("import (")
+            (path / ".venv").mkdir()
+            (path / ".venv" / "lib.py").write_text('boto3.client("acm")')
+
+            result = get_used_service_names([path], service_names)
+            assert [i.name for i in result] == ["ec2", "s3", "sqs", "dynamodb", "logs"]
+
+            result = get_used_service_names([path / ".venv" / "lib.py"], service_names)
+            assert [i.name for i in result] == ["acm"]
+
+    def test_get_used_operation_names(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "main.py"
+            path.write_text(SOURCE)
+            result = get_used_operation_names([path])
+            assert {"describe_instances", "instance_running", "describe_images"} <= result
+            assert "client" in result
+            assert "name" not in result
+
+    def test_iterate_source_paths(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir)
+            (path / "a.py").touch()
+            (path / "b.txt").touch()
+            (path / ".hidden").mkdir()
+            (path / ".hidden" / "c.py").touch()
+            assert list(iterate_source_paths(path)) == [path / "a.py"]
+            assert list(iterate_source_paths(path / "b.txt")) == [path / "b.txt"]
@@ -60,3 +60,15 @@ class TestClassRecord:
 
     def test_get_internal_imports(self) -> None:
         assert self.class_record.get_internal_imports() == []
+
+    def test_get_types_cache(self) -> None:
+        self.class_record.attributes.append(Attribute("flag", Type.bool))
+        assert Type.bool in self.class_record.get_types()
+        self.class_record.methods[0].arguments.append(Argument("dct", Type.DictStrAny))
+        assert Type.Dict in self.class_record.get_types()
+
+        self.class_record.freeze_types()
+        self.class_record.attributes.clear()
+        self.class_record.methods[0].arguments[2].type_annotation = Type.str
+        assert Type.bool in self.class_record.get_types()
+        assert Type.List in self.class_record.methods[0].get_types()
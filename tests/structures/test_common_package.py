@@ -0,0 +1,62 @@
+from mypy_boto3_builder.structures.common_package import CommonPackage
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypedDictAttribute, TypeTypedDict
+
+
+class TestCommonPackage:
+    @property
+    def common_package(self) -> CommonPackage:
+        return CommonPackage(
+            typed_dicts=[
+                TypeTypedDict("TagTypeDef", [TypedDictAttribute("Key", Type.str, True)]),
+                TypeTypedDict(
+                    "FilterTypeDef",
+                    [TypedDictAttribute("Type", TypeLiteral("FilterTypeType", ["a", "b"]), True)],
+                ),
+            ],
+            literals=[TypeLiteral("StateType", ["on", "off"])],
+        )
+
+    def test_init(self) -> None:
+        assert self.common_package.name == "mypy_boto3_common"
+        assert self.common_package.pypi_name == "mypy-boto3-common"
+
+    def test_get_shared_names(self) -> None:
+        common_package = self.common_package
+        tag_typed_dict = TypeTypedDict("TagTypeDef", [TypedDictAttribute("Key", Type.str, True)])
+        tags_typed_dict = TypeTypedDict(
+            "TagsTypeDef",
+            [TypedDictAttribute("Tags", TypeSubscript(Type.List, [tag_typed_dict]), True)],
+        )
+        assert common_package.get_shared_names(
+            [tag_typed_dict, tags_typed_dict],
+            [TypeLiteral("StateType", ["on", "off"]), TypeLiteral("OtherType", ["a", "b"])],
+        ) == {"TagTypeDef", "StateType"}
+        assert (
+            common_package.get_shared_names(
+                [TypeTypedDict("TagTypeDef", [TypedDictAttribute("Key", Type.str, False)])],
+                [TypeLiteral("StateType", ["on"])],
+            )
+            == set()
+        )
+
+    def test_get_shared_names_dependencies(self) -> None:
+        common_package = self.common_package
+        filter_typed_dict = TypeTypedDict(
+            "FilterTypeDef",
+            [TypedDictAttribute("Type", TypeLiteral("FilterTypeType", ["a", "b"]), True)],
+        )
+        assert common_package.get_shared_names([filter_typed_dict], []) == set()
+        common_package.literals.append(TypeLiteral("FilterTypeType", ["a", "b"]))
+        assert common_package.get_shared_names(
+            [filter_typed_dict], [TypeLiteral("FilterTypeType", ["a", "b"])]
+        ) == {"FilterTypeDef", "FilterTypeType"}
+
+    def test_get_type_defs_required_import_records(self) -> None:
+        assert len(self.common_package.get_type_defs_required_import_records()) == 3
+        assert CommonPackage().get_type_defs_required_import_records() == []
+
+    def test_get_literals_required_import_records(self) -> None:
+        assert len(self.common_package.get_literals_required_import_records()) == 2
@@ -48,3 +48,13 @@ class TestFunction:
             ImportRecord(ImportString("typing"), "Any"),
             ImportRecord(ImportString("typing"), "List"),
         }
+
+    def test_get_types_cache(self) -> None:
+        self.function.arguments[2].type_annotation = Type.DictStrAny
+        assert Type.Dict in self.function.get_types()
+        assert Type.List not in self.function.get_types()
+
+        self.function.freeze_types()
+        assert self.function.get_types() is not self.function.get_types()
+        self.function.arguments[2].type_annotation = Type.ListAny
+        assert Type.Dict in self.function.get_types()
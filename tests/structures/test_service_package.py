@@ -1,13 +1,16 @@
 import pytest
 
 from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.attribute import Attribute
 from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.common_package import CommonPackage
 from mypy_boto3_builder.structures.paginator import Paginator
 from mypy_boto3_builder.structures.service_package import ServicePackage
 from mypy_boto3_builder.structures.service_resource import ServiceResource
 from mypy_boto3_builder.structures.waiter import Waiter
+from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
-from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypedDictAttribute, TypeTypedDict
 
 
 class TestServicePackage:
@@ -39,6 +42,13 @@ class TestServicePackage:
     def test_get_init_import_records(self) -> None:
         assert len(self.service_package.get_init_import_records()) == 4
 
+    def test_get_init_lazy_import_records(self) -> None:
+        service_package = self.service_package
+        service_package.client.name = "ServiceClient"
+        result = service_package.get_init_lazy_import_records()
+        assert list(result) == sorted(service_package.get_init_all_names())
+        assert result["Client"].render() == "from .client import ServiceClient"
+
     def test_get_init_all_names(self) -> None:
         assert len(self.service_package.get_init_all_names()) == 4
 
@@ -70,3 +80,53 @@ class TestServicePackage:
             service_package = self.service_package
             service_package.literals[0].name = "MyTypedDict"
             service_package.validate()
+
+    def test_get_types_cache(self) -> None:
+        service_package = self.service_package
+        service_package.client.attributes.append(Attribute("flag", Type.bool))
+        assert Type.bool in service_package.get_types()
+
+        service_package.freeze_types()
+        service_package.client.attributes.clear()
+        assert Type.bool in service_package.get_types()
+        assert Type.bool in service_package.client.get_types()
+
+    def test_extract_shared_types(self) -> None:
+        service_package = self.service_package
+        service_package.extract_shared_types(
+            CommonPackage(
+                typed_dicts=[TypeTypedDict("MyTypedDict", [])],
+                literals=[TypeLiteral("MyLiteral", ["other"])],
+            )
+        )
+        assert service_package.typed_dicts == []
+        assert [i.name for i in service_package.shared_typed_dicts] == ["MyTypedDict"]
+        assert [i.name for i in service_package.literals] == ["MyLiteral"]
+        assert service_package.shared_literals == []
+        assert service_package.get_type_defs_all_names() == ["MyTypedDict"]
+        assert service_package.get_literals_all_names() == ["MyLiteral"]
+        assert len(service_package.get_type_defs_required_import_records()) == 3
+        service_package.validate()
+
+    def test_split_type_defs(self) -> None:
+        service_package = self.service_package
+        leaf = TypeTypedDict("LeafTypedDict", [TypedDictAttribute("key", Type.str, True)])
+        node = TypeTypedDict("NodeTypedDict", [TypedDictAttribute("leaf", leaf, True)])
+        root = TypeTypedDict("RootTypedDict", [TypedDictAttribute("node", node, True)])
+        other = TypeTypedDict("OtherTypedDict", [TypedDictAttribute("key", Type.str, False)])
+        service_package.typed_dicts = [leaf, node, other, root]
+        service_package.split_type_defs(part_size=2)
+        assert [i.name for i in service_package.type_defs_parts] == ["_part_01", "_part_02"]
+        assert [i.get_all_names() for i in service_package.type_defs_parts] == [
+            ["LeafTypedDict", "NodeTypedDict"],
+            ["OtherTypedDict", "RootTypedDict"],
+        ]
+        assert len(service_package.get_type_defs_init_import_records()) == 4
+        import_records = service_package.get_type_defs_part_required_import_records(
+            service_package.type_defs_parts[1]
+        )
+        assert {i.render() for i in import_records} == {
+            "import sys",
+            "from typing import TypedDict",
+            "from ._part_01 import NodeTypedDict",
+        }
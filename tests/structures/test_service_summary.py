@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
+
+
+class TestServiceSummary:
+    def test_init(self) -> None:
+        service_name = ServiceName("s3", "S3")
+        summary = ServiceSummary(service_name, "S3Client", "S3ServiceResource", True)
+        assert summary.service_name == service_name
+        assert summary.client_name == "S3Client"
+        assert summary.has_service_resource
+        assert summary.has_waiters
+        assert not summary.has_paginators
+        assert not ServiceSummary(service_name, "S3Client").has_service_resource
+        with pytest.raises(AttributeError):
+            summary.boto3_client = MagicMock()  # type: ignore
+
+    def test_eq(self) -> None:
+        service_name = ServiceName("s3", "S3")
+        summary = ServiceSummary(service_name, "S3Client", "S3ServiceResource", True)
+        assert summary == ServiceSummary(service_name, "S3Client", "S3ServiceResource", True)
+        assert hash(summary) == hash(
+            ServiceSummary(service_name, "S3Client", "S3ServiceResource", True)
+        )
+        assert summary != ServiceSummary(service_name, "S3Client", None, True)
+        assert summary != "S3Client"
+
+    def test_to_dict(self) -> None:
+        service_name = ServiceName("s3", "S3")
+        summary = ServiceSummary(service_name, "S3Client", "S3ServiceResource", True)
+        data = summary.to_dict()
+        assert data["service_name"] == "s3"
+        assert data["class_name"] == "S3"
+        assert ServiceSummary.from_dict(data).to_dict() == data
+
+    def test_from_service_package(self) -> None:
+        service_package = MagicMock(waiters=[], paginators=[MagicMock()])
+        service_package.client.name = "S3Client"
+        service_package.service_resource.name = "S3ServiceResource"
+        summary = ServiceSummary.from_service_package(service_package)
+        assert summary.service_name == service_package.service_name
+        assert summary.client_name == "S3Client"
+        assert summary.service_resource_name == "S3ServiceResource"
+        assert not summary.has_waiters
+        assert summary.has_paginators
+
+        service_package.service_resource = None
+        assert not ServiceSummary.from_service_package(service_package).has_service_resource
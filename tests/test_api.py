@@ -0,0 +1,81 @@
+import logging
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mypy_boto3_builder.api import GenerateResult, generate
+from mypy_boto3_builder.constants import LOGGER_NAME
+from mypy_boto3_builder.utils.synthetic_models import SyntheticConfig, get_session, write_models
+from mypy_boto3_builder.writers.file_writer import FileWriter
+from mypy_boto3_builder.writers.sinks import DirectorySink, MemorySink
+
+
+def get_config(service_name: str) -> SyntheticConfig:
+    return SyntheticConfig(
+        service_name=service_name,
+        operations=2,
+        shape_depth=1,
+        fields=1,
+        enum_count=1,
+        enum_size=2,
+        resources=1,
+    )
+
+
+class TestApi:
+    def test_generate_result(self) -> None:
+        result = GenerateResult()
+        assert result.get_timings() == {}
+
+    def test_generate(self) -> None:
+        logger_handlers = list(logging.getLogger(LOGGER_NAME).handlers)
+        sink = MemorySink()
+        with tempfile.TemporaryDirectory() as data_dir:
+            data_path = Path(data_dir)
+            write_models(data_path, get_config("apia"))
+            session = get_session(data_path)
+            result = generate(["apia"], session=session, sink=sink)
+
+            with pytest.raises(ValueError, match="Service unknown"):
+                generate(["unknown"], session=session)
+            with pytest.raises(ValueError, match="Invalid number of jobs"):
+                generate(["apia"], session=session, jobs=0)
+
+        assert "mypy_boto3_apia_package/mypy_boto3_apia/client.pyi" in result.files
+        assert "mypy_boto3_apia_package/setup.py" in result.files
+        assert "master_package/setup.py" in result.files
+        assert "boto3_stubs_package/boto3-stubs/__init__.pyi" in result.files
+        assert "botocore_stubs_package/botocore-stubs/__init__.pyi" in result.files
+        assert (
+            b"class ApiaSyntheticServiceClient("
+            in result.files["mypy_boto3_apia_package/mypy_boto3_apia/client.pyi"]
+        )
+        assert len(sink.files) == len(result.files)
+        assert [i.client_name for i in result.service_summaries] == ["ApiaSyntheticServiceClient"]
+        assert set(result.get_timings()["apia"]) == {"parse", "write"}
+        assert logging.getLogger(LOGGER_NAME).handlers == logger_handlers
+        assert isinstance(FileWriter.sink, DirectorySink)
+
+    def test_generate_jobs(self) -> None:
+        with tempfile.TemporaryDirectory() as data_dir:
+            data_path = Path(data_dir)
+            write_models(data_path, get_config("apib"))
+            write_models(data_path, get_config("apic"))
+            session = get_session(data_path)
+            result = generate(["apib", "apic"], session=session, skip_master=True)
+            parallel_result = generate(["apib", "apic"], session=session, skip_master=True, jobs=2)
+            durations = {"apib": 1.0, "apic": 2.0}
+            scheduled_result = generate(
+                ["apib", "apic"], session=session, skip_master=True, jobs=2, durations=durations
+            )
+
+        assert parallel_result.files == result.files
+        assert list(parallel_result.files) == list(result.files)
+        assert list(parallel_result.get_timings()) == ["apib", "apic"]
+        assert scheduled_result.files == result.files
+        assert [i.service_name.name for i in parallel_result.service_summaries] == ["apib", "apic"]
+        assert [i.to_dict() for i in parallel_result.service_summaries] == [
+            i.to_dict() for i in result.service_summaries
+        ]
+        assert list(scheduled_result.get_durations()) == ["apib", "apic"]
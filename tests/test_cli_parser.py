@@ -1,6 +1,9 @@
+import argparse
 from unittest.mock import MagicMock, patch
 
-from mypy_boto3_builder.cli_parser import get_absolute_path, parse_args
+import pytest
+
+from mypy_boto3_builder.cli_parser import get_absolute_path, get_memory_size, parse_args
 
 
 class TestCLIParser:
@@ -14,3 +17,28 @@ class TestCLIParser:
         result = get_absolute_path("test/output")
         PathMock.assert_called_with("test/output")
         assert result == PathMock().absolute()
+
+    def test_get_memory_size(self) -> None:
+        assert get_memory_size("2G") == 2 * 1024 * 1024 * 1024
+        with pytest.raises(argparse.ArgumentTypeError):
+            get_memory_size("2X")
+
+    def test_parse_args_watch(self) -> None:
+        assert parse_args(["output", "--watch"]).watch
+        assert not parse_args(["output"]).watch
+        with pytest.raises(SystemExit):
+            parse_args(["output", "--watch", "--docs"])
+        with pytest.raises(SystemExit):
+            parse_args(["output.zip", "--watch"])
+
+    def test_parse_args_shard(self) -> None:
+        assert parse_args(["output", "--shard", "2/3"]).shard == (2, 3)
+        assert parse_args(["output", "--merge-shards", "shards"]).merge_shard_paths
+        with pytest.raises(SystemExit):
+            parse_args(["output", "--shard", "4/3"])
+        with pytest.raises(SystemExit):
+            parse_args(["output", "--shard", "1/3", "--merge-shards", "shards"])
+        with pytest.raises(SystemExit):
+            parse_args(["output", "--merge-shards", "shards", "-s", "s3"])
+        with pytest.raises(SystemExit):
+            parse_args(["output", "--shard", "1/3", "--shared-types"])
@@ -0,0 +1,109 @@
+import io
+import logging
+import os
+import socketserver
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+from boto3.session import Session
+
+from mypy_boto3_builder.cli_parser import Namespace
+from mypy_boto3_builder.constants import DUMMY_REGION
+from mypy_boto3_builder.daemon import BuilderDaemon, WarmLoader, parse_args
+from mypy_boto3_builder.daemon_client import send_request
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_utils import clear_boto3_cache
+from mypy_boto3_builder.writers.utils import FormatterCache
+
+
+def execute(args: Namespace, *_args: Any) -> int:
+    print(f"Output {args.output_path.name}")
+    get_logger().info("Building")
+    return 0
+
+
+class TestWarmLoader:
+    def test_install(self) -> None:
+        session = Session(region_name=DUMMY_REGION)
+        loader = WarmLoader.install(session)
+        assert session._session.get_component("data_loader") is loader
+        model = session._session.get_service_data("sqs")
+        clear_boto3_cache(session)
+        assert session._session.get_service_data("sqs") is model
+
+
+class TestBuilderDaemon:
+    def test_parse_args(self) -> None:
+        assert parse_args(["--socket", "test.sock"]).socket_path == Path("test.sock")
+
+    @patch("mypy_boto3_builder.daemon.execute")
+    @patch("mypy_boto3_builder.daemon.get_available_service_names")
+    def test_serve(self, get_available_service_names_mock: MagicMock, execute_mock: MagicMock):
+        execute_mock.side_effect = execute
+        session_mock = MagicMock()
+        get_logger(level=logging.INFO)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cwd = Path(temp_dir)
+            socket_path = cwd / "builder.sock"
+            daemon = BuilderDaemon(socket_path, session_mock)
+            thread = threading.Thread(target=daemon.serve)
+            thread.start()
+            try:
+                assert socket_path.is_socket()
+                assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+                assert FormatterCache.max_size
+
+                stdout = io.StringIO()
+                stderr = io.StringIO()
+                request = {"command": "build", "args": ["output", "-s", "sqs"], "cwd": temp_dir}
+                assert send_request(socket_path, request, stdout, stderr) == 0
+                assert stdout.getvalue() == "Output output\n"
+                assert "Building" in stderr.getvalue()
+                namespace = execute_mock.call_args[0][0]
+                assert namespace.output_path == cwd.resolve() / "output"
+                assert namespace.service_names == ["sqs"]
+
+                stderr = io.StringIO()
+                request = {"command": "build", "args": ["output", "--unknown"], "cwd": temp_dir}
+                assert send_request(socket_path, request, stdout, stderr) == 2
+                assert "unrecognized arguments: --unknown" in stderr.getvalue()
+
+                execute_mock.side_effect = ValueError("Broken model")
+                stderr = io.StringIO()
+                request = {"command": "build", "args": ["output"], "cwd": temp_dir}
+                assert send_request(socket_path, request, stdout, stderr) == 1
+                assert "ValueError: Broken model" in stderr.getvalue()
+            finally:
+                send_request(socket_path, {"command": "stop"}, stdout, stderr)
+                thread.join()
+
+            assert not socket_path.exists()
+            assert not FormatterCache.max_size
+            get_available_service_names_mock.assert_called_once_with(session_mock)
+
+    @patch("mypy_boto3_builder.daemon.get_available_service_names")
+    def test_socket_permissions(self, _get_available_service_names_mock: MagicMock) -> None:
+        bind_modes: List[int] = []
+        server_bind = socketserver.UnixStreamServer.server_bind
+
+        def bind(server: socketserver.UnixStreamServer) -> None:
+            server_bind(server)
+            bind_modes.append(stat.S_IMODE(os.stat(server.server_address).st_mode))
+
+        umask = os.umask(0o022)
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                socket_path = Path(temp_dir) / "builder.sock"
+                with patch.object(BuilderDaemon, "server_bind", bind):
+                    daemon = BuilderDaemon(socket_path, MagicMock())
+                daemon.server_close()
+                FormatterCache.disable()
+                assert bind_modes == [0o700]
+                assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+            assert os.umask(0o022) == 0o022
+        finally:
+            os.umask(umask)
@@ -0,0 +1,48 @@
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mypy_boto3_builder.daemon_client import main, parse_args, read_message, write_message
+
+
+class TestDaemonClient:
+    def test_messages(self) -> None:
+        stream = MagicMock()
+        write_message(stream, {"exit_code": 0})
+        stream.write.assert_called_with('{"exit_code": 0}\n')
+        stream.readline.return_value = '{"exit_code": 1}\n'
+        assert read_message(stream) == {"exit_code": 1}
+        stream.readline.return_value = ""
+        assert read_message(stream) is None
+
+    def test_parse_args(self) -> None:
+        args = parse_args(["--socket", "test.sock", "output", "-s", "sqs", "--skip-master"])
+        assert args.socket_path == Path("test.sock")
+        assert args.builder_args == ["output", "-s", "sqs", "--skip-master"]
+        assert parse_args(["--stop"]).stop
+        with pytest.raises(SystemExit):
+            parse_args([])
+
+    @patch("mypy_boto3_builder.daemon_client.send_request")
+    def test_main(self, send_request_mock: MagicMock) -> None:
+        send_request_mock.return_value = 3
+        with patch.object(sys, "argv", ["client", "--socket", "test.sock", "output"]):
+            with pytest.raises(SystemExit) as e:
+                main()
+        assert e.value.code == 3
+        request = send_request_mock.call_args[0][1]
+        assert request["command"] == "build"
+        assert request["args"] == ["output"]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            socket_path = Path(temp_dir) / "missing.sock"
+            with patch.object(
+                sys, "argv", ["client", "--socket", socket_path.as_posix(), "--stop"]
+            ):
+                send_request_mock.side_effect = FileNotFoundError()
+                with pytest.raises(SystemExit) as e:
+                    main()
+        assert e.value.code == 1
@@ -0,0 +1,24 @@
+import tempfile
+from pathlib import Path
+
+from mypy_boto3_builder.jinja_manager import JinjaManager
+
+
+class TestJinjaManager:
+    def test_set_bytecode_cache_path(self) -> None:
+        environment = JinjaManager.get_environment()
+        old_bytecode_cache = environment.bytecode_cache
+        assert old_bytecode_cache is None
+        assert not environment.auto_reload
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                cache_path = Path(temp_dir) / "jinja2"
+                JinjaManager.set_bytecode_cache_path(cache_path)
+                environment.get_template("common/argument.py.jinja2")
+                assert list(cache_path.iterdir())
+
+                JinjaManager.set_bytecode_cache_path(None)
+                assert environment.bytecode_cache is None
+        finally:
+            environment.bytecode_cache = old_bytecode_cache
+            environment.cache.clear()
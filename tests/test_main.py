@@ -3,9 +3,21 @@ import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from mypy_boto3_builder.cli_parser import Namespace
-from mypy_boto3_builder.main import generate_docs, generate_stubs, get_available_service_names, main
+from mypy_boto3_builder.main import (
+    generate_docs,
+    generate_stubs,
+    get_available_service_names,
+    get_shard_service_names,
+    main,
+    merge_shards,
+    watch_services,
+)
 from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
+from mypy_boto3_builder.writers.shard_manifest import ShardManifest, ShardMergeError
 
 
 class TestMain:
@@ -72,8 +84,131 @@ class TestMain:
                 list_services=False,
             )
             session_mock = MagicMock()
-            generate_stubs(namespace, service_names=[ServiceName("s3", "S3")], session=session_mock)
+            result = generate_stubs(
+                namespace, service_names=[ServiceName("s3", "S3")], session=session_mock
+            )
             process_botocore_stubs_mock.assert_called()
-            process_boto3_stubs_mock.assert_called()
-            process_master_mock.assert_called()
             process_service_mock.assert_called()
+            assert result == [process_service_mock()]
+            assert process_master_mock.call_args[1]["service_summaries"] == result
+            assert process_boto3_stubs_mock.call_args[1]["service_summaries"] == result
+
+            namespace.skip_services = True
+            generate_stubs(namespace, service_names=[ServiceName("s3", "S3")], session=session_mock)
+            assert process_master_mock.call_args[1]["service_summaries"] is None
+
+    @patch("mypy_boto3_builder.main.ServiceModelWatcher")
+    @patch("mypy_boto3_builder.main.clear_boto3_cache")
+    @patch("mypy_boto3_builder.main.process_service")
+    @patch("mypy_boto3_builder.main.process_master")
+    @patch("mypy_boto3_builder.main.process_boto3_stubs")
+    def test_watch_services(
+        self,
+        process_boto3_stubs_mock: MagicMock,
+        process_master_mock: MagicMock,
+        process_service_mock: MagicMock,
+        clear_boto3_cache_mock: MagicMock,
+        ServiceModelWatcherMock: MagicMock,
+    ) -> None:
+        service_name = ServiceName("s3", "S3")
+        summary = ServiceSummary(service_name, "S3Client")
+        watcher_mock = ServiceModelWatcherMock()
+        watcher_mock.wait.side_effect = [
+            [service_name],
+            [service_name],
+            [service_name],
+            KeyboardInterrupt,
+        ]
+        process_service_mock.side_effect = [
+            summary,
+            ValueError("Broken model"),
+            ServiceSummary(service_name, "S3Client", has_waiters=True),
+        ]
+        with tempfile.TemporaryDirectory() as output_dir:
+            namespace = Namespace(
+                log_level=0,
+                output_path=Path(output_dir),
+                service_names=["s3"],
+                build_version="1.2.3",
+                installed=False,
+                skip_master=False,
+                skip_services=False,
+                builder_version="1.2.3",
+                generate_docs=False,
+                list_services=False,
+                watch=True,
+            )
+            watch_services(namespace, [service_name], MagicMock(), [summary])
+
+        assert process_service_mock.call_count == 3
+        assert clear_boto3_cache_mock.call_count == 3
+        process_master_mock.assert_called_once()
+        process_boto3_stubs_mock.assert_called_once()
+        assert process_master_mock.call_args[1]["service_summaries"][0].has_waiters
+        watcher_mock.close.assert_called_once_with()
+
+    @patch("mypy_boto3_builder.main.get_service_costs")
+    def test_get_shard_service_names(self, get_service_costs_mock: MagicMock) -> None:
+        get_service_costs_mock.return_value = [10.0, 30.0, 5.0, 20.0]
+        service_names = [ServiceName(i, i.upper()) for i in ("s3", "ec2", "sqs", "sns")]
+        namespace = MagicMock(shard=(1, 2), cost_report_path=None)
+        result = get_shard_service_names(namespace, service_names, MagicMock())
+        assert [i.name for i in result] == ["ec2", "sqs"]
+        namespace.shard = (2, 2)
+        result = get_shard_service_names(namespace, service_names, MagicMock())
+        assert [i.name for i in result] == ["s3", "sns"]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            namespace.cost_report_path = Path(temp_dir) / "report.json"
+            namespace.cost_report_path.write_text(
+                '{"samples": [{"name": "s3", "stage": "parse", "allocated": 0, "peak": 0,'
+                ' "peak_rss": 0, "duration": 2.5}]}'
+            )
+            get_shard_service_names(namespace, service_names, MagicMock())
+            assert get_service_costs_mock.call_args[0][2] == {"s3": 2.5}
+            namespace.cost_report_path.write_text("{}")
+            get_shard_service_names(namespace, service_names, MagicMock())
+            assert get_service_costs_mock.call_args[0][2] == {}
+
+    @patch("mypy_boto3_builder.main.process_master")
+    @patch("mypy_boto3_builder.main.process_boto3_stubs")
+    @patch("mypy_boto3_builder.main.process_botocore_stubs")
+    def test_merge_shards(
+        self,
+        process_botocore_stubs_mock: MagicMock,
+        process_boto3_stubs_mock: MagicMock,
+        process_master_mock: MagicMock,
+    ) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            for index, name in enumerate(["s3", "sqs"]):
+                ShardManifest(
+                    index=index + 1,
+                    count=2,
+                    build_version="1.2.3",
+                    service_names=["s3", "sqs"],
+                    service_summaries=[ServiceSummary(ServiceName(name, "Name"), "NameClient")],
+                ).save(ShardManifest.get_path(output_path / "shards", index + 1, 2))
+            namespace = Namespace(
+                log_level=0,
+                output_path=output_path / "output",
+                service_names=[],
+                build_version="",
+                installed=False,
+                skip_master=False,
+                skip_services=False,
+                builder_version="1.2.3",
+                generate_docs=False,
+                list_services=False,
+                merge_shard_paths=[output_path / "shards"],
+            )
+            merge_shards(namespace, MagicMock())
+
+            namespace.build_version = "1.2.4"
+            with pytest.raises(ShardMergeError):
+                merge_shards(namespace, MagicMock())
+
+        service_summaries = process_master_mock.call_args[1]["service_summaries"]
+        assert [i.service_name.name for i in service_summaries] == ["s3", "sqs"]
+        assert process_boto3_stubs_mock.call_args[1]["service_summaries"] == service_summaries
+        process_botocore_stubs_mock.assert_called_once()
@@ -1,5 +1,6 @@
 import pytest
 
+from mypy_boto3_builder.jinja_manager import JinjaManager
 from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
 
 
@@ -49,3 +50,8 @@ class TestTypeLiteral:
     def test_is_same(self) -> None:
         assert self.result.is_same(TypeLiteral("other", ["a", "b"]))
         assert not self.result.is_same(TypeLiteral("other", ["a", "b", "c"]))
+
+    def test_render_definition(self) -> None:
+        template = JinjaManager.get_environment().get_template("common/literal.py.jinja2")
+        for literal in (self.result, TypeLiteral("Single", ["a"]), TypeLiteral("Ints", [2, 1])):
+            assert literal.render_definition() == template.render(literal=literal)
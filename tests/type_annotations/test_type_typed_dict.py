@@ -1,6 +1,10 @@
+from unittest.mock import PropertyMock, patch
+
 import pytest
 
+from mypy_boto3_builder.jinja_manager import JinjaManager
 from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
 from mypy_boto3_builder.type_annotations.type_typed_dict import TypedDictAttribute, TypeTypedDict
 
 
@@ -138,6 +142,15 @@ class TestTypeTypedDict:
                 ],
             )
         )
+        assert not self.result.is_same(
+            TypeTypedDict(
+                "OtherDict",
+                [
+                    TypedDictAttribute("required", Type.bool, True),
+                    TypedDictAttribute("optional", Type.str, True),
+                ],
+            )
+        )
 
     def test_get_children_types(self) -> None:
         assert self.result.get_children_types() == {Type.str, Type.bool}
@@ -151,3 +164,25 @@ class TestTypeTypedDict:
 
     def test_replace_self_references(self) -> None:
         self.result.replace_self_references()
+
+    @pytest.mark.parametrize("requires_safe_render", [True, False])
+    def test_render_definition(self, requires_safe_render: bool) -> None:
+        template = JinjaManager.get_environment().get_template("common/typed_dict.py.jinja2")
+        self_referenced = TypeTypedDict("SelfDict")
+        self_referenced.add_attribute("child", TypeSubscript(Type.List, [self_referenced]), False)
+        self_referenced.replace_self_references()
+        typed_dicts = [
+            self.result,
+            TypeTypedDict("Empty"),
+            TypeTypedDict("Required", [TypedDictAttribute("key", Type.str, True)]),
+            TypeTypedDict("Optional", [TypedDictAttribute("key", Type.str, False)]),
+            TypeTypedDict("Child", [TypedDictAttribute("parent", self.result, True)]),
+            self_referenced,
+        ]
+        with patch.object(
+            TypeTypedDict, "requires_safe_render", new_callable=PropertyMock
+        ) as requires_safe_render_mock:
+            requires_safe_render_mock.return_value = requires_safe_render
+            for typed_dict in typed_dicts:
+                expected = template.render(typed_dict=typed_dict)
+                assert typed_dict.render_definition() == expected
@@ -7,3 +7,7 @@ class TestMethodArgumentMap:
         assert get_method_arguments_stub(ServiceNameCatalog.ec2, "Instance", "delete_tags")[0]
         assert get_method_arguments_stub(ServiceNameCatalog.ec2, "Instance", "unknown") is None
         assert get_method_arguments_stub(ServiceNameCatalog.ec2, "unknown", "delete_tags") is None
+
+        arguments = get_method_arguments_stub(ServiceNameCatalog.ec2, "Instance", "delete_tags")
+        arguments.clear()
+        assert get_method_arguments_stub(ServiceNameCatalog.ec2, "Instance", "delete_tags")
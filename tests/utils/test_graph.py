@@ -0,0 +1,21 @@
+from mypy_boto3_builder.utils.graph import get_connected_components, get_dependency_order
+
+
+class TestGraph:
+    def test_get_connected_components(self) -> None:
+        graph = {"a": ["b"], "b": [], "c": ["d", "unknown"], "d": [], "e": ["b"]}
+        assert get_connected_components(graph, graph.__getitem__) == [
+            ["a", "b", "e"],
+            ["c", "d"],
+        ]
+        assert get_connected_components([], graph.__getitem__) == []
+
+    def test_get_dependency_order(self) -> None:
+        graph = {"a": ["b", "c"], "b": ["c"], "c": [], "d": ["e"], "e": ["d", "c"]}
+        assert get_dependency_order(graph, graph.__getitem__) == [
+            ["c"],
+            ["b"],
+            ["a"],
+            ["e", "d"],
+        ]
+        assert get_dependency_order(["a"], graph.__getitem__) == [["a"]]
@@ -0,0 +1,140 @@
+import json
+import tempfile
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mypy_boto3_builder.utils.memory import (
+    MemoryBudgetError,
+    MemoryProfiler,
+    MemorySample,
+    get_durations,
+    get_peak_rss,
+    load_report_durations,
+    parse_memory_size,
+    reset_traced_peak,
+)
+
+
+class TestMemory:
+    def test_parse_memory_size(self) -> None:
+        assert parse_memory_size("512") == 512 * 1024 * 1024
+        assert parse_memory_size("512M") == 512 * 1024 * 1024
+        assert parse_memory_size("1.5g") == 1536 * 1024 * 1024
+        assert parse_memory_size("64KB") == 64 * 1024
+        with pytest.raises(ValueError):
+            parse_memory_size("1X")
+
+    def test_get_peak_rss(self) -> None:
+        assert get_peak_rss() > 0
+        with patch("mypy_boto3_builder.utils.memory.resource", None):
+            assert get_peak_rss() == 0
+
+
+class TestMemoryProfiler:
+    def teardown_method(self) -> None:
+        MemoryProfiler.stop()
+
+    def test_measure(self) -> None:
+        with MemoryProfiler.measure("test", "parse"):
+            pass
+        assert MemoryProfiler.samples == []
+
+        MemoryProfiler.start(trace=True)
+        with MemoryProfiler.measure("test", "parse"):
+            data = [str(i) for i in range(10000)]
+        with MemoryProfiler.measure("test", "write"):
+            pass
+        assert [(i.name, i.stage) for i in MemoryProfiler.samples] == [
+            ("test", "parse"),
+            ("test", "write"),
+        ]
+        assert MemoryProfiler.samples[0].allocated > 0
+        assert MemoryProfiler.samples[0].peak >= MemoryProfiler.samples[0].allocated
+        assert MemoryProfiler.samples[0].peak_rss > 0
+        assert data
+
+    def test_reset_traced_peak(self) -> None:
+        tracemalloc.start(2)
+        try:
+            data = [str(i) for i in range(10000)]
+            del data
+            start_traced = reset_traced_peak()
+            assert tracemalloc.get_traced_memory()[1] < start_traced + 64 * 1024
+
+            # Python 3.8 has no reset_peak
+            tracemalloc_mock = SimpleNamespace(
+                **{
+                    name: getattr(tracemalloc, name)
+                    for name in (
+                        "start",
+                        "stop",
+                        "is_tracing",
+                        "get_traced_memory",
+                        "get_traceback_limit",
+                    )
+                }
+            )
+            data = [str(i) for i in range(10000)]
+            with patch("mypy_boto3_builder.utils.memory.tracemalloc", tracemalloc_mock):
+                start_traced = reset_traced_peak()
+            assert start_traced < 64 * 1024
+            assert tracemalloc.get_traced_memory()[1] < 64 * 1024
+            assert tracemalloc.is_tracing()
+            assert tracemalloc.get_traceback_limit() == 2
+            assert data
+        finally:
+            tracemalloc.stop()
+
+    def test_check(self) -> None:
+        flush_mock = MagicMock()
+        MemoryProfiler.start(max_memory=1, trace=True)
+        MemoryProfiler.add_flush_handler(flush_mock)
+        with pytest.raises(MemoryBudgetError, match="after test parse\nTop allocation sites:"):
+            with MemoryProfiler.measure("test", "parse"):
+                pass
+        flush_mock.assert_called_once_with()
+
+        MemoryProfiler.stop()
+        MemoryProfiler.start(max_memory=1)
+        with pytest.raises(MemoryBudgetError, match="Use --memory-report"):
+            with MemoryProfiler.measure("test", "parse"):
+                pass
+
+    def test_save_report(self) -> None:
+        MemoryProfiler.start(trace=True)
+        with MemoryProfiler.measure("test", "parse"):
+            pass
+        with MemoryProfiler.measure("test", "write"):
+            pass
+        with tempfile.TemporaryDirectory() as output_dir:
+            report_path = Path(output_dir) / "report.json"
+            MemoryProfiler.save_report(report_path)
+            report = json.loads(report_path.read_text())
+        assert report["version"] == 1
+        assert report["traced"]
+        assert list(report["names"]) == ["test"]
+        assert len(report["samples"]) == 2
+        assert report["top_allocation_sites"]
+
+    def test_load_report_durations(self) -> None:
+        samples = [
+            MemorySample("s3", "parse", 0, 0, 0, 1.5),
+            MemorySample("s3", "write", 0, 0, 0, 0.5),
+            MemorySample("sqs", "parse", 0, 0, 0, 0.25),
+        ]
+        assert get_durations(samples) == {"s3": 2.0, "sqs": 0.25}
+        MemoryProfiler.start()
+        MemoryProfiler.samples.extend(samples)
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                report_path = Path(temp_dir) / "report.json"
+                MemoryProfiler.save_report(report_path)
+                assert load_report_durations(report_path) == {"s3": 2.0, "sqs": 0.25}
+                with pytest.raises(ValueError):
+                    load_report_durations(Path(temp_dir) / "missing.json")
+        finally:
+            MemoryProfiler.stop()
@@ -0,0 +1,26 @@
+import pytest
+
+from mypy_boto3_builder.utils.shards import get_largest_first, parse_shard, partition_by_cost
+
+
+class TestShards:
+    def test_parse_shard(self) -> None:
+        assert parse_shard("1/4") == (1, 4)
+        assert parse_shard(" 4/4 ") == (4, 4)
+        for value in ("0/4", "5/4", "1", "a/b", "-1/2"):
+            with pytest.raises(ValueError):
+                parse_shard(value)
+
+    def test_partition_by_cost(self) -> None:
+        items = ["a", "b", "c", "d", "e", "f"]
+        costs = [1, 10, 4, 4, 6, 1]
+        parts = partition_by_cost(items, costs, 2)
+        assert parts == [["b", "d"], ["a", "c", "e", "f"]]
+        assert partition_by_cost(items, costs, 2) == parts
+        assert partition_by_cost(items, costs, 1) == [items]
+        assert partition_by_cost(items[:1], costs[:1], 3) == [["a"], [], []]
+        assert sorted(sum(partition_by_cost(items, costs, 4), [])) == items
+
+    def test_get_largest_first(self) -> None:
+        assert get_largest_first(["a", "b", "c", "d"], [1, 5, 1, 3]) == ["b", "d", "a", "c"]
+        assert get_largest_first([], []) == []
@@ -0,0 +1,74 @@
+import errno
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.utils.watcher import Inotify, ServiceModelWatcher
+
+
+def write_model(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+class TestServiceModelWatcher:
+    def test_polling(self) -> None:
+        s3 = ServiceName("s3", "S3")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path = Path(temp_dir)
+            write_model(data_path / "s3" / "2006-03-01" / "service-2.json", "{}")
+            watcher = ServiceModelWatcher([temp_dir], [s3], poll_interval=0.01, use_inotify=False)
+            assert watcher.is_polling
+            assert watcher.wait(timeout=0.05) == []
+
+            write_model(data_path / "s3" / "2006-03-01" / "service-2.json", "{ }")
+            write_model(data_path / "ec2" / "2016-11-15" / "service-2.json", "{}")
+            assert watcher.wait(timeout=1.0) == [s3]
+
+            write_model(data_path / "s3" / "2020-01-01" / "paginators-1.json.gz", "")
+            assert watcher.get_changed_service_names() == [s3]
+            (data_path / "s3" / "2020-01-01" / "paginators-1.json.gz").unlink()
+            assert watcher.get_changed_service_names() == [s3]
+            assert watcher.get_changed_service_names() == []
+            watcher.close()
+
+    def test_inotify(self) -> None:
+        inotify = Inotify.create()
+        if inotify is None:
+            return
+        inotify.close()
+
+        s3 = ServiceName("s3", "S3")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path = Path(temp_dir)
+            watcher = ServiceModelWatcher([temp_dir], [s3])
+            assert not watcher.is_polling
+            assert watcher.wait(timeout=0.01) == []
+
+            write_model(data_path / "s3" / "2006-03-01" / "service-2.json", "{}")
+            assert watcher.wait(timeout=1.0) == [s3]
+            write_model(data_path / "s3" / "2006-03-01" / "service-2.json", "{ }")
+            assert watcher.wait(timeout=1.0) == [s3]
+            watcher.close()
+            assert watcher.is_polling
+
+    def test_inotify_limit(self) -> None:
+        inotify = Inotify.create()
+        if inotify is None:
+            return
+        inotify.close()
+
+        s3 = ServiceName("s3", "S3")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path = Path(temp_dir)
+            write_model(data_path / "s3" / "2006-03-01" / "service-2.json", "{}")
+            error = OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+            with patch.object(Inotify, "add_watch", side_effect=error):
+                watcher = ServiceModelWatcher([temp_dir], [s3], poll_interval=0.01)
+            assert watcher.is_polling
+
+            write_model(data_path / "s3" / "2006-03-01" / "service-2.json", "{ }")
+            assert watcher.wait(timeout=1.0) == [s3]
+            watcher.close()
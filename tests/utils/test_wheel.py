@@ -0,0 +1,82 @@
+import io
+import zipfile
+from unittest.mock import patch
+
+from mypy_boto3_builder.utils.wheel import (
+    build_wheel,
+    get_date_time,
+    get_metadata,
+    get_record_line,
+    get_setup_kwargs,
+    get_wheel_name,
+)
+
+SETUP_CONTENT = """
+from setuptools import setup
+
+setup(
+    name="mypy-boto3-test",
+    version="1.2.3",
+    packages=["mypy_boto3_test"],
+    install_requires=["boto3"],
+    extras_require={"all": ["botocore; python_version < '3.8'"]},
+    cmdclass=COMMANDS,
+)
+"""
+
+
+class TestWheel:
+    def test_get_setup_kwargs(self) -> None:
+        assert get_setup_kwargs(SETUP_CONTENT) == {
+            "name": "mypy-boto3-test",
+            "version": "1.2.3",
+            "packages": ["mypy_boto3_test"],
+            "install_requires": ["boto3"],
+            "extras_require": {"all": ["botocore; python_version < '3.8'"]},
+        }
+
+    def test_get_wheel_name(self) -> None:
+        assert (
+            get_wheel_name("mypy-boto3-test", "1.2.3") == "mypy_boto3_test-1.2.3-py3-none-any.whl"
+        )
+
+    def test_get_date_time(self) -> None:
+        with patch.dict("os.environ", {"SOURCE_DATE_EPOCH": ""}):
+            assert get_date_time() == (1980, 1, 1, 0, 0, 0)
+        with patch.dict("os.environ", {"SOURCE_DATE_EPOCH": "1600000000"}):
+            assert get_date_time() == (2020, 9, 13, 12, 26, 40)
+
+    def test_get_metadata(self) -> None:
+        result = get_metadata(get_setup_kwargs(SETUP_CONTENT), "# Readme")
+        assert "Name: mypy-boto3-test\nVersion: 1.2.3\n" in result
+        assert "Requires-Dist: boto3\n" in result
+        assert "Provides-Extra: all\n" in result
+        assert "Requires-Dist: botocore; (python_version < '3.8') and extra == \"all\"\n" in result
+        assert result.endswith("\n\n# Readme")
+
+    def test_get_record_line(self) -> None:
+        assert get_record_line("a.py", b"") == (
+            "a.py,sha256=47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU,0"
+        )
+
+    def test_build_wheel(self) -> None:
+        setup_kwargs = get_setup_kwargs(SETUP_CONTENT)
+        files = [("mypy_boto3_test/b.py", "b"), ("mypy_boto3_test/a.py", "a")]
+        result = build_wheel(setup_kwargs, "", files, "test")
+        assert build_wheel(setup_kwargs, "", files[::-1], "test") == result
+
+        with zipfile.ZipFile(io.BytesIO(result)) as archive:
+            assert archive.namelist() == [
+                "mypy_boto3_test/a.py",
+                "mypy_boto3_test/b.py",
+                "mypy_boto3_test-1.2.3.dist-info/METADATA",
+                "mypy_boto3_test-1.2.3.dist-info/WHEEL",
+                "mypy_boto3_test-1.2.3.dist-info/top_level.txt",
+                "mypy_boto3_test-1.2.3.dist-info/RECORD",
+            ]
+            record = archive.read("mypy_boto3_test-1.2.3.dist-info/RECORD").decode()
+            assert record.splitlines()[0] == get_record_line("mypy_boto3_test/a.py", b"a")
+            assert record.splitlines()[-1] == "mypy_boto3_test-1.2.3.dist-info/RECORD,,"
+            assert archive.read("mypy_boto3_test-1.2.3.dist-info/top_level.txt") == (
+                b"mypy_boto3_test\n"
+            )
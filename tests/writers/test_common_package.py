@@ -0,0 +1,44 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mypy_boto3_builder.writers.common_package import write_common_package
+
+
+class TestCommonPackage:
+    @patch("mypy_boto3_builder.writers.common_package.sort_imports")
+    @patch("mypy_boto3_builder.writers.common_package.blackify")
+    @patch("mypy_boto3_builder.writers.common_package.render_jinja2_template")
+    def test_write_common_package(
+        self,
+        render_jinja2_template_mock: MagicMock,
+        blackify_mock: MagicMock,
+        sort_imports_mock: MagicMock,
+    ) -> None:
+        package_mock = MagicMock()
+        package_mock.name = "package"
+
+        blackify_mock.return_value = "blackify"
+        sort_imports_mock.return_value = "sort_imports"
+        render_jinja2_template_mock.return_value = "render_jinja2_template_mock"
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            write_common_package(package_mock, output_path, True)
+            render_jinja2_template_mock.assert_called_with(
+                Path("common_package/common_package/type_defs.pyi.jinja2"),
+                package=package_mock,
+            )
+            assert len(blackify_mock.mock_calls) == 7
+            assert len(sort_imports_mock.mock_calls) == 7
+            blackify_mock.reset_mock()
+            sort_imports_mock.reset_mock()
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            (output_path / "package").mkdir(parents=True, exist_ok=True)
+            (output_path / "package" / "unknown.txt").touch()
+            write_common_package(package_mock, output_path, False)
+            assert not (output_path / "package" / "unknown.txt").exists()
+            assert len(blackify_mock.mock_calls) == 6
+            assert len(sort_imports_mock.mock_calls) == 6
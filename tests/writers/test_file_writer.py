@@ -0,0 +1,134 @@
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mypy_boto3_builder.writers.file_writer import (
+    FileWriter,
+    WheelFileWriter,
+    get_unknown_paths,
+)
+from mypy_boto3_builder.writers.manifest import Manifest
+from mypy_boto3_builder.writers.sinks import MemorySink, ZipSink
+from mypy_boto3_builder.writers.utils import FormatError
+
+
+class TestFileWriter:
+    def test_write(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir)
+            file_writer = FileWriter(max_workers=2)
+            for index in range(5):
+                file_writer.write(root_path / f"{index}.py", f"content {index}")
+            file_writer.write(root_path / "0.py", "content 0")
+            result = file_writer.wait()
+            assert sorted(i.name for i in result) == ["0.py", "1.py", "2.py", "3.py", "4.py"]
+            assert (root_path / "3.py").read_text() == "content 3"
+
+            with FileWriter() as file_writer:
+                file_writer.write(root_path / "1.py", "content 1")
+                file_writer.write(root_path / "5.py", "content 5")
+            assert (root_path / "5.py").read_text() == "content 5"
+
+            with pytest.raises(OSError):
+                with FileWriter() as file_writer:
+                    file_writer.write(root_path / "0.py" / "1.py", "content")
+
+    def test_get_unknown_paths(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir)
+            package_path = root_path / "package"
+            package_path.mkdir()
+            with FileWriter() as file_writer:
+                for name in ("a.py", "b.py"):
+                    file_writer.write(package_path / name, name)
+            (package_path / "untracked.py").touch()
+            valid_paths = [package_path / "a.py"]
+            assert sorted(i.name for i in get_unknown_paths(package_path, valid_paths)) == [
+                "b.py",
+                "untracked.py",
+            ]
+
+            Manifest.load(root_path)
+            try:
+                with FileWriter() as file_writer:
+                    for name in ("a.py", "b.py"):
+                        file_writer.write(package_path / name, name)
+                Manifest.find(root_path).save()
+            finally:
+                Manifest.unload(root_path)
+
+            Manifest.load(root_path)
+            try:
+                result = get_unknown_paths(package_path, valid_paths)
+                assert result == [package_path / "b.py"]
+                assert get_unknown_paths(root_path / "other", valid_paths) == []
+            finally:
+                Manifest.unload(root_path)
+
+    def test_format_error(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "package" / "module.py"
+            with pytest.raises(FormatError):
+                with FileWriter():
+                    raise FormatError("Cannot parse", file_path, "invalid")
+            assert file_path.read_text() == "invalid"
+
+            file_path.unlink()
+            with patch.object(FileWriter, "sink", MemorySink()) as sink:
+                with pytest.raises(FormatError):
+                    with FileWriter():
+                        raise FormatError("Cannot parse", file_path, "invalid")
+                assert sink.files == {}
+            assert not file_path.exists()
+
+    def test_create(self) -> None:
+        setup_path = Path("setup")
+        assert type(FileWriter.create()) is FileWriter
+        assert type(FileWriter.create(setup_path)) is FileWriter
+        with patch.object(FileWriter, "build_wheels", True):
+            assert type(FileWriter.create()) is FileWriter
+            assert type(FileWriter.create(setup_path)) is WheelFileWriter
+
+    def test_wheel_file_writer(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir)
+            setup_path = root_path / "test_package"
+            package_path = setup_path / "mypy_boto3_test"
+            old_wheel_path = root_path / "mypy_boto3_test-1.0.0-py3-none-any.whl"
+            old_wheel_path.touch()
+            other_wheel_path = root_path / "mypy_boto3_test2-1.0.0-py3-none-any.whl"
+            other_wheel_path.touch()
+            setup_content = (
+                'setup(name="mypy-boto3-test", version="1.2.3", packages=["mypy_boto3_test"])'
+            )
+            with WheelFileWriter(setup_path) as file_writer:
+                file_writer.write(setup_path / "setup.py", setup_content)
+                file_writer.write(setup_path / "README.md", "# Readme")
+                file_writer.write(package_path / "__init__.py", "")
+            wheel_path = root_path / "mypy_boto3_test-1.2.3-py3-none-any.whl"
+            assert not setup_path.exists()
+            assert not old_wheel_path.exists()
+            assert other_wheel_path.exists()
+            with zipfile.ZipFile(wheel_path) as archive:
+                assert archive.namelist()[0] == "mypy_boto3_test/__init__.py"
+
+            file_writer = WheelFileWriter(setup_path)
+            file_writer.write(setup_path / "setup.py", setup_content)
+            file_writer.write(setup_path / "README.md", "# Readme")
+            file_writer.write(package_path / "__init__.py", "")
+            assert file_writer.wait() == []
+
+    def test_write_ordered(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            archive_path = Path(temp_dir) / "output.zip"
+            with ZipSink(archive_path) as sink:
+                with patch.object(FileWriter, "sink", sink):
+                    with FileWriter() as file_writer:
+                        file_writer.write(archive_path / "b.py", "b")
+                        file_writer.write(archive_path / "a.py", "a")
+                    assert get_unknown_paths(archive_path, []) == []
+            with zipfile.ZipFile(archive_path) as archive:
+                assert archive.namelist() == ["a.py", "b.py"]
@@ -0,0 +1,45 @@
+import tempfile
+from pathlib import Path
+
+from mypy_boto3_builder.writers.manifest import Manifest
+
+
+class TestManifest:
+    def test_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir)
+            file_path = root_path / "package" / "module.py"
+            file_path.parent.mkdir()
+            file_path.write_text("content")
+            manifest = Manifest.load(root_path)
+            try:
+                assert Manifest.find(file_path) is manifest
+                assert Manifest.find(Path("/other/module.py")) is None
+                assert not manifest.is_current(file_path, "digest")
+
+                manifest.set(file_path, "digest")
+                assert manifest.is_current(file_path, "digest")
+                assert not manifest.is_current(file_path, "other")
+                file_path.write_text("changed content")
+                assert not manifest.is_current(file_path, "digest")
+
+                manifest.set(file_path, "digest")
+                manifest.save()
+                assert not manifest.changed
+                records = Manifest.load(root_path).records
+                assert records == {"package/module.py": manifest.records["package/module.py"]}
+
+                manifest.remove(root_path / "other.py")
+                assert not manifest.changed
+                manifest.remove(file_path)
+                assert manifest.changed
+                assert manifest.get_paths(root_path) == []
+                manifest.set(file_path, "digest")
+
+                file_path.unlink()
+                manifest.changed = True
+                manifest.save()
+                assert Manifest.load(root_path).records == {}
+            finally:
+                Manifest.unload(root_path)
+            assert Manifest.find(file_path) is None
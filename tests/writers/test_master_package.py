@@ -1,8 +1,32 @@
+import os
+import sys
 import tempfile
 from pathlib import Path
+from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.master_package import MasterPackage
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
 from mypy_boto3_builder.writers.master_package import write_master_package
+from mypy_boto3_builder.writers.utils import render_jinja2_template
+
+
+def exec_submodules(package_path: Path) -> Dict[str, Any]:
+    service_names = [ServiceName("sqs", "SQS"), ServiceName("s3", "S3")]
+    package = MasterPackage(
+        service_names=service_names,
+        service_summaries=[ServiceSummary(i, f"{i.class_name}Client") for i in service_names],
+    )
+    content = render_jinja2_template(Path("master/master/submodules.py.jinja2"), package=package)
+    module_path = package_path / "submodules.py"
+    namespace: Dict[str, Any] = {"__file__": module_path.as_posix(), "__name__": "submodules"}
+    exec(compile(content, module_path.as_posix(), "exec"), namespace)
+    return namespace
+
+
+def get_installed(namespace: Dict[str, Any]) -> List[str]:
+    return [i.module_name for i in namespace["SUBMODULES"] if i.is_installed]
 
 
 class TestMasterPackage:
@@ -46,3 +70,49 @@ class TestMasterPackage:
             )
             assert len(blackify_mock.mock_calls) == 11
             assert len(sort_imports_mock.mock_calls) == 11
+
+    def test_submodules_is_installed(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_path = Path(temp_dir) / "package"
+            package_path.mkdir()
+            cache_path = package_path / "installed_cache.txt"
+            site_packages_path = Path(temp_dir) / "site-packages"
+            (site_packages_path / "mypy_boto3_sqs").mkdir(parents=True)
+            (site_packages_path / "mypy_boto3_sqs-1.0.0.dist-info").mkdir()
+            search_paths = [site_packages_path.as_posix(), (Path(temp_dir) / "missing").as_posix()]
+
+            # cold cache: site-packages is listed and result is cached
+            with patch.object(sys, "path", search_paths):
+                assert get_installed(exec_submodules(package_path)) == ["mypy_boto3_sqs"]
+            assert cache_path.read_text().endswith("\nmypy_boto3_sqs")
+
+            # warm cache: site-packages is not listed
+            with patch.object(sys, "path", search_paths), patch("os.listdir") as listdir_mock:
+                assert get_installed(exec_submodules(package_path)) == ["mypy_boto3_sqs"]
+                listdir_mock.assert_not_called()
+
+            # stale cache: new package changes site-packages mtime
+            (site_packages_path / "mypy_boto3_s3").mkdir()
+            stat = site_packages_path.stat()
+            os.utime(site_packages_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            with patch.object(sys, "path", search_paths):
+                namespace = exec_submodules(package_path)
+                assert get_installed(namespace) == ["mypy_boto3_sqs", "mypy_boto3_s3"]
+            assert cache_path.read_text().endswith("\nmypy_boto3_s3,mypy_boto3_sqs")
+
+            # unreadable site-packages: nothing is installed and result is not cached
+            def listdir(path: str) -> List[str]:
+                raise PermissionError(path)
+
+            cache_path.unlink()
+            with patch.object(sys, "path", search_paths), patch("os.listdir", listdir):
+                assert get_installed(exec_submodules(package_path)) == []
+            assert not cache_path.exists()
+
+            # broken cache file is ignored
+            cache_path.write_text("broken")
+            with patch.object(sys, "path", search_paths):
+                assert get_installed(exec_submodules(package_path)) == [
+                    "mypy_boto3_sqs",
+                    "mypy_boto3_s3",
+                ]
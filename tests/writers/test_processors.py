@@ -1,14 +1,29 @@
+import gc
+import sys
+import tempfile
+import tracemalloc
 from pathlib import Path
+from typing import Any, Dict
 from unittest.mock import MagicMock, patch
 
+from mypy_boto3_builder.main import set_template_globals
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.utils.synthetic_models import SyntheticConfig, get_session, write_models
+from mypy_boto3_builder.writers.file_writer import FileWriter
 from mypy_boto3_builder.writers.processors import (
     process_boto3_stubs,
     process_boto3_stubs_docs,
     process_botocore_stubs,
+    process_common,
     process_master,
     process_service,
     process_service_docs,
 )
+from mypy_boto3_builder.writers.sinks import DirectorySink, MemorySink, Sink
+
+
+def get_content(content: str, *_args: Any, **_kwargs: Any) -> str:
+    return content
 
 
 class TestProcessors:
@@ -29,7 +44,11 @@ class TestProcessors:
             generate_setup=True,
         )
         parse_boto3_stubs_package_mock.assert_called_with(
-            session=session_mock, service_names=[service_name_mock]
+            session=session_mock,
+            service_names=[service_name_mock],
+            essential_overloads_first=False,
+            service_summaries=None,
+            compact_overloads=False,
         )
         assert result == parse_boto3_stubs_package_mock()
 
@@ -49,7 +68,7 @@ class TestProcessors:
             output_path=Path("my_path"),
             generate_setup=True,
         )
-        parse_master_package_mock.assert_called_with(session_mock, [service_name_mock])
+        parse_master_package_mock.assert_called_with(session_mock, [service_name_mock], None)
         assert result == parse_master_package_mock()
 
     @patch("mypy_boto3_builder.writers.processors.parse_service_package")
@@ -64,12 +83,152 @@ class TestProcessors:
         parse_service_package_mock().typed_dicts = [MagicMock()]
         result = process_service(session_mock, service_name_mock, Path("my_path"), True)
         write_service_package_mock.assert_called_with(
+            parse_service_package_mock.return_value,
+            output_path=Path("my_path"),
+            generate_setup=True,
+            light_runtime_types=False,
+        )
+        parse_service_package_mock.assert_called_with(session_mock, service_name_mock, None)
+        assert result.service_name == parse_service_package_mock.return_value.service_name
+        assert result.client_name == parse_service_package_mock.return_value.client.name
+
+    # formatters are replaced with a plain function, mocks keep all call arguments
+    @patch("mypy_boto3_builder.writers.service_package.format_md", get_content)
+    @patch("mypy_boto3_builder.writers.service_package.sort_imports", get_content)
+    @patch("mypy_boto3_builder.writers.service_package.blackify", get_content)
+    def test_process_service_memory(self) -> None:
+        set_template_globals("1.0.0", "0.0.0")
+        warmup_service_names = [ServiceName(f"warmup{i}", f"Warmup{i}") for i in range(10)]
+        service_names = [ServiceName(f"flat{i}", f"Flat{i}") for i in range(50)]
+        with tempfile.TemporaryDirectory() as data_dir:
+            data_path = Path(data_dir)
+            for service_name in warmup_service_names + service_names:
+                config = SyntheticConfig(
+                    service_name=service_name.name,
+                    operations=1,
+                    shape_depth=1,
+                    fields=1,
+                    enum_count=1,
+                    enum_size=2,
+                    resources=0,
+                )
+                write_models(data_path, config)
+            session = get_session(data_path)
+            FileWriter.sink = Sink()
+            try:
+                # fill template, import and loader caches before measuring
+                for service_name in warmup_service_names:
+                    process_service(session, service_name, Path("output"), True)
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    start_size = tracemalloc.get_traced_memory()[0]
+                    for service_name in service_names:
+                        process_service(session, service_name, Path("output"), True)
+                    gc.collect()
+                    end_size = tracemalloc.get_traced_memory()[0]
+                finally:
+                    tracemalloc.stop()
+            finally:
+                FileWriter.sink = DirectorySink()
+
+        # botocore loader keeps a few KiB per loaded service and interned strings table
+        # can resize once by about 2 MiB, leaked parsed packages take about 14 MiB here
+        assert end_size - start_size < 4 * 1024 * 1024
+
+    @patch("mypy_boto3_builder.writers.service_package.format_md", get_content)
+    @patch("mypy_boto3_builder.writers.service_package.sort_imports", get_content)
+    @patch("mypy_boto3_builder.writers.service_package.blackify", get_content)
+    def test_process_service_light_runtime_types(self) -> None:
+        set_template_globals("1.0.0", "0.0.0")
+        service_name = ServiceName("light", "Light")
+        with tempfile.TemporaryDirectory() as data_dir:
+            data_path = Path(data_dir)
+            config = SyntheticConfig(
+                service_name=service_name.name,
+                operations=2,
+                shape_depth=2,
+                fields=2,
+                enum_count=2,
+                enum_size=2,
+                resources=0,
+            )
+            write_models(data_path, config)
+            session = get_session(data_path)
+            sink = MemorySink()
+            with patch.object(FileWriter, "sink", sink):
+                process_service(
+                    session, service_name, Path("output"), False, light_runtime_types=True
+                )
+
+        module_path = Path("output") / service_name.module_name
+        for module_name in ("type_defs", "literals"):
+            content = sink.files[module_path / f"{module_name}.py"]
+            lazy_namespace: Dict[str, Any] = {
+                "__name__": f"{service_name.module_name}.{module_name}"
+            }
+            exec(content, lazy_namespace)
+            eager_namespace: Dict[str, Any] = {
+                "__name__": f"{service_name.module_name}.{module_name}"
+            }
+            # Python 3.6 has no module __getattr__, so all names are built on import
+            with patch.object(sys, "version_info", (3, 6, 0)):
+                exec(content, eager_namespace)
+
+            names = eager_namespace["__all__"]
+            assert names
+            assert not set(names) & set(lazy_namespace)
+            assert set(names) <= set(eager_namespace)
+            for name in names:
+                assert repr(eager_namespace[name]) == repr(lazy_namespace["__getattr__"](name))
+
+    @patch("mypy_boto3_builder.writers.processors.parse_service_package")
+    @patch("mypy_boto3_builder.writers.processors.write_service_package")
+    def test_process_service_common_package(
+        self,
+        write_service_package_mock: MagicMock,
+        parse_service_package_mock: MagicMock,
+    ) -> None:
+        common_package_mock = MagicMock()
+        process_service(
+            MagicMock(), MagicMock(), Path("my_path"), True, common_package=common_package_mock
+        )
+        service_package = parse_service_package_mock()
+        service_package.extract_shared_types.assert_called_with(common_package_mock)
+        service_package.split_type_defs.assert_not_called()
+
+    @patch("mypy_boto3_builder.writers.processors.parse_service_package")
+    @patch("mypy_boto3_builder.writers.processors.write_service_package")
+    def test_process_service_split_type_defs(
+        self,
+        write_service_package_mock: MagicMock,
+        parse_service_package_mock: MagicMock,
+    ) -> None:
+        process_service(MagicMock(), MagicMock(), Path("my_path"), True, split_type_defs=True)
+        parse_service_package_mock().split_type_defs.assert_called_with()
+
+    @patch("mypy_boto3_builder.writers.processors.parse_service_package")
+    @patch("mypy_boto3_builder.writers.processors.parse_common_package")
+    @patch("mypy_boto3_builder.writers.processors.write_common_package")
+    def test_process_common(
+        self,
+        write_common_package_mock: MagicMock,
+        parse_common_package_mock: MagicMock,
+        parse_service_package_mock: MagicMock,
+    ) -> None:
+        session_mock = MagicMock()
+        service_name_mock = MagicMock()
+        parse_common_package_mock.side_effect = lambda packages: (
+            list(packages) and parse_common_package_mock.return_value
+        )
+        result = process_common(session_mock, Path("my_path"), [service_name_mock], True)
+        write_common_package_mock.assert_called_with(
             result,
             output_path=Path("my_path"),
             generate_setup=True,
         )
         parse_service_package_mock.assert_called_with(session_mock, service_name_mock)
-        assert result == parse_service_package_mock()
+        assert result == parse_common_package_mock.return_value
 
     @patch("mypy_boto3_builder.writers.processors.parse_service_package")
     @patch("mypy_boto3_builder.writers.processors.write_service_docs")
@@ -82,11 +241,11 @@ class TestProcessors:
         service_name_mock = MagicMock()
         result = process_service_docs(session_mock, service_name_mock, Path("my_path"))
         write_service_docs_mock.assert_called_with(
-            result,
+            parse_service_package_mock.return_value,
             output_path=Path("my_path"),
         )
         parse_service_package_mock.assert_called_with(session_mock, service_name_mock)
-        assert result == parse_service_package_mock()
+        assert result.service_name == parse_service_package_mock.return_value.service_name
 
     @patch("mypy_boto3_builder.writers.processors.parse_boto3_stubs_package")
     @patch("mypy_boto3_builder.writers.processors.write_boto3_stubs_docs")
@@ -2,7 +2,10 @@ import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from mypy_boto3_builder.writers.file_writer import FileWriter
+from mypy_boto3_builder.writers.manifest import Manifest
 from mypy_boto3_builder.writers.service_package import write_service_docs, write_service_package
+from mypy_boto3_builder.writers.sinks import MemorySink
 
 
 class TestServicePackage:
@@ -18,6 +21,7 @@ class TestServicePackage:
         package_mock = MagicMock()
         package_mock.name = "package"
         package_mock.service_name.module_name = "module"
+        package_mock.type_defs_parts = []
 
         blackify_mock.return_value = "blackify"
         sort_imports_mock.return_value = "sort_imports"
@@ -49,6 +53,113 @@ class TestServicePackage:
             assert len(blackify_mock.mock_calls) == 16
             assert len(sort_imports_mock.mock_calls) == 16
 
+    @patch("mypy_boto3_builder.writers.service_package.sort_imports")
+    @patch("mypy_boto3_builder.writers.service_package.blackify")
+    @patch("mypy_boto3_builder.writers.service_package.render_jinja2_template")
+    def test_write_service_package_split_type_defs(
+        self,
+        render_jinja2_template_mock: MagicMock,
+        blackify_mock: MagicMock,
+        sort_imports_mock: MagicMock,
+    ) -> None:
+        package_mock = MagicMock()
+        package_mock.name = "package"
+        package_mock.service_name.module_name = "module"
+        part_mock = MagicMock()
+        part_mock.name = "_part_01"
+        package_mock.type_defs_parts = [part_mock]
+
+        blackify_mock.return_value = "blackify"
+        sort_imports_mock.return_value = "sort_imports"
+        render_jinja2_template_mock.return_value = "render_jinja2_template_mock"
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            (output_path / "package").mkdir(parents=True, exist_ok=True)
+            (output_path / "package" / "type_defs.pyi").touch()
+            write_service_package(package_mock, output_path, False)
+            render_jinja2_template_mock.assert_called_with(
+                Path("service/service/type_defs/part.pyi.jinja2"),
+                package=package_mock,
+                service_name=package_mock.service_name,
+                part=part_mock,
+            )
+            assert len(blackify_mock.mock_calls) == 18
+            assert not (output_path / "package" / "type_defs.pyi").exists()
+            assert (output_path / "package" / "type_defs" / "__init__.pyi").exists()
+            assert (output_path / "package" / "type_defs" / "_part_01.py").exists()
+
+            package_mock.type_defs_parts = []
+            write_service_package(package_mock, output_path, False)
+            assert not (output_path / "package" / "type_defs").exists()
+            assert (output_path / "package" / "type_defs.pyi").exists()
+
+    @patch("mypy_boto3_builder.writers.service_package.sort_imports")
+    @patch("mypy_boto3_builder.writers.service_package.blackify")
+    @patch("mypy_boto3_builder.writers.service_package.render_jinja2_template")
+    def test_write_service_package_remove_type_defs(
+        self,
+        render_jinja2_template_mock: MagicMock,
+        blackify_mock: MagicMock,
+        sort_imports_mock: MagicMock,
+    ) -> None:
+        package_mock = MagicMock()
+        package_mock.name = "package"
+        package_mock.service_name.module_name = "module"
+        part_mock = MagicMock()
+        part_mock.name = "_part_01"
+        package_mock.type_defs_parts = [part_mock]
+        blackify_mock.return_value = "blackify"
+        sort_imports_mock.return_value = "sort_imports"
+        render_jinja2_template_mock.return_value = "render_jinja2_template_mock"
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            type_defs_path = output_path / "package" / "type_defs"
+            manifest = Manifest.load(output_path)
+            try:
+                write_service_package(package_mock, output_path, False)
+                assert manifest.get_paths(type_defs_path)
+
+                package_mock.type_defs_parts = []
+                with patch.object(FileWriter, "sink", MemorySink()) as sink:
+                    write_service_package(package_mock, output_path, False)
+                    assert output_path / "package" / "type_defs.pyi" in sink.files
+                assert (type_defs_path / "__init__.pyi").exists()
+
+                write_service_package(package_mock, output_path, False)
+                assert not type_defs_path.exists()
+                assert manifest.get_paths(type_defs_path) == []
+            finally:
+                Manifest.unload(output_path)
+
+    @patch("mypy_boto3_builder.writers.service_package.sort_imports")
+    @patch("mypy_boto3_builder.writers.service_package.blackify")
+    @patch("mypy_boto3_builder.writers.service_package.render_jinja2_template")
+    def test_write_service_package_light_runtime_types(
+        self,
+        render_jinja2_template_mock: MagicMock,
+        blackify_mock: MagicMock,
+        sort_imports_mock: MagicMock,
+    ) -> None:
+        package_mock = MagicMock()
+        package_mock.name = "package"
+        package_mock.service_name.module_name = "module"
+        package_mock.type_defs_parts = []
+        blackify_mock.return_value = "blackify"
+        sort_imports_mock.return_value = "sort_imports"
+        render_jinja2_template_mock.return_value = "render_jinja2_template_mock"
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            write_service_package(package_mock, output_path, False, light_runtime_types=True)
+            template_paths = [i.args[0] for i in render_jinja2_template_mock.call_args_list]
+            assert Path("service/service/type_defs.py.jinja2") in template_paths
+            assert Path("service/service/type_defs.pyi.jinja2") in template_paths
+            assert Path("service/service/literals.py.jinja2") in template_paths
+            assert Path("service/service/literals.pyi.jinja2") in template_paths
+            assert len(blackify_mock.mock_calls) == 16
+
     def test_write_service_docs(self) -> None:
         package_mock = MagicMock()
         package_mock.name = "package"
@@ -57,5 +168,17 @@ class TestServicePackage:
         with tempfile.TemporaryDirectory() as output_dir:
             output_path = Path(output_dir)
             (output_path / "module").mkdir(parents=True, exist_ok=True)
-            (output_path / "module" / "unknown.txt").touch()
+            unknown_path = output_path / "module" / "unknown.txt"
+            unknown_path.touch()
             write_service_docs(package_mock, output_path)
+            assert not unknown_path.exists()
+
+            manifest = Manifest.load(output_path)
+            try:
+                unknown_path.touch()
+                manifest.set(unknown_path, "digest")
+                write_service_docs(package_mock, output_path)
+                assert not unknown_path.exists()
+                assert unknown_path not in manifest.get_paths(output_path)
+            finally:
+                Manifest.unload(output_path)
@@ -0,0 +1,66 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_summary import ServiceSummary
+from mypy_boto3_builder.writers.shard_manifest import ShardManifest, ShardMergeError
+
+
+def get_manifest(index: int, names: list) -> ShardManifest:
+    return ShardManifest(
+        index=index,
+        count=2,
+        build_version="1.2.3",
+        service_names=["s3", "ec2", "sqs"],
+        service_summaries=[ServiceSummary(ServiceName(i, i.upper()), f"{i}Client") for i in names],
+    )
+
+
+class TestShardManifest:
+    def test_get_path(self) -> None:
+        assert ShardManifest.get_path(Path("/output"), 1, 2) == Path(
+            "/output/.mypy_boto3_builder_shard_1_of_2.json"
+        )
+        assert ShardManifest.get_path(Path("/output/stubs.zip"), 2, 2) == Path(
+            "/output/.mypy_boto3_builder_shard_2_of_2.json"
+        )
+
+    def test_save_load(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir)
+            manifest = get_manifest(1, ["s3", "sqs"])
+            path = ShardManifest.get_path(root_path / "shard", 1, 2)
+            manifest.save(path)
+            (root_path / "other.json").write_text("{}")
+            assert ShardManifest.find_paths([root_path / "shard", path]) == [path]
+
+            loaded = ShardManifest.load(path)
+            assert loaded.to_dict() == manifest.to_dict()
+            assert loaded.service_summaries[0].service_name.class_name == "S3"
+
+            with pytest.raises(ShardMergeError, match="Cannot read"):
+                ShardManifest.load(root_path / "missing.json")
+            with pytest.raises(ShardMergeError, match="Unsupported"):
+                ShardManifest.load(root_path / "other.json")
+
+    def test_merge(self) -> None:
+        first = get_manifest(1, ["s3", "sqs"])
+        second = get_manifest(2, ["ec2"])
+        build_version, summaries = ShardManifest.merge([second, first])
+        assert build_version == "1.2.3"
+        assert [i.service_name.name for i in summaries] == ["s3", "ec2", "sqs"]
+
+        with pytest.raises(ShardMergeError, match="No shard"):
+            ShardManifest.merge([])
+        with pytest.raises(ShardMergeError, match="Missing shards: 2/2"):
+            ShardManifest.merge([first])
+        with pytest.raises(ShardMergeError, match="Duplicate"):
+            ShardManifest.merge([first, second, get_manifest(2, ["ec2"])])
+        with pytest.raises(ShardMergeError, match="Services are missing"):
+            ShardManifest.merge([first, get_manifest(2, [])])
+        other = get_manifest(2, ["ec2"])
+        other.build_version = "1.2.4"
+        with pytest.raises(ShardMergeError, match="different build"):
+            ShardManifest.merge([first, other])
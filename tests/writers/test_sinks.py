@@ -0,0 +1,127 @@
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import IO
+from unittest.mock import patch
+
+import pytest
+
+from mypy_boto3_builder.writers.manifest import Manifest
+from mypy_boto3_builder.writers.sinks import (
+    ArchiveSink,
+    DirectorySink,
+    MemorySink,
+    Sink,
+    TarZstSink,
+    ZipSink,
+    get_output_sink,
+)
+
+
+class TestSinks:
+    def test_sink(self) -> None:
+        with Sink() as sink:
+            assert not sink.write(Path("test.py"), "content")
+            assert sink.get_unknown_paths(Path("."), []) == []
+            assert sink.find_paths(Path("."), "*.py") == []
+            assert not sink.delete(Path("test.py"))
+
+    def test_directory_sink(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir) / "output"
+            with DirectorySink(root_path) as sink:
+                assert root_path.exists()
+                assert sink.write(root_path / "package" / "module.py", "content")
+                assert not sink.write(root_path / "package" / "module.py", "content")
+                (root_path / "package" / "other.py").touch()
+                assert sink.get_unknown_paths(root_path, [root_path / "package" / "module.py"]) == [
+                    root_path / "package" / "other.py"
+                ]
+            assert (root_path / "package" / "module.py").read_text() == "content"
+
+    def test_directory_sink_delete(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir)
+            package_path = root_path / "package"
+            manifest = Manifest.load(root_path)
+            try:
+                sink = DirectorySink()
+                assert sink.write(package_path / "a.whl", "a")
+                assert sink.write(package_path / "b.whl", "b")
+                assert sink.write(package_path / "nested" / "c.whl", "c")
+                assert sink.find_paths(package_path, "*.whl") == [
+                    package_path / "a.whl",
+                    package_path / "b.whl",
+                ]
+
+                assert sink.delete(package_path / "a.whl")
+                assert not sink.delete(package_path / "a.whl")
+                assert manifest.get_paths(package_path) == [
+                    package_path / "b.whl",
+                    package_path / "nested" / "c.whl",
+                ]
+                assert not sink.delete(package_path / "nested")
+                assert sink.delete(package_path / "nested" / "c.whl")
+                assert sink.delete(package_path / "nested")
+                assert not (package_path / "nested").exists()
+            finally:
+                Manifest.unload(root_path)
+
+    def test_memory_sink(self) -> None:
+        with MemorySink() as sink:
+            assert sink.write(Path("module.py"), "content")
+            assert not sink.write(Path("module.py"), "content")
+            assert sink.write(Path("module.py"), b"binary")
+        assert sink.files == {Path("module.py"): b"binary"}
+        assert sink.find_paths(Path("."), "*.py") == [Path("module.py")]
+        assert sink.find_paths(Path("package"), "*.py") == []
+        assert sink.delete(Path("module.py"))
+        assert not sink.delete(Path("module.py"))
+        assert sink.files == {}
+
+    def test_zip_sink(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            archive_path = Path(temp_dir) / "output.zip"
+            with ZipSink(archive_path) as sink:
+                assert sink.write(archive_path / "package" / "a.py", "a")
+                assert sink.write(archive_path / "package" / "b.whl", b"b")
+                with pytest.raises(ValueError):
+                    sink.write(archive_path / "package" / "a.py", "a")
+                assert not archive_path.exists()
+
+            with zipfile.ZipFile(archive_path) as archive:
+                assert archive.namelist() == ["package/a.py", "package/b.whl"]
+                assert archive.read("package/a.py") == b"a"
+                assert archive.getinfo("package/a.py").date_time == (1980, 1, 1, 0, 0, 0)
+
+            content = archive_path.read_bytes()
+            with ZipSink(archive_path) as sink:
+                sink.write(archive_path / "package" / "a.py", "a")
+                sink.write(archive_path / "package" / "b.whl", b"b")
+            assert archive_path.read_bytes() == content
+
+            with pytest.raises(KeyError):
+                with ZipSink(archive_path) as sink:
+                    sink.write(archive_path / "package" / "c.py", "c")
+                    raise KeyError("error")
+            assert archive_path.read_bytes() == content
+            assert [i.name for i in Path(temp_dir).iterdir()] == ["output.zip"]
+
+    def test_archive_sink(self) -> None:
+        class IncompleteSink(ArchiveSink):
+            def _open_archive(self, stream: IO[bytes]) -> None:
+                pass
+
+        with pytest.raises(TypeError):
+            IncompleteSink(Path("output.zip"))  # type: ignore
+
+    def test_tar_zst_sink(self) -> None:
+        with patch("mypy_boto3_builder.writers.sinks.zstandard", None):
+            with pytest.raises(ValueError):
+                with TarZstSink(Path("output.tar.zst")):
+                    pass
+
+    def test_get_output_sink(self) -> None:
+        assert isinstance(get_output_sink(Path("output.zip")), ZipSink)
+        assert isinstance(get_output_sink(Path("output.tar.zst")), TarZstSink)
+        assert isinstance(get_output_sink(Path("output")), DirectorySink)
@@ -1,13 +1,20 @@
+import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from black import NothingChanged
 
+from mypy_boto3_builder.writers.manifest import Manifest
 from mypy_boto3_builder.writers.utils import (
+    FormatError,
+    FormatterCache,
     blackify,
     insert_md_toc,
+    iterate_encoded_chunks,
     render_jinja2_template,
     sort_imports,
+    write_file,
 )
 
 
@@ -30,8 +37,11 @@ class TestUtils:
         black_mock.FileMode.assert_called_with(is_pyi=True, line_length=100)
 
         black_mock.format_file_contents.side_effect = IndentationError()
-        with pytest.raises(ValueError):
+        with pytest.raises(FormatError) as e:
             blackify("my content", file_path_mock)
+        assert e.value.file_path == file_path_mock
+        assert e.value.content == "my content"
+        file_path_mock.write_text.assert_not_called()
 
         black_mock.format_file_contents.side_effect = NothingChanged()
         assert blackify("my content", file_path_mock) == "my content"
@@ -43,6 +53,25 @@ class TestUtils:
         sort_code_string_mock.assert_called()
         assert sort_imports("test", "boto3") == "output"
 
+    def test_formatter_cache(self) -> None:
+        formatter_mock = MagicMock(side_effect=lambda x: x.upper())
+        assert FormatterCache.format(formatter_mock, "upper", "a") == "A"
+        assert FormatterCache.format(formatter_mock, "upper", "a") == "A"
+        assert formatter_mock.call_count == 2
+
+        FormatterCache.enable(max_size=2)
+        try:
+            formatter_mock.reset_mock()
+            assert FormatterCache.format(formatter_mock, "upper", "a") == "A"
+            assert FormatterCache.format(formatter_mock, "upper", "a") == "A"
+            assert FormatterCache.format(formatter_mock, "other", "a") == "A"
+            assert formatter_mock.call_count == 2
+            FormatterCache.format(formatter_mock, "upper", "b")
+            assert FormatterCache.format(formatter_mock, "upper", "a") == "A"
+            assert formatter_mock.call_count == 4
+        finally:
+            FormatterCache.disable()
+
     @patch("mypy_boto3_builder.writers.utils.TEMPLATES_PATH")
     @patch("mypy_boto3_builder.writers.utils.JinjaManager")
     def test_render_jinja2_template(
@@ -71,3 +100,46 @@ class TestUtils:
             == "# a\ntest\n- [a](#a)\n  - [b](#b)\n  - [c](#c)\n\n## b\n## c\ntest2"
         )
         assert insert_md_toc("# a\n") == "# a\n- [a](#a)\n"
+
+    def test_iterate_encoded_chunks(self) -> None:
+        assert list(iterate_encoded_chunks("abcde", 2)) == [b"ab", b"cd", b"e"]
+        assert list(iterate_encoded_chunks("")) == []
+
+    def test_write_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir)
+            file_path = root_path / "module.py"
+            assert write_file(file_path, "content")
+            assert file_path.read_text() == "content"
+            assert not write_file(file_path, "content")
+            assert write_file(file_path, "new content")
+            assert file_path.read_text() == "new content"
+            assert [i.name for i in root_path.iterdir()] == ["module.py"]
+
+            manifest = Manifest.load(root_path)
+            try:
+                assert not write_file(file_path, "new content")
+                assert manifest.is_current(file_path, manifest.records["module.py"][0])
+                with patch("mypy_boto3_builder.writers.utils.get_file_digest") as digest_mock:
+                    assert not write_file(file_path, "new content")
+                    digest_mock.assert_not_called()
+                assert write_file(file_path, "content")
+                manifest.save()
+            finally:
+                Manifest.unload(root_path)
+            assert Manifest.load(root_path).records == manifest.records
+            Manifest.unload(root_path)
+
+            with patch("mypy_boto3_builder.writers.utils.os.replace") as replace_mock:
+                replace_mock.side_effect = OSError()
+                with pytest.raises(OSError):
+                    write_file(file_path, "failed content")
+            with patch("mypy_boto3_builder.writers.utils.iterate_encoded_chunks") as chunks_mock:
+                chunks_mock.side_effect = [[b"digest"], KeyboardInterrupt()]
+                with pytest.raises(KeyboardInterrupt):
+                    write_file(file_path, "interrupted content")
+            assert file_path.read_text() == "content"
+            assert sorted(i.name for i in root_path.iterdir()) == [
+                ".mypy_boto3_builder_manifest.json",
+                "module.py",
+            ]